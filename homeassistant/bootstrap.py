@@ -4,8 +4,11 @@ import logging
 import logging.handlers
 import os
 import sys
+import threading
 from collections import OrderedDict
 
+import async_timeout
+
 from types import ModuleType
 from typing import Any, Optional, Dict
 
@@ -31,18 +34,65 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_COMPONENT = 'component'
 
+DATA_SETUP_TIMELINE = 'setup_timeline'
+
+# Components that are set up one by one before all others
+FIRST_COMPONENTS = ('logger', 'recorder', 'introduction')
+
 ERROR_LOG_FILENAME = 'home-assistant.log'
 _PERSISTENT_ERRORS = {}
 HA_COMPONENT_URL = '[{}](https://home-assistant.io/components/{}/)'
 
+# Components whose setup method is running in the current executor thread
+_SYNC_SETUPS = threading.local()
+
 
 def setup_component(hass: core.HomeAssistant, domain: str,
                     config: Optional[Dict]=None) -> bool:
     """Setup a component and all its dependencies."""
+    outer = getattr(_SYNC_SETUPS, 'domains', ())
+
+    if outer:
+        return run_coroutine_threadsafe(
+            _async_setup_nested(hass, domain, config, outer),
+            loop=hass.loop).result()
+
     return run_coroutine_threadsafe(
         async_setup_component(hass, domain, config), loop=hass.loop).result()
 
 
+@asyncio.coroutine
+def _async_setup_nested(hass: core.HomeAssistant, domain: str,
+                        config: Optional[Dict], outer) -> bool:
+    """Setup a component from within the setup of the outer components.
+
+    The outer components wait for this setup, so it must not wait for them.
+
+    This method is a coroutine.
+    """
+    setup_outer = hass.data.setdefault('setup_outer', {})
+    task = asyncio.Task.current_task(loop=hass.loop)
+    setup_outer[task] = outer
+
+    try:
+        return (yield from async_setup_component(hass, domain, config))
+    finally:
+        setup_outer.pop(task)
+
+
+def _sync_setup(component, hass: core.HomeAssistant, config, outer) -> bool:
+    """Run the setup method of a component, remembering the outer setups.
+
+    This method needs to run in an executor.
+    """
+    _SYNC_SETUPS.domains = outer
+
+    try:
+        return component.setup(hass, config)
+    finally:
+        _SYNC_SETUPS.domains = ()
+
+
 @asyncio.coroutine
 def async_setup_component(hass: core.HomeAssistant, domain: str,
                           config: Optional[Dict]=None) -> bool:
@@ -96,6 +146,45 @@ def _handle_requirements(hass: core.HomeAssistant, component,
     return True
 
 
+def _install_requirements_batch(hass: core.HomeAssistant, domains,
+                                config) -> None:
+    """Install the missing requirements of many components at once.
+
+    Covers the given components and their configured platforms. Failures
+    are handled later by the setup of the individual components.
+
+    This method needs to run in an executor.
+    """
+    requirements = []
+
+    for comp_name in list(domains) + _configured_platforms(domains, config):
+        component = loader.get_component(comp_name)
+        requirements.extend(getattr(component, 'REQUIREMENTS', []))
+
+    if requirements:
+        pkg_util.install_packages(
+            list(OrderedDict.fromkeys(requirements)),
+            target=hass.config.path('deps'))
+
+
+def _configured_platforms(domains, config):
+    """Return the platforms that are configured for the given components.
+
+    Async friendly if the components have been loaded.
+    """
+    platforms = []
+
+    for domain in domains:
+        if not hasattr(loader.get_component(domain), 'PLATFORM_SCHEMA'):
+            continue
+
+        for p_name, _ in config_per_platform(config, domain):
+            if isinstance(p_name, str):
+                platforms.append(PLATFORM_FORMAT.format(domain, p_name))
+
+    return platforms
+
+
 @asyncio.coroutine
 def _async_setup_component(hass: core.HomeAssistant,
                            domain: str, config) -> bool:
@@ -113,14 +202,33 @@ def _async_setup_component(hass: core.HomeAssistant,
 
     setup_progress = hass.data.get('setup_progress')
     if setup_progress is None:
-        setup_progress = hass.data['setup_progress'] = []
+        setup_progress = hass.data['setup_progress'] = {}
+
+    current_task = asyncio.Task.current_task(loop=hass.loop)
+    outer = hass.data.get('setup_outer', {}).get(current_task, ())
 
     if domain in setup_progress:
+        setup_future = setup_progress[domain][1]
+
+        if not _async_setup_waits_for(hass, current_task, domain, outer):
+            # Component is being set up in parallel, wait for the result
+            setup_waiting = hass.data.setdefault('setup_waiting', {})
+            setup_waiting[current_task] = domain
+
+            try:
+                return (yield from asyncio.shield(setup_future,
+                                                  loop=hass.loop))
+            finally:
+                setup_waiting.pop(current_task)
+
         _LOGGER.error('Attempt made to setup %s during setup of %s',
                       domain, domain)
         _async_persistent_notification(hass, domain, True)
         return False
 
+    setup_future = asyncio.Future(loop=hass.loop)
+    setup_progress[domain] = (current_task, setup_future)
+
     try:
         # Used to indicate to discovery that a setup is ongoing and allow it
         # to wait till it is done.
@@ -129,7 +237,6 @@ def _async_setup_component(hass: core.HomeAssistant,
             yield from setup_lock.acquire()
             did_lock = True
 
-        setup_progress.append(domain)
         config = yield from async_prepare_setup_component(hass, config, domain)
 
         if config is None:
@@ -148,7 +255,8 @@ def _async_setup_component(hass: core.HomeAssistant,
                 result = yield from component.async_setup(hass, config)
             else:
                 result = yield from hass.loop.run_in_executor(
-                    None, component.setup, hass, config)
+                    None, _sync_setup, component, hass, config,
+                    outer + (domain,))
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception('Error during setup of component %s', domain)
             _async_persistent_notification(hass, domain, True)
@@ -171,13 +279,154 @@ def _async_setup_component(hass: core.HomeAssistant,
             EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: component.DOMAIN}
         )
 
+        setup_future.set_result(True)
         return True
     finally:
-        setup_progress.remove(domain)
+        setup_progress.pop(domain)
+        if not setup_future.done():
+            setup_future.set_result(False)
         if did_lock:
             setup_lock.release()
 
 
+@core.callback
+def _async_setup_waits_for(hass: core.HomeAssistant, task, domain: str,
+                           outer) -> bool:
+    """Return if the setup of domain is waiting for task.
+
+    Follows the setups that the setup of domain is waiting for, so that two
+    components setting up each other do not wait for each other.
+
+    This method must be run in the event loop.
+    """
+    setup_progress = hass.data['setup_progress']
+    setup_waiting = hass.data.get('setup_waiting', {})
+    seen = set()
+
+    while domain in setup_progress and domain not in seen:
+        setup_task = setup_progress[domain][0]
+
+        if setup_task is task or domain in outer:
+            return True
+
+        seen.add(domain)
+        domain = setup_waiting.get(setup_task)
+
+    return False
+
+
+@asyncio.coroutine
+def _async_setup_components(hass: core.HomeAssistant, components,
+                            config) -> None:
+    """Setup components in parallel while respecting their dependencies.
+
+    FIRST_COMPONENTS are set up first, one by one. Components that depend
+    on the group component are set up after all other components.
+
+    This method is a coroutine.
+    """
+    # Resolving the load order imports the components
+    load_order = yield from hass.loop.run_in_executor(
+        None, loader.load_order_components, components)
+    semaphore = asyncio.Semaphore(hass.config.setup_concurrency,
+                                  loop=hass.loop)
+    timeline = hass.data[DATA_SETUP_TIMELINE] = OrderedDict()
+    start = hass.loop.time()
+
+    if not hass.config.skip_pip:
+        yield from hass.loop.run_in_executor(
+            None, _install_requirements_batch, hass, load_order, config)
+
+    yield from loader.async_preload_components(
+        hass, _configured_platforms(load_order, config))
+
+    @asyncio.coroutine
+    def setup_domain(domain, dependencies):
+        """Setup a component after its dependencies are done."""
+        if dependencies:
+            yield from asyncio.wait(dependencies, loop=hass.loop)
+
+        with (yield from semaphore):
+            setup_start = hass.loop.time()
+            try:
+                with async_timeout.timeout(hass.config.setup_timeout,
+                                           loop=hass.loop):
+                    result = yield from _async_setup_component(
+                        hass, domain, config)
+            except asyncio.TimeoutError:
+                _LOGGER.error('Setup of %s timed out after %d seconds',
+                              domain, hass.config.setup_timeout)
+                _async_persistent_notification(hass, domain, True)
+                result = False
+
+            timeline[domain] = {
+                'start': setup_start - start,
+                'end': hass.loop.time() - start,
+                'success': result,
+            }
+
+    for domain in FIRST_COMPONENTS:
+        if domain in load_order:
+            yield from setup_domain(domain, None)
+
+    after_group = [domain for domain in load_order
+                   if domain not in FIRST_COMPONENTS and
+                   'group' in loader.load_order_component(domain)]
+    before_group = [domain for domain in load_order
+                    if domain not in FIRST_COMPONENTS and
+                    domain not in after_group]
+
+    for stage in (before_group, after_group):
+        tasks = OrderedDict()
+
+        # The load order guarantees dependencies are scheduled first
+        for domain in stage:
+            component = loader.get_component(domain)
+            dependencies = [tasks[dep] for dep
+                            in getattr(component, 'DEPENDENCIES', [])
+                            if dep in tasks]
+            tasks[domain] = hass.loop.create_task(
+                setup_domain(domain, dependencies))
+
+        if tasks:
+            yield from asyncio.wait(tasks.values(), loop=hass.loop)
+
+    _async_log_setup_timeline(timeline)
+
+
+def _async_log_setup_timeline(timeline) -> None:
+    """Log how long the setup of each component took and the critical path.
+
+    The critical path is the chain of dependencies that ended last.
+    """
+    if not timeline:
+        return
+
+    for domain, times in sorted(
+            timeline.items(), reverse=True,
+            key=lambda item: item[1]['end'] - item[1]['start']):
+        _LOGGER.debug('Setup of %s took %.3f seconds', domain,
+                      times['end'] - times['start'])
+
+    domain = max(timeline, key=lambda domain: timeline[domain]['end'])
+    path = []
+
+    while domain is not None:
+        path.append(domain)
+        component = loader.get_component(domain)
+        dependencies = [dep for dep in getattr(component, 'DEPENDENCIES', [])
+                        if dep in timeline]
+        domain = max(dependencies, key=lambda dep: timeline[dep]['end'],
+                     default=None)
+
+    _LOGGER.info(
+        'Setup of %d components done in %.3f seconds. Critical path: %s',
+        len(timeline), max(times['end'] for times in timeline.values()),
+        ' -> '.join('{} ({:.3f}s)'.format(
+            domain, timeline[domain]['end'] - timeline[domain]['start'])
+                    for domain in reversed(path)))
+
+
 def prepare_setup_component(hass: core.HomeAssistant, config: dict,
                             domain: str):
     """Prepare setup of a component and return processed config."""
@@ -194,7 +443,7 @@ def async_prepare_setup_component(hass: core.HomeAssistant, config: dict,
     This method is a coroutine.
     """
     # pylint: disable=too-many-return-statements
-    component = loader.get_component(domain)
+    component = yield from loader.async_get_component(hass, domain)
     missing_deps = [dep for dep in getattr(component, 'DEPENDENCIES', [])
                     if dep not in hass.config.components]
 
@@ -283,7 +532,8 @@ def async_prepare_setup_platform(hass: core.HomeAssistant, config, domain: str,
 
     platform_path = PLATFORM_FORMAT.format(domain, platform_name)
 
-    platform = loader.get_platform(domain, platform_name)
+    platform = yield from loader.async_get_platform(
+        hass, domain, platform_name)
 
     # Not found
     if platform is None:
@@ -424,8 +674,7 @@ def async_from_config_dict(config: Dict[str, Any],
     service.HASS = hass
 
     # Setup the components
-    for domain in loader.load_order_components(components):
-        yield from _async_setup_component(hass, domain, config)
+    yield from _async_setup_components(hass, components, config)
 
     setup_lock.release()
 
@@ -486,7 +735,7 @@ def async_from_config_file(config_path: str,
 
     try:
         config_dict = yield from hass.loop.run_in_executor(
-            None, conf_util.load_yaml_config_file, config_path)
+            None, conf_util.load_hass_config_file, config_path)
     except HomeAssistantError:
         return None
     finally:
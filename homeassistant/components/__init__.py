@@ -15,7 +15,8 @@ import homeassistant.core as ha
 from homeassistant.helpers.service import extract_entity_ids
 from homeassistant.loader import get_component
 from homeassistant.const import (
-    ATTR_ENTITY_ID, SERVICE_TURN_ON, SERVICE_TURN_OFF, SERVICE_TOGGLE)
+    ATTR_ENTITY_ID, EVENT_CORE_CONFIG_UPDATE, SERVICE_TURN_ON,
+    SERVICE_TURN_OFF, SERVICE_TOGGLE)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -143,6 +144,8 @@ def async_setup(hass, config):
         yield from conf_util.async_process_ha_core_config(
             hass, conf.get(ha.DOMAIN) or {})
 
+        hass.bus.async_fire(EVENT_CORE_CONFIG_UPDATE)
+
     hass.services.async_register(
         ha.DOMAIN, SERVICE_RELOAD_CORE_CONFIG, handle_reload_config)
 
@@ -105,23 +105,8 @@ def async_setup(hass, config):
 
         method = "async_{}".format(SERVICE_TO_METHOD[service.service])
 
-        for alarm in target_alarms:
-            yield from getattr(alarm, method)(code)
-
-        update_tasks = []
-        for alarm in target_alarms:
-            if not alarm.should_poll:
-                continue
-
-            update_coro = hass.loop.create_task(
-                alarm.async_update_ha_state(True))
-            if hasattr(alarm, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_alarms, method, code=code)
 
     descriptions = yield from hass.loop.run_in_executor(
         None, load_yaml_config_file, os.path.join(
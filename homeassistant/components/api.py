@@ -15,17 +15,21 @@ import homeassistant.core as ha
 import homeassistant.remote as rem
 from homeassistant.bootstrap import ERROR_LOG_FILENAME
 from homeassistant.const import (
-    EVENT_HOMEASSISTANT_STOP, EVENT_TIME_CHANGED,
+    EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST, HTTP_CREATED, HTTP_NOT_FOUND,
-    HTTP_UNPROCESSABLE_ENTITY, MATCH_ALL, URL_API, URL_API_COMPONENTS,
+    HTTP_UNPROCESSABLE_ENTITY, MATCH_ALL, URL_API, URL_API_BATCH,
+    URL_API_COMPONENTS,
     URL_API_CONFIG, URL_API_DISCOVERY_INFO, URL_API_ERROR_LOG,
     URL_API_EVENT_FORWARD, URL_API_EVENTS, URL_API_SERVICES,
-    URL_API_STATES, URL_API_STATES_ENTITY, URL_API_STREAM, URL_API_TEMPLATE,
-    __version__)
-from homeassistant.exceptions import TemplateError
+    URL_API_STATES, URL_API_STATES_ENTITY, URL_API_STREAM,
+    URL_API_STREAM_METRICS, URL_API_TEMPLATE, __version__)
+from homeassistant.exceptions import HomeAssistantError, TemplateError
 from homeassistant.helpers.state import AsyncTrackStates
 from homeassistant.helpers import template
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.stream import (
+    POLICIES, DEFAULT_POLICY, StreamOverflowError, StreamQueue,
+    async_stream_metrics)
 
 DOMAIN = 'api'
 DEPENDENCIES = ['http']
@@ -40,6 +44,7 @@ def setup(hass, config):
     """Register the API with the HTTP interface."""
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIStreamMetricsView)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIDiscoveryView)
     hass.http.register_view(APIStatesView)
@@ -52,6 +57,7 @@ def setup(hass, config):
     hass.http.register_view(APIComponentsView)
     hass.http.register_view(APIErrorLogView)
     hass.http.register_view(APITemplateView)
+    hass.http.register_view(APIBatchView)
 
     return True
 
@@ -77,16 +83,22 @@ class APIEventStream(HomeAssistantView):
     @asyncio.coroutine
     def get(self, request):
         """Provide a streaming interface for the event bus."""
-        # pylint: disable=no-self-use
         hass = request.app['hass']
         stop_obj = object()
-        to_write = asyncio.Queue(loop=hass.loop)
+
+        policy = request.GET.get('overflow', DEFAULT_POLICY)
+        if policy not in POLICIES:
+            return self.json_message('Invalid overflow policy',
+                                     HTTP_BAD_REQUEST)
+
+        to_write = StreamQueue(hass, 'stream {}'.format(id(stop_obj)),
+                               policy=policy)
 
         restrict = request.GET.get('restrict')
         if restrict:
             restrict = restrict.split(',') + [EVENT_HOMEASSISTANT_STOP]
 
-        @asyncio.coroutine
+        @ha.callback
         def forward_events(event):
             """Forward events to the open request."""
             if event.event_type == EVENT_TIME_CHANGED:
@@ -98,29 +110,32 @@ class APIEventStream(HomeAssistantView):
             _LOGGER.debug('STREAM %s FORWARDING %s', id(stop_obj), event)
 
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
+                to_write.async_put(stop_obj)
+            elif event.event_type == EVENT_STATE_CHANGED:
+                # Only the latest pending change of an entity is relevant
+                # if the client can't keep up.
+                to_write.async_put(event.as_json(), event.data['entity_id'])
             else:
-                data = json.dumps(event, cls=rem.JSONEncoder)
-
-            yield from to_write.put(data)
+                to_write.async_put(event.as_json())
 
         response = web.StreamResponse()
         response.content_type = 'text/event-stream'
         yield from response.prepare(request)
 
         unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        unregister_queue = to_write.async_register()
 
         try:
             _LOGGER.debug('STREAM %s ATTACHED', id(stop_obj))
 
             # Fire off one message so browsers fire open event right away
-            yield from to_write.put(STREAM_PING_PAYLOAD)
+            to_write.async_put(STREAM_PING_PAYLOAD)
 
             while True:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL,
                                                loop=hass.loop):
-                        payload = yield from to_write.get()
+                        payload = yield from to_write.async_get()
 
                     if payload is stop_obj:
                         break
@@ -131,11 +146,28 @@ class APIEventStream(HomeAssistantView):
                     response.write(msg.encode("UTF-8"))
                     yield from response.drain()
                 except asyncio.TimeoutError:
-                    yield from to_write.put(STREAM_PING_PAYLOAD)
+                    to_write.async_put(STREAM_PING_PAYLOAD)
+
+        except StreamOverflowError:
+            _LOGGER.debug('STREAM %s OVERFLOWED', id(stop_obj))
 
         finally:
-            _LOGGER.debug('STREAM %s RESPONSE CLOSED', id(stop_obj))
+            _LOGGER.debug('STREAM %s RESPONSE CLOSED %s', id(stop_obj),
+                          to_write.as_dict())
             unsub_stream()
+            unregister_queue()
+
+
+class APIStreamMetricsView(HomeAssistantView):
+    """View to handle stream metrics requests."""
+
+    url = URL_API_STREAM_METRICS
+    name = "api:stream-metrics"
+
+    @ha.callback
+    def get(self, request):
+        """Return queue metrics of the open streams."""
+        return self.json(async_stream_metrics(request.app['hass']))
 
 
 class APIConfigView(HomeAssistantView):
@@ -265,14 +297,7 @@ class APIEventView(HomeAssistantView):
             return self.json_message('Event data should be a JSON object',
                                      HTTP_BAD_REQUEST)
 
-        # Special case handling for event STATE_CHANGED
-        # We will try to convert state dicts back to State objects
-        if event_type == ha.EVENT_STATE_CHANGED and event_data:
-            for key in ('old_state', 'new_state'):
-                state = ha.State.from_dict(event_data.get(key))
-
-                if state:
-                    event_data[key] = state
+        _restore_states(event_type, event_data)
 
         request.app['hass'].bus.async_fire(event_type, event_data,
                                            ha.EventOrigin.remote)
@@ -429,6 +454,47 @@ class APITemplateView(HomeAssistantView):
                                      HTTP_BAD_REQUEST)
 
 
+class APIBatchView(HomeAssistantView):
+    """View to handle Batch requests."""
+
+    url = URL_API_BATCH
+    name = "api:batch"
+
+    @asyncio.coroutine
+    def post(self, request):
+        """Execute a list of state sets, events and service calls.
+
+        Returns a list with the result of each operation.
+        """
+        hass = request.app['hass']
+        try:
+            operations = yield from request.json()
+        except ValueError:
+            return self.json_message('Invalid JSON specified',
+                                     HTTP_BAD_REQUEST)
+
+        if not isinstance(operations, list):
+            return self.json_message('Batch should be a JSON list',
+                                     HTTP_BAD_REQUEST)
+
+        results = []
+
+        for operation in operations:
+            try:
+                message = yield from _async_run_operation(hass, operation)
+            except (AttributeError, KeyError, TypeError):
+                message = 'Invalid operation specified'
+            except HomeAssistantError as err:
+                message = str(err)
+
+            results.append({
+                'success': message is None,
+                'message': message,
+            })
+
+        return self.json(results)
+
+
 def async_services_json(hass):
     """Generate services data to JSONify."""
     return [{"domain": key, "services": value}
@@ -439,3 +505,55 @@ def async_events_json(hass):
     """Generate event data to JSONify."""
     return [{"event": key, "listener_count": value}
             for key, value in hass.bus.async_listeners().items()]
+
+
+@asyncio.coroutine
+def _async_run_operation(hass, operation):
+    """Run a single operation of a batch.
+
+    Returns an error message or None if successful.
+    """
+    op_type = operation.get('type')
+
+    if op_type == rem.BATCH_SET_STATE:
+        if not operation.get('state'):
+            return 'No state specified'
+
+        hass.states.async_set(
+            operation['entity_id'], operation['state'],
+            operation.get('attributes'), operation.get('force_update', False))
+
+    elif op_type == rem.BATCH_FIRE_EVENT:
+        event_type = operation['event_type']
+        event_data = operation.get('event_data')
+
+        if event_data is not None and not isinstance(event_data, dict):
+            return 'Event data should be a JSON object'
+
+        _restore_states(event_type, event_data)
+        hass.bus.async_fire(event_type, event_data, ha.EventOrigin.remote)
+
+    elif op_type == rem.BATCH_CALL_SERVICE:
+        yield from hass.services.async_call(
+            operation['domain'], operation['service'],
+            operation.get('service_data'), operation.get('blocking', False))
+
+    else:
+        return 'Unknown operation type {}'.format(op_type)
+
+    return None
+
+
+def _restore_states(event_type, event_data):
+    """Convert state dicts of a remote state_changed event to State objects.
+
+    Works in place on event_data.
+    """
+    if event_type != ha.EVENT_STATE_CHANGED or not event_data:
+        return
+
+    for key in ('old_state', 'new_state'):
+        state = ha.State.from_dict(event_data.get(key))
+
+        if state:
+            event_data[key] = state
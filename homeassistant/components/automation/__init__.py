@@ -5,9 +5,11 @@ For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/automation/
 """
 import asyncio
+from datetime import timedelta
 from functools import partial
 import logging
 import os
+from time import perf_counter
 
 import voluptuous as vol
 
@@ -17,10 +19,12 @@ from homeassistant.const import (
     ATTR_ENTITY_ID, CONF_PLATFORM, STATE_ON, SERVICE_TURN_ON, SERVICE_TURN_OFF,
     SERVICE_TOGGLE)
 from homeassistant.components import logbook
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import extract_domain_configs, script, condition
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.loader import get_platform
 from homeassistant.util.dt import utcnow
 import homeassistant.helpers.config_validation as cv
@@ -50,10 +54,15 @@ DEFAULT_HIDE_ENTITY = False
 DEFAULT_INITIAL_STATE = True
 
 ATTR_LAST_TRIGGERED = 'last_triggered'
+ATTR_CONDITION_EVALUATIONS = 'condition_evaluations'
+ATTR_CONDITION_TIME = 'condition_time'
 ATTR_VARIABLES = 'variables'
 SERVICE_TRIGGER = 'trigger'
 SERVICE_RELOAD = 'reload'
 
+# Delay before the condition statistics of failed evaluations are written
+CONDITION_STATS_DELAY = timedelta(seconds=10)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -236,6 +245,9 @@ class AutomationEntity(ToggleEntity):
         self._enabled = False
         self._last_triggered = None
         self._hidden = hidden
+        self._condition_evaluations = 0
+        self._condition_time = 0
+        self._async_unsub_stats = None
 
     @property
     def name(self):
@@ -251,7 +263,9 @@ class AutomationEntity(ToggleEntity):
     def state_attributes(self):
         """Return the entity state attributes."""
         return {
-            ATTR_LAST_TRIGGERED: self._last_triggered
+            ATTR_LAST_TRIGGERED: self._last_triggered,
+            ATTR_CONDITION_EVALUATIONS: self._condition_evaluations,
+            ATTR_CONDITION_TIME: round(self._condition_time, 6),
         }
 
     @property
@@ -290,14 +304,40 @@ class AutomationEntity(ToggleEntity):
 
         This method is a coroutine.
         """
-        if skip_condition or self._cond_func(variables):
+        if skip_condition or self._async_test_condition(variables):
             yield from self._async_action(self.entity_id, variables)
             self._last_triggered = utcnow()
             yield from self.async_update_ha_state()
 
+    def _async_test_condition(self, variables):
+        """Test the condition and keep count of the time spent on it."""
+        start = perf_counter()
+        result = self._cond_func(variables)
+        self._condition_evaluations += 1
+        self._condition_time += perf_counter() - start
+
+        # The state is written when the action runs, else write it later so
+        # that frequent failed evaluations only cause one state change.
+        if not result and self._async_unsub_stats is None:
+            self._async_unsub_stats = async_track_point_in_utc_time(
+                self.hass, self._async_write_stats,
+                utcnow() + CONDITION_STATS_DELAY)
+
+        return result
+
+    @callback
+    def _async_write_stats(self, now):
+        """Write the state with the latest condition statistics."""
+        self._async_unsub_stats = None
+        self.hass.async_add_job(self.async_update_ha_state())
+
     @asyncio.coroutine
     def async_remove(self):
         """Remove automation from HASS."""
+        if self._async_unsub_stats is not None:
+            self._async_unsub_stats()
+            self._async_unsub_stats = None
+
         yield from self.async_turn_off()
         yield from super().async_remove()
 
@@ -382,17 +422,19 @@ def _async_process_if(hass, config, p_config):
     """Process if checks."""
     if_configs = p_config.get(CONF_CONDITION)
 
-    checks = []
-    for if_config in if_configs:
-        try:
-            checks.append(condition.async_from_config(if_config, False))
-        except HomeAssistantError as ex:
-            _LOGGER.warning('Invalid condition: %s', ex)
-            return None
+    # Compile all conditions into a single plan that tests cheap ones first
+    try:
+        check = condition.async_and_from_config({
+            CONF_CONDITION: CONDITION_TYPE_AND,
+            'conditions': if_configs,
+        }, False)
+    except HomeAssistantError as ex:
+        _LOGGER.warning('Invalid condition: %s', ex)
+        return None
 
     def if_action(variables=None):
         """AND all conditions."""
-        return all(check(hass, variables) for check in checks)
+        return check(hass, variables)
 
     return if_action
 
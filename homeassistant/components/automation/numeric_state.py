@@ -25,45 +25,142 @@ TRIGGER_SCHEMA = vol.All(vol.Schema({
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_NUMERIC_STATE_TRIGGERS = 'automation_numeric_state_triggers'
+
 
 def async_trigger(hass, config, action):
     """Listen for state changes based on configuration."""
-    entity_id = config.get(CONF_ENTITY_ID)
+    entity_ids = config.get(CONF_ENTITY_ID)
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
     if value_template is not None:
         value_template.hass = hass
 
+    triggers = hass.data.get(DATA_NUMERIC_STATE_TRIGGERS)
+
+    if triggers is None:
+        triggers = hass.data[DATA_NUMERIC_STATE_TRIGGERS] = \
+            NumericStateTriggers(hass)
+
+    return triggers.async_add(
+        entity_ids, (below, above, value_template, action))
+
+
+def _in_range(value, below, above):
+    """Return if a parsed value is within the thresholds."""
+    return (value is not None and
+            (below is None or value <= below) and
+            (above is None or value >= above))
+
+
+def _parse_state(state):
+    """Return the state as a float, None if it is not a number."""
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+class NumericStateTriggers(object):
+    """Index of the numeric state triggers by entity.
+
+    A state change of an entity parses the new and old state once and tests
+    the thresholds of all triggers of that entity together.
+    """
+
+    def __init__(self, hass):
+        """Initialize the index."""
+        self.hass = hass
+        # Tuples of (below, above, value_template, action) by entity_id
+        self._triggers = {}
+        self._unsubs = {}
+
+    @callback
+    def async_add(self, entity_ids, trigger):
+        """Add a trigger for entity_ids.
+
+        Returns a function that can be called to remove the trigger.
+
+        This method must be run in the event loop.
+        """
+        entity_ids = set(entity_ids)
+
+        for entity_id in entity_ids:
+            self._triggers[entity_id] = \
+                self._triggers.get(entity_id, ()) + (trigger,)
+
+            if entity_id not in self._unsubs:
+                self._unsubs[entity_id] = async_track_state_change(
+                    self.hass, entity_id, self._async_state_changed)
+
+        @callback
+        def async_remove():
+            """Remove the trigger."""
+            for entity_id in entity_ids:
+                triggers = tuple(other for other
+                                 in self._triggers.get(entity_id, ())
+                                 if other is not trigger)
+
+                if triggers:
+                    self._triggers[entity_id] = triggers
+                    continue
+
+                self._triggers.pop(entity_id, None)
+                unsub = self._unsubs.pop(entity_id, None)
+
+                if unsub is not None:
+                    unsub()
+
+        return async_remove
+
     @callback
-    def state_automation_listener(entity, from_s, to_s):
-        """Listen for state changes and calls action."""
+    def _async_state_changed(self, entity_id, from_s, to_s):
+        """Test the triggers of an entity against its new state."""
         if to_s is None:
             return
 
-        variables = {
-            'trigger': {
-                'platform': 'numeric_state',
-                'entity_id': entity,
-                'below': below,
-                'above': above,
+        to_value = condition.async_numeric_value(self.hass, to_s)
+        from_value = None
+        from_parsed = False
+
+        for below, above, value_template, action in \
+                self._triggers.get(entity_id, ()):
+            variables = {
+                'trigger': {
+                    'platform': 'numeric_state',
+                    'entity_id': entity_id,
+                    'below': below,
+                    'above': above,
+                }
             }
-        }
 
-        # If new one doesn't match, nothing to do
-        if not condition.async_numeric_state(
-                hass, to_s, below, above, value_template, variables):
-            return
+            if value_template is not None:
+                # If new one doesn't match, nothing to do
+                if not condition.async_numeric_state(
+                        self.hass, to_s, below, above, value_template,
+                        variables):
+                    continue
 
-        # Only match if old didn't exist or existed but didn't match
-        # Written as: skip if old one did exist and matched
-        if from_s is not None and condition.async_numeric_state(
-                hass, from_s, below, above, value_template, variables):
-            return
+                # Only match if old didn't exist or existed but didn't match
+                # Written as: skip if old one did exist and matched
+                if from_s is not None and condition.async_numeric_state(
+                        self.hass, from_s, below, above, value_template,
+                        variables):
+                    continue
+
+            else:
+                if not _in_range(to_value, below, above):
+                    continue
+
+                if from_s is not None and not from_parsed:
+                    from_value = _parse_state(from_s)
+                    from_parsed = True
 
-        variables['trigger']['from_state'] = from_s
-        variables['trigger']['to_state'] = to_s
+                if _in_range(from_value, below, above):
+                    continue
 
-        hass.async_run_job(action, variables)
+            variables['trigger']['from_state'] = from_s
+            variables['trigger']['to_state'] = to_s
 
-    return async_track_state_change(hass, entity_id, state_automation_listener)
+            self.hass.async_run_job(action, variables)
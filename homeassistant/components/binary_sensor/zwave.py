@@ -39,8 +39,12 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     if discovery_info is None or zwave.NETWORK is None:
         return
 
-    node = zwave.NETWORK.nodes[discovery_info[zwave.const.ATTR_NODE_ID]]
-    value = node.values[discovery_info[zwave.const.ATTR_VALUE_ID]]
+    zwave.setup_discovered_values(
+        hass, discovery_info, add_devices, setup_value)
+
+
+def setup_value(hass, value, add_devices):
+    """Set up a binary sensor for a discovered Z-Wave value."""
     value.set_change_verified(False)
 
     # Make sure that we have values for the key before converting to int
@@ -71,14 +75,10 @@ class ZWaveBinarySensor(BinarySensorDevice, zwave.ZWaveDeviceEntity, Entity):
     def __init__(self, value, sensor_class):
         """Initialize the sensor."""
         self._sensor_type = sensor_class
-        # pylint: disable=import-error
-        from openzwave.network import ZWaveNetwork
-        from pydispatch import dispatcher
-
         zwave.ZWaveDeviceEntity.__init__(self, value, DOMAIN)
 
-        dispatcher.connect(
-            self.value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED)
+        zwave.connect_value_changed(
+            self.value_changed, value, node=True)
 
     @property
     def is_on(self):
@@ -198,24 +198,6 @@ def async_setup(hass, config):
         None, load_yaml_config_file,
         os.path.join(os.path.dirname(__file__), 'services.yaml'))
 
-    @asyncio.coroutine
-    def _async_update_climate(target_climate):
-        """Update climate entity after service stuff."""
-        update_tasks = []
-        for climate in target_climate:
-            if not climate.should_poll:
-                continue
-
-            update_coro = hass.loop.create_task(
-                climate.async_update_ha_state(True))
-            if hasattr(climate, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
-
     @asyncio.coroutine
     def async_away_mode_set_service(service):
         """Set away mode on target climate devices."""
@@ -229,13 +211,12 @@ def async_setup(hass, config):
                 SERVICE_SET_AWAY_MODE, ATTR_AWAY_MODE)
             return
 
-        for climate in target_climate:
-            if away_mode:
-                yield from climate.async_turn_away_mode_on()
-            else:
-                yield from climate.async_turn_away_mode_off()
+        if away_mode:
+            method = 'async_turn_away_mode_on'
+        else:
+            method = 'async_turn_away_mode_off'
 
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(target_climate, method)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_AWAY_MODE, async_away_mode_set_service,
@@ -255,13 +236,12 @@ def async_setup(hass, config):
                 SERVICE_SET_AUX_HEAT, ATTR_AUX_HEAT)
             return
 
-        for climate in target_climate:
-            if aux_heat:
-                yield from climate.async_turn_aux_heat_on()
-            else:
-                yield from climate.async_turn_aux_heat_off()
+        if aux_heat:
+            method = 'async_turn_aux_heat_on'
+        else:
+            method = 'async_turn_aux_heat_off'
 
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(target_climate, method)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_AUX_HEAT, async_aux_heat_set_service,
@@ -273,7 +253,8 @@ def async_setup(hass, config):
         """Set temperature on the target climate devices."""
         target_climate = component.async_extract_from_service(service)
 
-        for climate in target_climate:
+        def _async_set_temperature(climate):
+            """Set the temperature in the unit of the climate device."""
             kwargs = {}
             for value, temp in service.data.items():
                 if value in CONVERTIBLE_ATTRIBUTE:
@@ -285,9 +266,10 @@ def async_setup(hass, config):
                 else:
                     kwargs[value] = temp
 
-            yield from climate.async_set_temperature(**kwargs)
+            return climate.async_set_temperature(**kwargs)
 
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(
+            target_climate, _async_set_temperature)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_TEMPERATURE, async_temperature_set_service,
@@ -307,10 +289,8 @@ def async_setup(hass, config):
                 SERVICE_SET_HUMIDITY, ATTR_HUMIDITY)
             return
 
-        for climate in target_climate:
-            yield from climate.async_set_humidity(humidity)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(
+            target_climate, 'async_set_humidity', humidity=humidity)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_HUMIDITY, async_humidity_set_service,
@@ -330,10 +310,8 @@ def async_setup(hass, config):
                 SERVICE_SET_FAN_MODE, ATTR_FAN_MODE)
             return
 
-        for climate in target_climate:
-            yield from climate.async_set_fan_mode(fan)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(
+            target_climate, 'async_set_fan_mode', fan=fan)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_FAN_MODE, async_fan_mode_set_service,
@@ -353,10 +331,9 @@ def async_setup(hass, config):
                 SERVICE_SET_OPERATION_MODE, ATTR_OPERATION_MODE)
             return
 
-        for climate in target_climate:
-            yield from climate.async_set_operation_mode(operation_mode)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(
+            target_climate, 'async_set_operation_mode',
+            operation_mode=operation_mode)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_OPERATION_MODE, async_operation_set_service,
@@ -376,10 +353,8 @@ def async_setup(hass, config):
                 SERVICE_SET_SWING_MODE, ATTR_SWING_MODE)
             return
 
-        for climate in target_climate:
-            yield from climate.async_set_swing_mode(swing_mode)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entities(
+            target_climate, 'async_set_swing_mode', swing_mode=swing_mode)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_SWING_MODE, async_swing_set_service,
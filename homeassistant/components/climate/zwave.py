@@ -38,13 +38,18 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
         _LOGGER.debug("No discovery_info=%s or no NETWORK=%s",
                       discovery_info, zwave.NETWORK)
         return
+
+    zwave.setup_discovered_values(
+        hass, discovery_info, add_devices, setup_value)
+
+
+def setup_value(hass, value, add_devices):
+    """Set up a climate device for a discovered Z-Wave value."""
     temp_unit = hass.config.units.temperature_unit
-    node = zwave.NETWORK.nodes[discovery_info[zwave.const.ATTR_NODE_ID]]
-    value = node.values[discovery_info[zwave.const.ATTR_VALUE_ID]]
     value.set_change_verified(False)
     add_devices([ZWaveClimate(value, temp_unit)])
-    _LOGGER.debug("discovery_info=%s and zwave.NETWORK=%s",
-                  discovery_info, zwave.NETWORK)
+    _LOGGER.debug("value=%s and zwave.NETWORK=%s",
+                  value, zwave.NETWORK)
 
 
 class ZWaveClimate(ZWaveDeviceEntity, ClimateDevice):
@@ -52,8 +57,6 @@ class ZWaveClimate(ZWaveDeviceEntity, ClimateDevice):
 
     def __init__(self, value, temp_unit):
         """Initialize the Z-Wave climate device."""
-        from openzwave.network import ZWaveNetwork
-        from pydispatch import dispatcher
         ZWaveDeviceEntity.__init__(self, value, DOMAIN)
         self._index = value.index
         self._node = value.node
@@ -72,8 +75,8 @@ class ZWaveClimate(ZWaveDeviceEntity, ClimateDevice):
         self._zxt_120 = None
         self.update_properties()
         # register listener
-        dispatcher.connect(
-            self.value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED)
+        zwave.connect_value_changed(
+            self.value_changed, value, node=True)
         # Make sure that we have values for the key before converting to int
         if (value.node.manufacturer_id.strip() and
                 value.node.product_id.strip()):
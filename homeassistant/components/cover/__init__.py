@@ -141,14 +141,7 @@ def setup(hass, config):
 
         covers = component.extract_from_service(service)
 
-        for cover in covers:
-            getattr(cover, method['method'])(**params)
-
-        for cover in covers:
-            if not cover.should_poll:
-                continue
-
-            cover.update_ha_state(True)
+        component.call_entities(covers, method['method'], **params)
 
     descriptions = load_yaml_config_file(
         os.path.join(os.path.dirname(__file__), 'services.yaml'))
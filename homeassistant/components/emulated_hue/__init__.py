@@ -5,7 +5,10 @@ For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/emulated_hue/
 """
 import asyncio
+import json
 import logging
+import os
+import threading
 
 import voluptuous as vol
 
@@ -22,6 +25,9 @@ from .upnp import DescriptionXmlView, UPNPResponderThread
 
 DOMAIN = 'emulated_hue'
 
+# Numbers of the entities for Google Home, kept to not break linked devices
+NUMBERS_FILE = 'emulated_hue_ids.json'
+
 _LOGGER = logging.getLogger(__name__)
 
 CONF_HOST_IP = 'host_ip'
@@ -60,7 +66,8 @@ ATTR_EMULATED_HUE = 'emulated_hue'
 
 def setup(hass, yaml_config):
     """Activate the emulated_hue component."""
-    config = Config(yaml_config.get(DOMAIN, {}))
+    config = Config(yaml_config.get(DOMAIN, {}),
+                    hass.config.path(NUMBERS_FILE), hass)
 
     server = HomeAssistantWSGI(
         hass,
@@ -108,11 +115,22 @@ def setup(hass, yaml_config):
 class Config(object):
     """Holds configuration variables for the emulated hue bridge."""
 
-    def __init__(self, conf):
+    def __init__(self, conf, numbers_path=None, hass=None):
         """Initialize the instance."""
+        self.hass = hass
         self.type = conf.get(CONF_TYPE)
         self.numbers = {}
         self.cached_states = {}
+        self._numbers_path = numbers_path
+        self._numbers_version = 0
+        self._numbers_written = 0
+        self._numbers_lock = threading.Lock()
+
+        if numbers_path is not None:
+            self.numbers = _load_numbers(numbers_path)
+
+        self._entity_numbers = {entity_id: number for number, entity_id
+                                in self.numbers.items()}
 
         # Get the IP address that will be passed to the Echo during discovery
         self.host_ip_addr = conf.get(CONF_HOST_IP)
@@ -152,19 +170,47 @@ class Config(object):
             CONF_EXPOSED_DOMAINS, DEFAULT_EXPOSED_DOMAINS)
 
     def entity_id_to_number(self, entity_id):
-        """Get a unique number for the entity id."""
+        """Get a unique number for the entity id.
+
+        This method must be run in the event loop if hass is set.
+        """
         if self.type == TYPE_ALEXA:
             return entity_id
 
         # Google Home
-        for number, ent_id in self.numbers.items():
-            if entity_id == ent_id:
-                return number
+        number = self._entity_numbers.get(entity_id)
+
+        if number is not None:
+            return number
 
         number = str(len(self.numbers) + 1)
         self.numbers[number] = entity_id
+        self._entity_numbers[entity_id] = number
+
+        if self._numbers_path is not None:
+            self._numbers_version += 1
+
+            if self.hass is None:
+                self._write_numbers(self._numbers_version, self.numbers)
+            else:
+                self.hass.async_add_job(self._write_numbers,
+                                        self._numbers_version,
+                                        dict(self.numbers))
+
         return number
 
+    def _write_numbers(self, version, numbers):
+        """Store the numbers unless newer numbers have been stored.
+
+        This method needs to run in an executor if hass is set.
+        """
+        with self._numbers_lock:
+            if version <= self._numbers_written:
+                return
+
+            _save_numbers(self._numbers_path, numbers)
+            self._numbers_written = version
+
     def number_to_entity_id(self, number):
         """Convert unique number to entity id."""
         if self.type == TYPE_ALEXA:
@@ -196,3 +242,25 @@ class Config(object):
             domain_exposed_by_default and explicit_expose is not False
 
         return is_default_exposed or explicit_expose
+
+
+def _load_numbers(path):
+    """Load the numbers of the entities."""
+    if not os.path.isfile(path):
+        return {}
+
+    try:
+        with open(path) as numbers_file:
+            return json.load(numbers_file)
+    except (OSError, ValueError) as err:
+        _LOGGER.error("Unable to load %s: %s", path, err)
+        return {}
+
+
+def _save_numbers(path, numbers):
+    """Store the numbers of the entities."""
+    try:
+        with open(path, 'w') as numbers_file:
+            json.dump(numbers, numbers_file, indent=4)
+    except OSError as err:
+        _LOGGER.error("Unable to save %s: %s", path, err)
@@ -8,7 +8,7 @@ from homeassistant import core
 from homeassistant.const import (
     ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON, SERVICE_VOLUME_SET,
     SERVICE_OPEN_COVER, SERVICE_CLOSE_COVER, STATE_ON, STATE_OFF,
-    HTTP_BAD_REQUEST, HTTP_NOT_FOUND,
+    HTTP_BAD_REQUEST, HTTP_NOT_FOUND, EVENT_STATE_CHANGED,
 )
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS, ATTR_SUPPORTED_FEATURES, SUPPORT_BRIGHTNESS
@@ -61,23 +61,64 @@ class HueAllLightsStateView(HomeAssistantView):
     def __init__(self, config):
         """Initialize the instance of the view."""
         self.config = config
+        # Exposed entity ids, kept up to date from state changes
+        self._exposed = None
+        # Per entity id: (number, state, cached state, json)
+        self._lights = {}
 
     @core.callback
     def get(self, request, username):
         """Process a request to get the list of available lights."""
         hass = request.app['hass']
+
+        if self._exposed is None:
+            self._async_track_exposed(hass)
+
         json_response = {}
 
-        for entity in hass.states.async_all():
-            if self.config.is_entity_exposed(entity):
+        for entity_id in self._exposed:
+            entity = hass.states.get(entity_id)
+
+            # Removed, the state changed event has not been handled yet
+            if entity is None:
+                continue
+
+            cached_state = self.config.cached_states.get(entity_id)
+            light = self._lights.get(entity_id)
+
+            if light is None or light[1] is not entity or \
+                    light[2] != cached_state:
                 state, brightness = get_entity_state(self.config, entity)
+                light = self._lights[entity_id] = (
+                    self.config.entity_id_to_number(entity_id), entity,
+                    cached_state, entity_to_json(entity, state, brightness))
 
-                number = self.config.entity_id_to_number(entity.entity_id)
-                json_response[number] = entity_to_json(
-                    entity, state, brightness)
+            json_response[light[0]] = light[3]
 
         return self.json(json_response)
 
+    @core.callback
+    def _async_track_exposed(self, hass):
+        """Find the exposed entities and keep track of them."""
+        self._exposed = set(entity.entity_id for entity
+                            in hass.states.async_all()
+                            if self.config.is_entity_exposed(entity))
+
+        @core.callback
+        def exposed_state_changed(event):
+            """Update the exposed entities when a state changes."""
+            entity_id = event.data['entity_id']
+            new_state = event.data['new_state']
+
+            if new_state is not None and \
+                    self.config.is_entity_exposed(new_state):
+                self._exposed.add(entity_id)
+            else:
+                self._exposed.discard(entity_id)
+                self._lights.pop(entity_id, None)
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, exposed_state_changed)
+
 
 class HueOneLightStateView(HomeAssistantView):
     """Handle requests for getting and setting info about entities."""
@@ -164,13 +164,7 @@ def setup(hass, config: dict) -> None:
                 break
 
         if service_fun:
-            for fan in target_fans:
-                getattr(fan, service_fun)(**params)
-
-            for fan in target_fans:
-                if fan.should_poll:
-                    fan.update_ha_state(True)
-            return
+            component.call_entities(target_fans, service_fun, **params)
 
     # Listen for fan service calls.
     descriptions = load_yaml_config_file(
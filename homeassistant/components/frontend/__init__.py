@@ -1,18 +1,23 @@
 """Handle the frontend for Home Assistant."""
 import asyncio
+from collections import OrderedDict
+import gzip
 import hashlib
 import json
 import logging
 import os
 
-from aiohttp import web
+from aiohttp import hdrs, web
 
 from homeassistant.core import callback
-from homeassistant.const import HTTP_NOT_FOUND
+from homeassistant.const import (
+    CONTENT_TYPE_JSON, EVENT_COMPONENT_LOADED, EVENT_CORE_CONFIG_UPDATE,
+    EVENT_SERVICE_REGISTERED, EVENT_STATE_CHANGED, HTTP_NOT_FOUND)
 from homeassistant.components import api, group
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.http.auth import is_trusted_ip
 from homeassistant.components.http.const import KEY_DEVELOPMENT
+from homeassistant.remote import JSONEncoder, json_dumps
 from .version import FINGERPRINTS
 
 DOMAIN = 'frontend'
@@ -42,6 +47,7 @@ for size in (192, 384, 512, 1024):
 
 DATA_PANELS = 'frontend_panels'
 DATA_INDEX_VIEW = 'frontend_index_view'
+DATA_BOOTSTRAP_CACHE = 'frontend_bootstrap_cache'
 
 # To keep track we don't register a component twice (gives a warning)
 _REGISTERED_COMPONENTS = set()
@@ -123,6 +129,11 @@ def register_panel(hass, component_name, path, md5=None, sidebar_title=None,
 
     panels[url_path] = data
 
+    cache = hass.data.get(DATA_BOOTSTRAP_CACHE)
+
+    if cache is not None:
+        hass.loop.call_soon_threadsafe(cache.async_invalidate, 'panels')
+
     # Register index view for this route if IndexView already loaded
     # Otherwise it will be done during setup.
     index_view = hass.data.get(DATA_INDEX_VIEW)
@@ -139,6 +150,7 @@ def add_manifest_json_key(key, val):
 
 def setup(hass, config):
     """Setup serving the frontend."""
+    hass.data[DATA_BOOTSTRAP_CACHE] = BootstrapCache(hass)
     hass.http.register_view(BootstrapView)
     hass.http.register_view(ManifestJSONView)
 
@@ -178,24 +190,185 @@ def setup(hass, config):
     return True
 
 
+class BootstrapCache(object):
+    """Serialized bootstrap payload that is only updated where it changed.
+
+    States are serialized per entity after they changed. Services are
+    serialized again after a service got registered, the config after a
+    component got loaded or the core config got reloaded, the panels after
+    a panel got registered and the events after the listeners of the event
+    bus changed. The complete and the gzip compressed payload are cached
+    until one of the parts changed.
+    """
+
+    def __init__(self, hass):
+        """Initialize the bootstrap cache."""
+        self.hass = hass
+        self.version = 0
+        # entity_id -> serialized state or None if not serialized yet
+        self._states = None
+        self._services = None
+        # name -> serialized data, removed after the data changed
+        self._parts = {}
+        self._listeners_version = None
+        self._payload = (None, None)
+        self._compressed = (None, None)
+        self._compressing = None
+
+    @callback
+    def _async_start(self):
+        """Start tracking the states, services and config."""
+        self._states = OrderedDict(
+            (state.entity_id, None) for state in self.hass.states.async_all())
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._state_changed)
+        self.hass.bus.async_listen(EVENT_SERVICE_REGISTERED,
+                                   self._services_changed)
+        self.hass.bus.async_listen(EVENT_COMPONENT_LOADED,
+                                   self._config_changed)
+        self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE,
+                                   self._config_changed)
+
+    @callback
+    def _state_changed(self, event):
+        """Mark the state of an entity as changed."""
+        entity_id = event.data['entity_id']
+
+        if event.data.get('new_state') is None:
+            self._states.pop(entity_id, None)
+        else:
+            self._states[entity_id] = None
+
+        self.version += 1
+
+    @callback
+    def _services_changed(self, event):
+        """Mark the services as changed."""
+        self._services = None
+        self.version += 1
+
+    @callback
+    def _config_changed(self, event):
+        """Mark the config as changed."""
+        self.async_invalidate('config')
+
+    @callback
+    def async_invalidate(self, name):
+        """Mark the config, events or panels as changed.
+
+        This method must be run in the event loop.
+        """
+        self._parts.pop(name, None)
+
+    def _part(self, name, get_data):
+        """Return the serialized data, serialize it only if it changed."""
+        serialized = self._parts.get(name)
+
+        if serialized is None:
+            serialized = self._parts[name] = json.dumps(
+                get_data(), sort_keys=True, cls=JSONEncoder)
+            self.version += 1
+
+        return serialized
+
+    @callback
+    def async_payload(self):
+        """Return the serialized bootstrap payload.
+
+        This method must be run in the event loop.
+        """
+        if self._states is None:
+            self._async_start()
+
+        hass = self.hass
+
+        if self._listeners_version != hass.bus.listeners_version:
+            self._listeners_version = hass.bus.listeners_version
+            self.async_invalidate('events')
+
+        config = self._part('config', hass.config.as_dict)
+        events = self._part('events', lambda: api.async_events_json(hass))
+        panels = self._part('panels', lambda: hass.data[DATA_PANELS])
+
+        if self._payload[0] == self.version:
+            return self._payload[1]
+
+        if self._services is None:
+            self._services = json.dumps(api.async_services_json(hass),
+                                        sort_keys=True, cls=JSONEncoder)
+
+        states = []
+
+        for entity_id, serialized in self._states.items():
+            if serialized is None:
+                state = hass.states.get(entity_id)
+
+                # Removed, the state changed event has not been handled yet
+                if state is None:
+                    continue
+
+                serialized = self._states[entity_id] = json_dumps(state)
+
+            states.append(serialized)
+
+        payload = (
+            '{{"config": {}, "events": {}, "panels": {}, "services": {}, '
+            '"states": [{}]}}').format(
+                config, events, panels, self._services,
+                ', '.join(states)).encode('UTF-8')
+
+        self._payload = (self.version, payload)
+        return payload
+
+    @asyncio.coroutine
+    def async_compressed_payload(self):
+        """Return the gzip compressed bootstrap payload.
+
+        Compression runs in the executor and is shared by all requests for
+        the same version.
+
+        This method is a coroutine.
+        """
+        payload = self.async_payload()
+        version = self.version
+
+        if self._compressed[0] == version:
+            return self._compressed[1]
+
+        if self._compressing is None or self._compressing[0] != version:
+            self._compressing = (version, self.hass.loop.run_in_executor(
+                None, gzip.compress, payload))
+
+        compressing = self._compressing
+        compressed = yield from asyncio.shield(compressing[1],
+                                               loop=self.hass.loop)
+
+        if self._compressing is compressing:
+            self._compressing = None
+            self._compressed = (version, compressed)
+
+        return compressed
+
+
 class BootstrapView(HomeAssistantView):
     """View to bootstrap frontend with all needed data."""
 
     url = "/api/bootstrap"
     name = "api:bootstrap"
 
-    @callback
+    @asyncio.coroutine
     def get(self, request):
         """Return all data needed to bootstrap Home Assistant."""
-        hass = request.app['hass']
+        cache = request.app['hass'].data[DATA_BOOTSTRAP_CACHE]
+        headers = {hdrs.VARY: hdrs.ACCEPT_ENCODING}
+
+        if 'gzip' in request.headers.get(hdrs.ACCEPT_ENCODING, ''):
+            body = yield from cache.async_compressed_payload()
+            headers[hdrs.CONTENT_ENCODING] = 'gzip'
+        else:
+            body = cache.async_payload()
 
-        return self.json({
-            'config': hass.config.as_dict(),
-            'states': hass.states.async_all(),
-            'events': api.async_events_json(hass),
-            'services': api.async_services_json(hass),
-            'panels': hass.data[DATA_PANELS],
-        })
+        return web.Response(body=body, content_type=CONTENT_TYPE_JSON,
+                            headers=headers)
 
 
 class IndexView(HomeAssistantView):
@@ -0,0 +1,181 @@
+"""Bounded message buffers for streaming API clients."""
+import asyncio
+from collections import OrderedDict
+from itertools import count
+import logging
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+DATA_STREAM_QUEUES = 'http_stream_queues'
+
+# Drop the oldest queued message when the buffer is full
+POLICY_DROP_OLDEST = 'drop_oldest'
+# Replace the queued message with the same key, else drop the oldest
+POLICY_COALESCE = 'coalesce'
+# Close the connection when the buffer is full
+POLICY_DISCONNECT = 'disconnect'
+
+POLICIES = (POLICY_DROP_OLDEST, POLICY_COALESCE, POLICY_DISCONNECT)
+
+DEFAULT_MAX_SIZE = 1000
+DEFAULT_POLICY = POLICY_COALESCE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StreamOverflowError(HomeAssistantError):
+    """Raised when a client with disconnect policy is too slow."""
+
+
+class StreamQueue(object):
+    """Bounded per-connection buffer of outgoing messages.
+
+    Messages can be given a key. When the buffer is full and the coalesce
+    policy is used, the latest queued message with the same key is replaced
+    by the new message, for example the pending state change of the same
+    entity.
+    """
+
+    def __init__(self, hass, name, maxsize=DEFAULT_MAX_SIZE,
+                 policy=DEFAULT_POLICY):
+        """Initialize the stream queue."""
+        self.hass = hass
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.overflowed = False
+        self.closed = False
+        self._items = OrderedDict()
+        self._keys = {}
+        self._ids = count()
+        self._waiter = None
+
+    @property
+    def depth(self):
+        """Return the number of queued messages."""
+        return len(self._items)
+
+    @callback
+    def async_register(self):
+        """Make the metrics of this queue available.
+
+        Returns function to unregister the queue.
+        """
+        queues = self.hass.data.setdefault(DATA_STREAM_QUEUES, set())
+        queues.add(self)
+
+        @callback
+        def unregister():
+            """Remove the queue from the metrics."""
+            queues.discard(self)
+
+        return unregister
+
+    @callback
+    def async_put(self, message, key=None):
+        """Add a message to the queue.
+
+        This method must be run in the event loop.
+        """
+        if self.closed or self.overflowed:
+            return
+
+        full = len(self._items) >= self.maxsize
+
+        if full and self.policy == POLICY_COALESCE and key in self._keys:
+            self._items[self._keys[key]] = (key, message)
+            self.coalesced += 1
+            return
+
+        if full:
+            if self.policy == POLICY_DISCONNECT:
+                _LOGGER.warning('Stream %s is too slow, disconnecting',
+                                self.name)
+                self.overflowed = True
+                self._wakeup()
+                return
+
+            if not self.dropped:
+                _LOGGER.warning('Stream %s is too slow, dropping messages',
+                                self.name)
+
+            self._pop()
+            self.dropped += 1
+
+        msg_id = next(self._ids)
+        self._items[msg_id] = (key, message)
+        if key is not None:
+            self._keys[key] = msg_id
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._wakeup()
+
+    @asyncio.coroutine
+    def async_get(self):
+        """Return the next message.
+
+        Returns None if the queue has been closed and is empty. Raises
+        StreamOverflowError if the client has been too slow.
+
+        This method is a coroutine.
+        """
+        while not self._items:
+            if self.overflowed:
+                raise StreamOverflowError(
+                    'Stream {} overflowed'.format(self.name))
+
+            if self.closed:
+                return None
+
+            self._waiter = asyncio.Future(loop=self.hass.loop)
+            yield from self._waiter
+
+        if self.overflowed:
+            raise StreamOverflowError(
+                'Stream {} overflowed'.format(self.name))
+
+        return self._pop()
+
+    @callback
+    def async_close(self):
+        """Stop accepting messages, queued messages can still be read."""
+        self.closed = True
+        self._wakeup()
+
+    def _pop(self):
+        """Remove and return the oldest message."""
+        msg_id, (key, message) = self._items.popitem(last=False)
+        if key is not None and self._keys.get(key) == msg_id:
+            del self._keys[key]
+        return message
+
+    def _wakeup(self):
+        """Wake up the reader waiting for a message."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def as_dict(self):
+        """Return the metrics of this queue."""
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'max_size': self.maxsize,
+            'depth': len(self._items),
+            'max_depth': self.max_depth,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+        }
+
+
+@callback
+def async_stream_metrics(hass):
+    """Return the metrics of all open streams.
+
+    This method must be run in the event loop.
+    """
+    return sorted((queue.as_dict() for queue
+                   in hass.data.get(DATA_STREAM_QUEUES, ())),
+                  key=lambda metrics: metrics['name'])
@@ -237,29 +237,15 @@ def async_setup(hass, config):
         if color_name is not None:
             params[ATTR_RGB_COLOR] = color_util.color_name_to_rgb(color_name)
 
-        for light in target_lights:
-            if service.service == SERVICE_TURN_ON:
-                yield from light.async_turn_on(**params)
-            elif service.service == SERVICE_TURN_OFF:
-                yield from light.async_turn_off(**params)
-            else:
-                yield from light.async_toggle(**params)
-
-        update_tasks = []
-
-        for light in target_lights:
-            if not light.should_poll:
-                continue
-
-            update_coro = hass.loop.create_task(
-                light.async_update_ha_state(True))
-            if hasattr(light, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        if service.service == SERVICE_TURN_ON:
+            method = 'async_turn_on'
+        elif service.service == SERVICE_TURN_OFF:
+            method = 'async_turn_off'
+        else:
+            method = 'async_toggle'
+
+        yield from component.async_call_entities(
+            target_lights, method, **params)
 
     # Listen for light on and light off service calls.
     descriptions = yield from hass.loop.run_in_executor(
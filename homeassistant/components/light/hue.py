@@ -4,17 +4,16 @@ Support for Hue lights.
 For more details about this platform, please refer to the documentation at
 https://home-assistant.io/components/light.hue/
 """
+import asyncio
 import json
 import logging
 import os
 import random
 import socket
-from datetime import timedelta
 from urllib.parse import urlparse
 
 import voluptuous as vol
 
-import homeassistant.util as util
 import homeassistant.util.color as color_util
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS, ATTR_COLOR_TEMP, ATTR_EFFECT, ATTR_FLASH, ATTR_RGB_COLOR,
@@ -24,6 +23,7 @@ from homeassistant.components.light import (
     SUPPORT_XY_COLOR, Light, PLATFORM_SCHEMA)
 from homeassistant.config import load_yaml_config_file
 from homeassistant.const import (CONF_FILENAME, CONF_HOST, DEVICE_DEFAULT_NAME)
+from homeassistant.helpers.hub import HubScheduler
 from homeassistant.loader import get_component
 import homeassistant.helpers.config_validation as cv
 
@@ -41,9 +41,6 @@ DEFAULT_ALLOW_UNREACHABLE = False
 DOMAIN = "light"
 SERVICE_HUE_SCENE = "hue_activate_scene"
 
-MIN_TIME_BETWEEN_SCANS = timedelta(seconds=10)
-MIN_TIME_BETWEEN_FORCED_SCANS = timedelta(milliseconds=100)
-
 PHUE_CONFIG_FILE = 'phue.conf'
 
 SUPPORT_HUE = (SUPPORT_BRIGHTNESS | SUPPORT_COLOR_TEMP | SUPPORT_EFFECT |
@@ -145,7 +142,6 @@ def setup_bridge(host, hass, add_devices, filename, allow_unreachable):
     lightgroups = {}
     skip_groups = False
 
-    @util.Throttle(MIN_TIME_BETWEEN_SCANS, MIN_TIME_BETWEEN_FORCED_SCANS)
     def update_lights():
         """Update the Hue light objects with latest info from the bridge."""
         nonlocal skip_groups
@@ -183,8 +179,8 @@ def setup_bridge(host, hass, add_devices, filename, allow_unreachable):
         for light_id, info in api_lights.items():
             if light_id not in lights:
                 lights[light_id] = HueLight(int(light_id), info,
-                                            bridge, update_lights,
-                                            bridge_type, allow_unreachable)
+                                            scheduler, bridge_type,
+                                            allow_unreachable)
                 new_lights.append(lights[light_id])
             else:
                 lights[light_id].info = info
@@ -199,8 +195,8 @@ def setup_bridge(host, hass, add_devices, filename, allow_unreachable):
 
             if lightgroup_id not in lightgroups:
                 lightgroups[lightgroup_id] = HueLight(
-                    int(lightgroup_id), info, bridge, update_lights,
-                    bridge_type, allow_unreachable, True)
+                    int(lightgroup_id), info, scheduler, bridge_type,
+                    allow_unreachable, True)
                 new_lights.append(lightgroups[lightgroup_id])
             else:
                 lightgroups[lightgroup_id].info = info
@@ -209,6 +205,31 @@ def setup_bridge(host, hass, add_devices, filename, allow_unreachable):
         if new_lights:
             add_devices(new_lights)
 
+    def send_command(target, command):
+        """Send a command to a light or group of lights."""
+        is_group, light_id = target
+
+        if is_group:
+            bridge.set_group(light_id, command)
+        else:
+            bridge.set_light(light_id, command)
+
+    def find_group(targets):
+        """Return the group that contains exactly the targeted lights."""
+        if any(is_group for is_group, _ in targets):
+            return None
+
+        light_ids = set(str(light_id) for _, light_id in targets)
+
+        for lightgroup_id, lightgroup in list(lightgroups.items()):
+            if set(lightgroup.info.get('lights', ())) == light_ids:
+                return True, int(lightgroup_id)
+
+        return None
+
+    # Share the bridge between all lights to respect its rate limit
+    scheduler = HubScheduler(hass, send_command, update_lights, find_group)
+
     _CONFIGURED_BRIDGES[socket.gethostbyname(host)] = True
 
     # create a service for calling run_scene directly on the bridge,
@@ -258,22 +279,16 @@ def request_configuration(host, hass, add_devices, filename,
 class HueLight(Light):
     """Representation of a Hue light."""
 
-    def __init__(self, light_id, info, bridge, update_lights,
-                 bridge_type, allow_unreachable, is_group=False):
+    def __init__(self, light_id, info, scheduler, bridge_type,
+                 allow_unreachable, is_group=False):
         """Initialize the light."""
         self.light_id = light_id
         self.info = info
-        self.bridge = bridge
-        self.update_lights = update_lights
+        self.scheduler = scheduler
         self.bridge_type = bridge_type
         self.allow_unreachable = allow_unreachable
         self.is_group = is_group
 
-        if is_group:
-            self._command_func = self.bridge.set_group
-        else:
-            self._command_func = self.bridge.set_light
-
     @property
     def unique_id(self):
         """Return the ID of this Hue light."""
@@ -326,8 +341,12 @@ class HueLight(Light):
         """Flag supported features."""
         return SUPPORT_HUE
 
-    def turn_on(self, **kwargs):
-        """Turn the specified or all lights on."""
+    @asyncio.coroutine
+    def async_turn_on(self, **kwargs):
+        """Turn the specified or all lights on.
+
+        This method is a coroutine.
+        """
         command = {'on': True}
 
         if ATTR_TRANSITION in kwargs:
@@ -368,10 +387,14 @@ class HueLight(Light):
         elif self.bridge_type == 'hue':
             command['effect'] = 'none'
 
-        self._command_func(self.light_id, command)
+        self.scheduler.async_send((self.is_group, self.light_id), command)
 
-    def turn_off(self, **kwargs):
-        """Turn the specified or all lights off."""
+    @asyncio.coroutine
+    def async_turn_off(self, **kwargs):
+        """Turn the specified or all lights off.
+
+        This method is a coroutine.
+        """
         command = {'on': False}
 
         if ATTR_TRANSITION in kwargs:
@@ -390,8 +413,12 @@ class HueLight(Light):
         elif self.bridge_type == 'hue':
             command['alert'] = 'none'
 
-        self._command_func(self.light_id, command)
+        self.scheduler.async_send((self.is_group, self.light_id), command)
+
+    @asyncio.coroutine
+    def async_update(self):
+        """Synchronize state with bridge.
 
-    def update(self):
-        """Synchronize state with bridge."""
-        self.update_lights(no_throttle=True)
+        This method is a coroutine.
+        """
+        yield from self.scheduler.async_update()
@@ -49,8 +49,14 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     """Find and add Z-Wave lights."""
     if discovery_info is None or zwave.NETWORK is None:
         return
-    node = zwave.NETWORK.nodes[discovery_info[zwave.const.ATTR_NODE_ID]]
-    value = node.values[discovery_info[zwave.const.ATTR_VALUE_ID]]
+
+    zwave.setup_discovered_values(
+        hass, discovery_info, add_devices, setup_value)
+
+
+def setup_value(hass, value, add_devices):
+    """Set up a light for a discovered Z-Wave value."""
+    node = value.node
     customize = hass.data['zwave_customize']
     name = '{}.{}'.format(DOMAIN, zwave.object_id(value))
     node_config = customize.get(name, {})
@@ -87,9 +93,6 @@ class ZwaveDimmer(zwave.ZWaveDeviceEntity, Light):
 
     def __init__(self, value, refresh, delay):
         """Initialize the light."""
-        from openzwave.network import ZWaveNetwork
-        from pydispatch import dispatcher
-
         zwave.ZWaveDeviceEntity.__init__(self, value, DOMAIN)
         self._brightness = None
         self._state = None
@@ -115,8 +118,8 @@ class ZwaveDimmer(zwave.ZWaveDeviceEntity, Light):
         self._timer = None
         _LOGGER.debug('self._refreshing=%s self.delay=%s',
                       self._refresh_value, self._delay)
-        dispatcher.connect(
-            self._value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED)
+        zwave.connect_value_changed(
+            self._value_changed, value, node=True)
 
     def update_properties(self):
         """Update internal properties based on zwave values."""
@@ -79,17 +79,12 @@ def setup(hass, config):
 
         code = service.data.get(ATTR_CODE)
 
-        for item in target_locks:
-            if service.service == SERVICE_LOCK:
-                item.lock(code=code)
-            else:
-                item.unlock(code=code)
+        if service.service == SERVICE_LOCK:
+            method = 'lock'
+        else:
+            method = 'unlock'
 
-        for item in target_locks:
-            if not item.should_poll:
-                continue
-
-            item.update_ha_state(True)
+        component.call_entities(target_locks, method, code=code)
 
     descriptions = load_yaml_config_file(
         os.path.join(os.path.dirname(__file__), 'services.yaml'))
@@ -41,9 +41,12 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     if discovery_info is None or zwave.NETWORK is None:
         return
 
-    node = zwave.NETWORK.nodes[discovery_info[zwave.const.ATTR_NODE_ID]]
-    value = node.values[discovery_info[zwave.const.ATTR_VALUE_ID]]
+    zwave.setup_discovered_values(
+        hass, discovery_info, add_devices, setup_value)
 
+
+def setup_value(hass, value, add_devices):
+    """Set up a lock for a discovered Z-Wave value."""
     if value.command_class != zwave.const.COMMAND_CLASS_DOOR_LOCK:
         return
     if value.type != zwave.const.TYPE_BOOL:
@@ -60,16 +63,13 @@ class ZwaveLock(zwave.ZWaveDeviceEntity, LockDevice):
 
     def __init__(self, value):
         """Initialize the Z-Wave switch device."""
-        from openzwave.network import ZWaveNetwork
-        from pydispatch import dispatcher
-
         zwave.ZWaveDeviceEntity.__init__(self, value, DOMAIN)
 
         self._node = value.node
         self._state = None
         self._notification = None
-        dispatcher.connect(
-            self._value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED)
+        zwave.connect_value_changed(
+            self._value_changed, value, node=True)
         self.update_properties()
 
     def _value_changed(self, value):
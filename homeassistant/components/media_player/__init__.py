@@ -358,22 +358,8 @@ def async_setup(hass, config):
                 service.data.get(ATTR_MEDIA_ENQUEUE)
         target_players = component.async_extract_from_service(service)
 
-        update_tasks = []
-        for player in target_players:
-            yield from getattr(player, method['method'])(**params)
-
-        for player in target_players:
-            if not player.should_poll:
-                continue
-
-            update_coro = player.async_update_ha_state(True)
-            if hasattr(player, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_players, method['method'], **params)
 
     for service in SERVICE_TO_METHOD:
         schema = SERVICE_TO_METHOD[service].get(
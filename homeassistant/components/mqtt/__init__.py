@@ -4,7 +4,7 @@ Support for MQTT message handling.
 For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/mqtt/
 """
-import asyncio
+from collections import deque
 import logging
 import os
 import socket
@@ -14,12 +14,14 @@ import voluptuous as vol
 
 from homeassistant.bootstrap import prepare_setup_platform
 from homeassistant.config import load_yaml_config_file
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import template, config_validation as cv
 from homeassistant.helpers.event import threaded_listener_factory
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP, CONF_VALUE_TEMPLATE,
     CONF_USERNAME, CONF_PASSWORD, CONF_PORT, CONF_PROTOCOL, CONF_PAYLOAD)
+from homeassistant.components.mqtt.router import TopicRouter
 from homeassistant.components.mqtt.server import HBMQTT_CONFIG_SCHEMA
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +33,9 @@ MQTT_CLIENT = None
 SERVICE_PUBLISH = 'publish'
 EVENT_MQTT_MESSAGE_RECEIVED = 'mqtt_message_received'
 
+DATA_MQTT_ROUTER = 'mqtt_router'
+DATA_MQTT_FIRE_EVENTS = 'mqtt_fire_events'
+
 REQUIREMENTS = ['paho-mqtt==1.2']
 
 CONF_EMBEDDED = 'embedded'
@@ -41,6 +46,7 @@ CONF_CERTIFICATE = 'certificate'
 CONF_CLIENT_KEY = 'client_key'
 CONF_CLIENT_CERT = 'client_cert'
 CONF_TLS_INSECURE = 'tls_insecure'
+CONF_FIRE_EVENTS = 'fire_events'
 
 CONF_BIRTH_MESSAGE = 'birth_message'
 CONF_WILL_MESSAGE = 'will_message'
@@ -58,6 +64,7 @@ DEFAULT_KEEPALIVE = 60
 DEFAULT_QOS = 0
 DEFAULT_RETAIN = False
 DEFAULT_PROTOCOL = PROTOCOL_311
+DEFAULT_FIRE_EVENTS = True
 
 ATTR_TOPIC = 'topic'
 ATTR_PAYLOAD = 'payload'
@@ -111,7 +118,9 @@ CONFIG_SCHEMA = vol.Schema({
             vol.All(cv.string, vol.In([PROTOCOL_31, PROTOCOL_311])),
         vol.Optional(CONF_EMBEDDED): HBMQTT_CONFIG_SCHEMA,
         vol.Optional(CONF_WILL_MESSAGE): MQTT_WILL_BIRTH_SCHEMA,
-        vol.Optional(CONF_BIRTH_MESSAGE): MQTT_WILL_BIRTH_SCHEMA
+        vol.Optional(CONF_BIRTH_MESSAGE): MQTT_WILL_BIRTH_SCHEMA,
+        vol.Optional(CONF_FIRE_EVENTS, default=DEFAULT_FIRE_EVENTS):
+            cv.boolean,
     }),
 }, extra=vol.ALLOW_EXTRA)
 
@@ -170,19 +179,9 @@ def publish_template(hass, topic, payload_template, qos=None, retain=None):
     hass.services.call(DOMAIN, SERVICE_PUBLISH, data)
 
 
-def async_subscribe(hass, topic, callback, qos=DEFAULT_QOS):
+def async_subscribe(hass, topic, msg_callback, qos=DEFAULT_QOS):
     """Subscribe to an MQTT topic."""
-    @asyncio.coroutine
-    def mqtt_topic_subscriber(event):
-        """Match subscribed MQTT topic."""
-        if not _match_topic(topic, event.data[ATTR_TOPIC]):
-            return
-
-        hass.async_run_job(callback, event.data[ATTR_TOPIC],
-                           event.data[ATTR_PAYLOAD], event.data[ATTR_QOS])
-
-    async_remove = hass.bus.async_listen(EVENT_MQTT_MESSAGE_RECEIVED,
-                                         mqtt_topic_subscriber)
+    async_remove = _async_router(hass).add(topic, msg_callback)
 
     # Future: track subscriber count and unsubscribe in remove
     MQTT_CLIENT.subscribe(topic, qos)
@@ -190,6 +189,34 @@ def async_subscribe(hass, topic, callback, qos=DEFAULT_QOS):
     return async_remove
 
 
+@callback
+def async_dispatch_message(hass, topic, payload, qos):
+    """Pass a received message to the subscribers of matching topics.
+
+    Fires an EVENT_MQTT_MESSAGE_RECEIVED event unless disabled.
+
+    This method must be run in the event loop.
+    """
+    for msg_callback in _async_router(hass).match(topic):
+        hass.async_add_job(msg_callback, topic, payload, qos)
+
+    if hass.data.get(DATA_MQTT_FIRE_EVENTS, DEFAULT_FIRE_EVENTS):
+        hass.bus.async_fire(EVENT_MQTT_MESSAGE_RECEIVED, {
+            ATTR_TOPIC: topic,
+            ATTR_QOS: qos,
+            ATTR_PAYLOAD: payload,
+        })
+
+
+@callback
+def _async_router(hass):
+    """Return the router of the subscriptions."""
+    router = hass.data.get(DATA_MQTT_ROUTER)
+    if router is None:
+        router = hass.data[DATA_MQTT_ROUTER] = TopicRouter()
+    return router
+
+
 # pylint: disable=invalid-name
 subscribe = threaded_listener_factory(async_subscribe)
 
@@ -218,6 +245,8 @@ def setup(hass, config):
     conf = config.get(DOMAIN, {})
 
     client_id = conf.get(CONF_CLIENT_ID)
+    hass.data[DATA_MQTT_FIRE_EVENTS] = conf.get(CONF_FIRE_EVENTS,
+                                                DEFAULT_FIRE_EVENTS)
     keepalive = conf.get(CONF_KEEPALIVE)
 
     broker_config = _setup_server(hass, config)
@@ -317,6 +346,12 @@ class MQTT(object):
         self.topics = {}
         self.progress = {}
         self.birth_message = birth_message
+        # Received messages waiting to be processed by the event loop
+        self._messages = deque()
+        self._processing_scheduled = False
+        self._wakeups = 0
+        self._processed = 0
+        self._max_batch = 0
 
         if protocol == PROTOCOL_31:
             proto = mqtt.MQTTv31
@@ -362,6 +397,20 @@ class MQTT(object):
         """Stop the MQTT client."""
         self._mqttc.disconnect()
         self._mqttc.loop_stop()
+        _LOGGER.info("Processed %(messages)d messages in %(wakeups)d "
+                     "wakeups, %(messages_per_wakeup).1f per wakeup and at "
+                     "most %(max_batch)d", self.stats())
+
+    def stats(self):
+        """Return statistics about the handoff of received messages."""
+        return {
+            'depth': len(self._messages),
+            'wakeups': self._wakeups,
+            'messages': self._processed,
+            'messages_per_wakeup':
+                self._processed / self._wakeups if self._wakeups else 0,
+            'max_batch': self._max_batch,
+        }
 
     def subscribe(self, topic, qos):
         """Subscribe to a topic."""
@@ -430,11 +479,36 @@ class MQTT(object):
         else:
             _LOGGER.debug("Received message on %s: %s",
                           msg.topic, payload)
-            self.hass.bus.fire(EVENT_MQTT_MESSAGE_RECEIVED, {
-                ATTR_TOPIC: msg.topic,
-                ATTR_QOS: msg.qos,
-                ATTR_PAYLOAD: payload,
-            })
+            # Messages are processed in batches to wake up the event loop
+            # once for all messages that arrive before it gets to run.
+            self._messages.append((msg.topic, payload, msg.qos))
+
+            if not self._processing_scheduled:
+                self._processing_scheduled = True
+                self.hass.loop.call_soon_threadsafe(
+                    self._async_process_messages)
+
+    @callback
+    def _async_process_messages(self):
+        """Dispatch the received messages in the order they arrived.
+
+        This method must be run in the event loop.
+        """
+        # Reset before processing, messages that are added from now on will
+        # schedule a new run if they are not processed by this one.
+        self._processing_scheduled = False
+        batch = len(self._messages)
+
+        if not batch:
+            return
+
+        for _ in range(batch):
+            topic, payload, qos = self._messages.popleft()
+            async_dispatch_message(self.hass, topic, payload, qos)
+
+        self._wakeups += 1
+        self._processed += batch
+        self._max_batch = max(self._max_batch, batch)
 
     def _mqtt_on_unsubscribe(self, _mqttc, _userdata, mid, granted_qos):
         """Unsubscribe successful callback."""
@@ -482,16 +556,3 @@ def _raise_on_error(result):
     """Raise error if error result."""
     if result != 0:
         raise HomeAssistantError('Error talking to MQTT: {}'.format(result))
-
-
-def _match_topic(subscription, topic):
-    """Test if topic matches subscription."""
-    if subscription.endswith('#'):
-        return (subscription[:-2] == topic or
-                topic.startswith(subscription[:-1]))
-
-    sub_parts = subscription.split('/')
-    topic_parts = topic.split('/')
-
-    return (len(sub_parts) == len(topic_parts) and
-            all(a == b for a, b in zip(sub_parts, topic_parts) if a != '+'))
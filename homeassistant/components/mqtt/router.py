@@ -0,0 +1,98 @@
+"""Route MQTT messages to the subscribers of matching topics."""
+
+
+class _Node(object):
+    """A level of the subscription topics."""
+
+    __slots__ = ['children', 'subscribers']
+
+    def __init__(self):
+        """Initialize the level."""
+        self.children = {}
+        self.subscribers = []
+
+
+class TopicRouter(object):
+    """Trie of subscription topics with support for + and # wildcards.
+
+    Matching a topic only visits the levels of the subscriptions that can
+    match, instead of testing every subscription.
+    """
+
+    def __init__(self):
+        """Initialize the router."""
+        self._root = _Node()
+
+    def add(self, topic, subscriber):
+        """Add a subscriber for a subscription topic.
+
+        Returns function to remove the subscriber.
+        """
+        node = self._root
+        for level in topic.split('/'):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+
+        node.subscribers.append(subscriber)
+
+        def remove():
+            """Remove the subscriber."""
+            self._remove(topic, subscriber)
+
+        return remove
+
+    def _remove(self, topic, subscriber):
+        """Remove a subscriber and the levels that became unused."""
+        path = [(None, self._root)]
+        for level in topic.split('/'):
+            node = path[-1][1].children.get(level)
+            if node is None:
+                return
+            path.append((level, node))
+
+        try:
+            path[-1][1].subscribers.remove(subscriber)
+        except ValueError:
+            return
+
+        for (_, parent), (level, node) in zip(reversed(path[:-1]),
+                                             reversed(path[1:])):
+            if node.children or node.subscribers:
+                break
+            del parent.children[level]
+
+    def match(self, topic):
+        """Return the subscribers of all subscriptions matching topic."""
+        matches = []
+        nodes = [self._root]
+
+        for level in topic.split('/'):
+            next_nodes = []
+            keys = (level, '+') if level != '+' else ('+',)
+
+            for node in nodes:
+                wildcard = node.children.get('#')
+                if wildcard is not None:
+                    matches.extend(wildcard.subscribers)
+
+                for key in keys:
+                    child = node.children.get(key)
+                    if child is not None:
+                        next_nodes.append(child)
+
+            if not next_nodes:
+                return matches
+
+            nodes = next_nodes
+
+        for node in nodes:
+            matches.extend(node.subscribers)
+
+            # topic/# also matches topic itself
+            wildcard = node.children.get('#')
+            if wildcard is not None:
+                matches.extend(wildcard.subscribers)
+
+        return matches
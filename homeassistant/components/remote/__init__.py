@@ -98,29 +98,16 @@ def async_setup(hass, config):
         device = service.data.get(ATTR_DEVICE)
         command = service.data.get(ATTR_COMMAND)
 
-        for remote in target_remotes:
-            if service.service == SERVICE_TURN_ON:
-                yield from remote.async_turn_on(activity=activity_id)
-            elif service.service == SERVICE_SEND_COMMAND:
-                yield from remote.async_send_command(
-                    device=device, command=command)
-            else:
-                yield from remote.async_turn_off()
-
-        update_tasks = []
-        for remote in target_remotes:
-            if not remote.should_poll:
-                continue
-
-            update_coro = hass.loop.create_task(
-                remote.async_update_ha_state(True))
-            if hasattr(remote, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        if service.service == SERVICE_TURN_ON:
+            yield from component.async_call_entities(
+                target_remotes, 'async_turn_on', activity=activity_id)
+        elif service.service == SERVICE_SEND_COMMAND:
+            yield from component.async_call_entities(
+                target_remotes, 'async_send_command',
+                device=device, command=command)
+        else:
+            yield from component.async_call_entities(
+                target_remotes, 'async_turn_off')
 
     descriptions = yield from hass.loop.run_in_executor(
         None, load_yaml_config_file, os.path.join(
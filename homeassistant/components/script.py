@@ -32,6 +32,7 @@ CONF_SEQUENCE = "sequence"
 ATTR_VARIABLES = 'variables'
 ATTR_LAST_ACTION = 'last_action'
 ATTR_CAN_CANCEL = 'can_cancel'
+ATTR_STEP_TIMES = 'step_times'
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -159,6 +160,10 @@ class ScriptEntity(ToggleEntity):
             attrs[ATTR_CAN_CANCEL] = self.script.can_cancel
         if self.script.last_action:
             attrs[ATTR_LAST_ACTION] = self.script.last_action
+        if self.script.step_times:
+            attrs[ATTR_STEP_TIMES] = [
+                (action, round(seconds, 3))
+                for action, seconds in self.script.step_times]
         return attrs
 
     @property
@@ -26,9 +26,13 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     if discovery_info is None or zwave.NETWORK is None:
         return
 
-    node = zwave.NETWORK.nodes[discovery_info[zwave.const.ATTR_NODE_ID]]
-    value = node.values[discovery_info[zwave.const.ATTR_VALUE_ID]]
+    zwave.setup_discovered_values(
+        hass, discovery_info, add_devices, setup_value)
 
+
+def setup_value(hass, value, add_devices):
+    """Set up a sensor for a discovered Z-Wave value."""
+    node = value.node
     value.set_change_verified(False)
 
     # if 1 in groups and (NETWORK.controller.node_id not in
@@ -53,13 +57,10 @@ class ZWaveSensor(zwave.ZWaveDeviceEntity, Entity):
 
     def __init__(self, sensor_value):
         """Initialize the sensor."""
-        from openzwave.network import ZWaveNetwork
-        from pydispatch import dispatcher
-
         zwave.ZWaveDeviceEntity.__init__(self, sensor_value, DOMAIN)
 
-        dispatcher.connect(
-            self.value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED)
+        zwave.connect_value_changed(
+            self.value_changed, sensor_value, node=True)
 
     @property
     def state(self):
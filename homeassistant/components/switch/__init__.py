@@ -82,28 +82,14 @@ def async_setup(hass, config):
         """Handle calls to the switch services."""
         target_switches = component.async_extract_from_service(service)
 
-        for switch in target_switches:
-            if service.service == SERVICE_TURN_ON:
-                yield from switch.async_turn_on()
-            elif service.service == SERVICE_TOGGLE:
-                yield from switch.async_toggle()
-            else:
-                yield from switch.async_turn_off()
-
-        update_tasks = []
-        for switch in target_switches:
-            if not switch.should_poll:
-                continue
-
-            update_coro = hass.loop.create_task(
-                switch.async_update_ha_state(True))
-            if hasattr(switch, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        if service.service == SERVICE_TURN_ON:
+            method = 'async_turn_on'
+        elif service.service == SERVICE_TOGGLE:
+            method = 'async_toggle'
+        else:
+            method = 'async_turn_off'
+
+        yield from component.async_call_entities(target_switches, method)
 
     descriptions = yield from hass.loop.run_in_executor(
         None, load_yaml_config_file, os.path.join(
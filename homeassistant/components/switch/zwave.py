@@ -19,9 +19,13 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     if discovery_info is None or zwave.NETWORK is None:
         return
 
-    node = zwave.NETWORK.nodes[discovery_info[zwave.const.ATTR_NODE_ID]]
-    value = node.values[discovery_info[zwave.const.ATTR_VALUE_ID]]
+    zwave.setup_discovered_values(
+        hass, discovery_info, add_devices, setup_value)
 
+
+def setup_value(hass, value, add_devices):
+    """Set up a switch for a discovered Z-Wave value."""
+    node = value.node
     if not node.has_command_class(zwave.const.COMMAND_CLASS_SWITCH_BINARY):
         return
     if value.type != zwave.const.TYPE_BOOL or value.genre != \
@@ -37,14 +41,11 @@ class ZwaveSwitch(zwave.ZWaveDeviceEntity, SwitchDevice):
 
     def __init__(self, value):
         """Initialize the Z-Wave switch device."""
-        from openzwave.network import ZWaveNetwork
-        from pydispatch import dispatcher
-
         zwave.ZWaveDeviceEntity.__init__(self, value, DOMAIN)
 
         self._state = value.data
-        dispatcher.connect(
-            self._value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED)
+        zwave.connect_value_changed(
+            self._value_changed, value)
 
     def _value_changed(self, value):
         """Called when a value has changed on the network."""
@@ -5,19 +5,22 @@ import json
 import logging
 
 from aiohttp import web
+import async_timeout
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.const import (
     MATCH_ALL, EVENT_TIME_CHANGED, EVENT_HOMEASSISTANT_STOP,
-    __version__)
+    EVENT_STATE_CHANGED, __version__)
 from homeassistant.components import frontend
-from homeassistant.core import callback
+from homeassistant.core import callback, split_entity_id
 from homeassistant.remote import JSONEncoder
 from homeassistant.helpers import config_validation as cv
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.http.auth import validate_password
 from homeassistant.components.http.const import KEY_AUTHENTICATED
+from homeassistant.components.http.stream import (
+    POLICY_DISCONNECT, StreamOverflowError, StreamQueue)
 
 DOMAIN = 'websocket_api'
 
@@ -28,6 +31,11 @@ ERR_ID_REUSE = 1
 ERR_INVALID_FORMAT = 2
 ERR_NOT_FOUND = 3
 
+DATA_STATE_VIEWS = 'websocket_api_state_views'
+
+# Time to flush queued messages when a connection is closed
+FLUSH_TIMEOUT = 5  # seconds
+
 TYPE_AUTH = 'auth'
 TYPE_AUTH_INVALID = 'auth_invalid'
 TYPE_AUTH_OK = 'auth_ok'
@@ -41,7 +49,9 @@ TYPE_GET_STATES = 'get_states'
 TYPE_PING = 'ping'
 TYPE_PONG = 'pong'
 TYPE_RESULT = 'result'
+TYPE_STATE_DIFF = 'state_diff'
 TYPE_SUBSCRIBE_EVENTS = 'subscribe_events'
+TYPE_SUBSCRIBE_STATES = 'subscribe_states'
 TYPE_UNSUBSCRIBE_EVENTS = 'unsubscribe_events'
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +69,14 @@ SUBSCRIBE_EVENTS_MESSAGE_SCHEMA = vol.Schema({
     vol.Optional('event_type', default=MATCH_ALL): str,
 })
 
+SUBSCRIBE_STATES_MESSAGE_SCHEMA = vol.Schema({
+    vol.Required('id'): cv.positive_int,
+    vol.Required('type'): TYPE_SUBSCRIBE_STATES,
+    vol.Optional('entity_ids', default=[]): cv.entity_ids,
+    vol.Optional('domains', default=[]):
+        vol.All(cv.ensure_list, [vol.All(cv.string, vol.Lower)]),
+})
+
 UNSUBSCRIBE_EVENTS_MESSAGE_SCHEMA = vol.Schema({
     vol.Required('id'): cv.positive_int,
     vol.Required('type'): TYPE_UNSUBSCRIBE_EVENTS,
@@ -102,6 +120,7 @@ BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({
     vol.Required('id'): cv.positive_int,
     vol.Required('type'): vol.Any(TYPE_CALL_SERVICE,
                                   TYPE_SUBSCRIBE_EVENTS,
+                                  TYPE_SUBSCRIBE_STATES,
                                   TYPE_UNSUBSCRIBE_EVENTS,
                                   TYPE_GET_STATES,
                                   TYPE_GET_SERVICES,
@@ -135,15 +154,91 @@ def auth_invalid_message(message):
     }
 
 
-def event_message(iden, event):
-    """Return an event message."""
+def event_message_json(iden, event):
+    """Return a serialized event message.
+
+    Reuses the JSON of the event that is shared by all subscribers.
+    """
+    return '{{"id": {}, "type": "{}", "event": {}}}'.format(
+        iden, TYPE_EVENT, event.as_json())
+
+
+def _coalesce_key(iden, event):
+    """Return key to coalesce state changes of an entity if client is slow."""
+    if event.event_type != EVENT_STATE_CHANGED:
+        return None
+    return (iden, event.data['entity_id'])
+
+
+def state_diff_message(entity_id, diff):
+    """Return a state_diff message without id.
+
+    The id is added per subscriber with add_message_id so that the message
+    only has to be serialized once.
+    """
+    return {
+        'type': TYPE_STATE_DIFF,
+        'entity_id': entity_id,
+        'diff': diff,
+    }
+
+
+def add_message_id(iden, message_json):
+    """Insert the message id into an already serialized message."""
+    return '{{"id": {}, {}'.format(iden, message_json[1:])
+
+
+def compact_state(state):
+    """Return the representation of a state used by subscribe_states."""
     return {
-        'id': iden,
-        'type': TYPE_EVENT,
-        'event': event.as_dict(),
+        'state': state.state,
+        'attributes': dict(state.attributes),
+        'last_changed': state.last_changed,
+        'last_updated': state.last_updated,
     }
 
 
+def state_diff(old_state, new_state):
+    """Return the changes to apply to old_state to get new_state.
+
+    Returns None if the entity has been removed and the full compact state
+    if the entity is new.
+    """
+    if new_state is None:
+        return None
+
+    if old_state is None:
+        return compact_state(new_state)
+
+    diff = {'last_updated': new_state.last_updated}
+
+    if new_state.state != old_state.state:
+        diff['state'] = new_state.state
+
+    if new_state.last_changed != old_state.last_changed:
+        diff['last_changed'] = new_state.last_changed
+
+    old_attr = old_state.attributes
+    new_attr = new_state.attributes
+    changed_keys = new_state.changed_attributes
+
+    if changed_keys is None:
+        changed_keys = set(new_attr).union(old_attr)
+
+    changed = {key: new_attr[key] for key in changed_keys
+               if key in new_attr and
+               (key not in old_attr or old_attr[key] != new_attr[key])}
+    if changed:
+        diff['attributes'] = changed
+
+    removed = [key for key in old_attr
+               if key in changed_keys and key not in new_attr]
+    if removed:
+        diff['removed_attributes'] = removed
+
+    return diff
+
+
 def error_message(iden, code, message):
     """Return an error result message."""
     return {
@@ -204,7 +299,9 @@ class ActiveConnection:
         self.hass = hass
         self.request = request
         self.wsock = None
+        self.socket_task = None
         self.event_listeners = {}
+        self.to_write = StreamQueue(hass, 'websocket {}'.format(id(self)))
 
     def debug(self, message1, message2=''):
         """Print a debug message."""
@@ -216,8 +313,37 @@ class ActiveConnection:
 
     def send_message(self, message):
         """Helper method to send messages."""
-        self.debug('Sending', message)
-        self.wsock.send_json(message, dumps=JSON_DUMP)
+        self.send_message_raw(JSON_DUMP(message))
+
+    def send_message_raw(self, message, key=None):
+        """Helper method to send already serialized messages.
+
+        Messages are queued and written by the writer task. If the client is
+        too slow, a queued message with the same key will be replaced.
+        """
+        self.to_write.async_put(message, key)
+
+    @asyncio.coroutine
+    def _writer(self):
+        """Write queued messages to the socket, waiting for the client."""
+        try:
+            while True:
+                message = yield from self.to_write.async_get()
+
+                if message is None:
+                    break
+
+                self.debug('Sending', message)
+                self.wsock.send_str(message)
+                yield from self.wsock.drain()
+
+        except StreamOverflowError:
+            self.log_error('Client too slow, closing connection')
+            self.socket_task.cancel()
+
+        except (RuntimeError, ConnectionResetError):
+            # Socket has been closed.
+            self.debug('Socket closed while sending')
 
     @asyncio.coroutine
     def handle(self):
@@ -226,13 +352,17 @@ class ActiveConnection:
         yield from wsock.prepare(self.request)
 
         # Set up to cancel this connection when Home Assistant shuts down
-        socket_task = asyncio.Task.current_task(loop=self.hass.loop)
+        socket_task = self.socket_task = asyncio.Task.current_task(
+            loop=self.hass.loop)
 
         @callback
         def cancel_connection(event):
             """Cancel this connection."""
             socket_task.cancel()
 
+        writer = self.hass.loop.create_task(self._writer())
+        unregister_queue = self.to_write.async_register()
+
         unsub_stop = self.hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP,
                                                 cancel_connection)
 
@@ -333,8 +463,17 @@ class ActiveConnection:
             for unsub in self.event_listeners.values():
                 unsub()
 
+            self.to_write.async_close()
+            unregister_queue()
+
+            try:
+                with async_timeout.timeout(FLUSH_TIMEOUT, loop=self.hass.loop):
+                    yield from writer
+            except asyncio.TimeoutError:
+                self.debug('Timeout flushing messages')
+
             yield from wsock.close()
-            self.debug('Closed connection')
+            self.debug('Closed connection', self.to_write.as_dict())
 
         return wsock
 
@@ -348,17 +487,37 @@ class ActiveConnection:
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            try:
-                self.send_message(event_message(msg['id'], event))
-            except RuntimeError:
-                # Socket has been closed.
-                pass
+            self.send_message_raw(event_message_json(msg['id'], event),
+                                  _coalesce_key(msg['id'], event))
 
         self.event_listeners[msg['id']] = self.hass.bus.async_listen(
             msg['event_type'], forward_events)
 
         self.send_message(result_message(msg['id']))
 
+    def handle_subscribe_states(self, msg):
+        """Handle subscribe states command."""
+        msg = SUBSCRIBE_STATES_MESSAGE_SCHEMA(msg)
+
+        views = self.hass.data.setdefault(DATA_STATE_VIEWS, {})
+        key = (frozenset(msg['entity_ids']), frozenset(msg['domains']))
+        view = views.get(key)
+
+        if view is None:
+            view = views[key] = StateView(self.hass, *key)
+
+        # Dropping a diff would corrupt the states of the client, close the
+        # connection instead so that the client subscribes again.
+        self.to_write.policy = POLICY_DISCONNECT
+
+        self.send_message(result_message(msg['id'], {
+            state.entity_id: compact_state(state)
+            for state in self.hass.states.async_all()
+            if view.matches(state.entity_id)}))
+
+        self.event_listeners[msg['id']] = view.async_subscribe(
+            self, msg['id'])
+
     def handle_unsubscribe_events(self, msg):
         """Handle unsubscribe events command."""
         msg = UNSUBSCRIBE_EVENTS_MESSAGE_SCHEMA(msg)
@@ -382,11 +541,7 @@ class ActiveConnection:
             """Helper to call a service and fire complete message."""
             yield from self.hass.services.async_call(
                 msg['domain'], msg['service'], msg['service_data'], True)
-            try:
-                self.send_message(result_message(msg['id']))
-            except RuntimeError:
-                # Socket has been closed.
-                pass
+            self.send_message(result_message(msg['id']))
 
         self.hass.async_add_job(call_service_helper(msg))
 
@@ -421,3 +576,69 @@ class ActiveConnection:
     def handle_ping(self, msg):
         """Handle ping command."""
         self.send_message(pong_message(msg['id']))
+
+
+class StateView(object):
+    """Stream state diffs to all connections using the same filters.
+
+    Each state change is serialized once and shared by all subscribers.
+    """
+
+    def __init__(self, hass, entity_ids, domains):
+        """Initialize the state view."""
+        self.hass = hass
+        self.key = (entity_ids, domains)
+        self.entity_ids = entity_ids
+        self.domains = domains
+        self.subscribers = set()
+        self._unsub_state_changed = None
+
+    def matches(self, entity_id):
+        """Return if entity_id is part of this view."""
+        if not self.entity_ids and not self.domains:
+            return True
+
+        return (entity_id in self.entity_ids or
+                split_entity_id(entity_id)[0] in self.domains)
+
+    @callback
+    def async_subscribe(self, connection, iden):
+        """Subscribe a connection to this view.
+
+        Returns function to unsubscribe.
+        """
+        subscriber = (connection, iden)
+        self.subscribers.add(subscriber)
+
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed)
+
+        @callback
+        def unsubscribe():
+            """Unsubscribe the connection from this view."""
+            self.subscribers.discard(subscriber)
+
+            if self.subscribers:
+                return
+
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+            self.hass.data[DATA_STATE_VIEWS].pop(self.key, None)
+
+        return unsubscribe
+
+    @callback
+    def _async_state_changed(self, event):
+        """Send the state diff to all subscribers."""
+        entity_id = event.data['entity_id']
+
+        if not self.matches(entity_id):
+            return
+
+        message = JSON_DUMP(state_diff_message(
+            entity_id, state_diff(event.data.get('old_state'),
+                                  event.data.get('new_state'))))
+
+        for connection, iden in list(self.subscribers):
+            connection.send_message_raw(add_message_id(iden, message))
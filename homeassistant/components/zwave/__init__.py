@@ -4,13 +4,17 @@ Support for Z-Wave.
 For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/zwave/
 """
+import asyncio
+from itertools import product
 import logging
 import os.path
+import threading
 import time
 from pprint import pprint
 
 import voluptuous as vol
 
+from homeassistant.core import callback
 from homeassistant.helpers import discovery
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL, ATTR_LOCATION, ATTR_ENTITY_ID, CONF_CUSTOMIZE,
@@ -44,8 +48,15 @@ DEFAULT_CONF_REFRESH_VALUE = False
 DEFAULT_CONF_REFRESH_DELAY = 2
 DOMAIN = 'zwave'
 
+# Seconds to collect discovered values before loading their platforms
+DISCOVERY_BATCH_DELAY = 0.5
+
 NETWORK = None
 
+# Listeners of changed values by value_id and by node_id
+VALUE_LISTENERS = {}
+NODE_LISTENERS = {}
+
 # List of tuple (DOMAIN, discovered service, supported command classes,
 # value type, genre type, specific device class).
 DISCOVERY_COMPONENTS = [
@@ -126,6 +137,24 @@ DISCOVERY_COMPONENTS = [
      const.GENRE_WHATEVER),
 ]
 
+
+def _compile_discovery_index():
+    """Index the discovery rules by generic, specific and command class."""
+    index = {}
+    for order, (component, generic_device_class, specific_device_class,
+                command_class, value_type, value_genre) in \
+            enumerate(DISCOVERY_COMPONENTS):
+        for key in product(generic_device_class, specific_device_class,
+                           command_class):
+            index.setdefault(key, []).append(
+                (order, component, value_type, value_genre))
+    return index
+
+
+_DISCOVERY_INDEX = _compile_discovery_index()
+# Matching rules per seen (generic, specific, command class)
+_DISCOVERY_RULES = {}
+
 RENAME_NODE_SCHEMA = vol.Schema({
     vol.Required(ATTR_ENTITY_ID): cv.entity_id,
     vol.Required(const.ATTR_NAME): cv.string,
@@ -213,6 +242,70 @@ def object_id(value):
     return _object_id
 
 
+def connect_value_changed(listener, value, node=False):
+    """Call listener when value changes, or any value of its node.
+
+    The zwave component owns the only connection to the value changed signal
+    and routes the changes to the interested listeners.
+    """
+    if node:
+        table, key = NODE_LISTENERS, value.node.node_id
+    else:
+        table, key = VALUE_LISTENERS, value.value_id
+
+    # Replace instead of append so value_changed can iterate without a lock
+    table[key] = table.get(key, ()) + (listener,)
+
+
+def _value_changed(value):
+    """Route a changed value to its listeners and those of its node."""
+    listeners = VALUE_LISTENERS.get(value.value_id, ()) + \
+        NODE_LISTENERS.get(value.node.node_id, ())
+
+    for listener in listeners:
+        try:
+            listener(value)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error handling changed value %s",
+                              value.value_id)
+
+
+def discovery_components(node, value):
+    """Return the components that support a value, in discovery order."""
+    key = (node.generic, node.specific, value.command_class)
+    rules = _DISCOVERY_RULES.get(key)
+
+    if rules is None:
+        rules = set()
+        for lookup in product(*({part, None} for part in key)):
+            rules.update(_DISCOVERY_INDEX.get(lookup, ()))
+        rules = _DISCOVERY_RULES[key] = sorted(rules)
+
+    return [component for _, component, value_type, value_genre in rules
+            if value_type in (None, value.type) and
+            value_genre in (None, value.genre)]
+
+
+def setup_discovered_values(hass, discovery_info, add_devices, setup_value):
+    """Set up the entities of a batch of discovered values.
+
+    setup_value is called with each value and adds its entities, which are
+    then added to Home Assistant at once.
+    """
+    devices = []
+
+    for node_id, value_id in discovery_info[const.ATTR_VALUES]:
+        value = NETWORK.nodes[node_id].values[value_id]
+
+        try:
+            setup_value(hass, value, devices.extend)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error setting up value %s", value_id)
+
+    if devices:
+        add_devices(devices)
+
+
 def nice_print_node(node):
     """Print a nice formatted node to the output (debug method)."""
     node_dict = _obj_to_dict(node)
@@ -300,44 +393,23 @@ def setup(hass, config):
 
         dispatcher.connect(log_all, weak=False)
 
+    pending_values = {}
+    pending_lock = threading.Lock()
+
+    @callback
+    def load_pending_platforms():
+        """Load the platforms of the values discovered since last time."""
+        with pending_lock:
+            batches = dict(pending_values)
+            pending_values.clear()
+
+        for component, values in batches.items():
+            hass.async_add_job(discovery.async_load_platform(
+                hass, component, DOMAIN, {const.ATTR_VALUES: values}, config))
+
     def value_added(node, value):
         """Called when a value is added to a node on the network."""
-        for (component,
-             generic_device_class,
-             specific_device_class,
-             command_class,
-             value_type,
-             value_genre) in DISCOVERY_COMPONENTS:
-
-            _LOGGER.debug("Component=%s Node_id=%s query start",
-                          component, node.node_id)
-            if node.generic not in generic_device_class and \
-               None not in generic_device_class:
-                _LOGGER.debug("node.generic %s not None and in "
-                              "generic_device_class %s",
-                              node.generic, generic_device_class)
-                continue
-            if node.specific not in specific_device_class and \
-               None not in specific_device_class:
-                _LOGGER.debug("node.specific %s is not None and in "
-                              "specific_device_class %s", node.specific,
-                              specific_device_class)
-                continue
-            if value.command_class not in command_class and \
-               None not in command_class:
-                _LOGGER.debug("value.command_class %s is not None "
-                              "and in command_class %s",
-                              value.command_class, command_class)
-                continue
-            if value_type != value.type and value_type is not None:
-                _LOGGER.debug("value.type %s != value_type %s",
-                              value.type, value_type)
-                continue
-            if value_genre != value.genre and value_genre is not None:
-                _LOGGER.debug("value.genre %s != value_genre %s",
-                              value.genre, value_genre)
-                continue
-
+        for component in discovery_components(node, value):
             # Configure node
             _LOGGER.debug("Adding Node_id=%s Generic_command_class=%s, "
                           "Specific_command_class=%s, "
@@ -361,10 +433,15 @@ def setup(hass, config):
             else:
                 value.disable_poll()
 
-            discovery.load_platform(hass, component, DOMAIN, {
-                const.ATTR_NODE_ID: node.node_id,
-                const.ATTR_VALUE_ID: value.value_id,
-            }, config)
+            # Values arrive in a burst, load their platforms in batches
+            with pending_lock:
+                if not pending_values:
+                    hass.loop.call_soon_threadsafe(
+                        hass.loop.call_later, DISCOVERY_BATCH_DELAY,
+                        load_pending_platforms)
+
+                pending_values.setdefault(component, []).append(
+                    (node.node_id, value.value_id))
 
     def scene_activated(node, scene_id):
         """Called when a scene is activated on any node in the network."""
@@ -394,8 +471,13 @@ def setup(hass, config):
                      " have been queried")
         hass.bus.fire(const.EVENT_NETWORK_COMPLETE)
 
+    VALUE_LISTENERS.clear()
+    NODE_LISTENERS.clear()
+
     dispatcher.connect(
         value_added, ZWaveNetwork.SIGNAL_VALUE_ADDED, weak=False)
+    dispatcher.connect(
+        _value_changed, ZWaveNetwork.SIGNAL_VALUE_CHANGED, weak=False)
     dispatcher.connect(
         scene_activated, ZWaveNetwork.SIGNAL_SCENE_EVENT, weak=False)
     dispatcher.connect(
@@ -607,6 +689,33 @@ class ZWaveDeviceEntity:
         """Initialize the z-Wave device."""
         self._value = value
         self.entity_id = "{}.{}".format(domain, self._object_id())
+        self._update_scheduled = False
+
+    def schedule_update_ha_state(self, force_refresh=False):
+        """Schedule a state update, coalescing a burst of value changes.
+
+        Value changes of a node often arrive in a burst, only the first one
+        of those that arrive before the state is written schedules a task.
+        """
+        if force_refresh:
+            super().schedule_update_ha_state(force_refresh)
+            return
+
+        if self._update_scheduled:
+            return
+
+        self._update_scheduled = True
+        self.hass.add_job(self._async_coalesced_update())
+
+    @asyncio.coroutine
+    def _async_coalesced_update(self):
+        """Write the state after a burst of value changes.
+
+        This method is a coroutine.
+        """
+        # Changes arriving from now on are not reflected in the state
+        self._update_scheduled = False
+        yield from self.async_update_ha_state()
 
     @property
     def should_poll(self):
@@ -6,6 +6,7 @@ ATTR_ASSOCIATION = "association"
 ATTR_INSTANCE = "instance"
 ATTR_GROUP = "group"
 ATTR_VALUE_ID = "value_id"
+ATTR_VALUES = "values"
 ATTR_OBJECT_ID = "object_id"
 ATTR_NAME = "name"
 ATTR_SCENE_ID = "scene_id"
@@ -13,11 +13,11 @@ import voluptuous as vol
 from homeassistant.const import (
     CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME, CONF_UNIT_SYSTEM,
     CONF_TIME_ZONE, CONF_CUSTOMIZE, CONF_ELEVATION, CONF_UNIT_SYSTEM_METRIC,
-    CONF_UNIT_SYSTEM_IMPERIAL, CONF_TEMPERATURE_UNIT, TEMP_CELSIUS,
-    __version__)
+    CONF_UNIT_SYSTEM_IMPERIAL, CONF_TEMPERATURE_UNIT, CONF_SETUP_CONCURRENCY,
+    CONF_SETUP_TIMEOUT, TEMP_CELSIUS, __version__)
 from homeassistant.core import valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.util.yaml import load_yaml
+from homeassistant.util.yaml import load_yaml, load_cache, save_cache
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import set_customize
 from homeassistant.util import dt as date_util, location as loc_util
@@ -27,6 +27,7 @@ _LOGGER = logging.getLogger(__name__)
 
 YAML_CONFIG_FILE = 'configuration.yaml'
 VERSION_FILE = '.HA_VERSION'
+YAML_CACHE_FILE = '.yaml_cache'
 CONFIG_DIR_NAME = '.homeassistant'
 
 DEFAULT_CORE_CONFIG = (
@@ -111,6 +112,9 @@ CORE_CONFIG_SCHEMA = vol.Schema({
     CONF_TIME_ZONE: cv.time_zone,
     vol.Required(CONF_CUSTOMIZE,
                  default=MappingProxyType({})): _valid_customize,
+    vol.Optional(CONF_SETUP_CONCURRENCY):
+        vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(CONF_SETUP_TIMEOUT): cv.positive_int,
 })
 
 
@@ -201,7 +205,7 @@ def async_hass_config_yaml(hass):
     """
     def _load_hass_yaml_config():
         path = find_config_file(hass.config.config_dir)
-        conf = load_yaml_config_file(path)
+        conf = load_hass_config_file(path)
         return conf
 
     conf = yield from hass.loop.run_in_executor(None, _load_hass_yaml_config)
@@ -234,6 +238,26 @@ def load_yaml_config_file(config_path):
     return conf_dict
 
 
+def load_hass_config_file(config_path):
+    """Parse the Home Assistant configuration file using the parse cache.
+
+    The cache is stored in the configuration directory so that the next
+    start only has to parse the files that changed.
+
+    This method needs to run in an executor.
+    """
+    if config_path is None:
+        return load_yaml_config_file(config_path)
+
+    cache_path = os.path.join(os.path.dirname(config_path), YAML_CACHE_FILE)
+    load_cache(cache_path)
+
+    try:
+        return load_yaml_config_file(config_path)
+    finally:
+        save_cache(cache_path)
+
+
 def process_ha_config_upgrade(hass):
     """Upgrade config if necessary.
 
@@ -287,7 +311,9 @@ def async_process_ha_core_config(hass, config):
     for key, attr in ((CONF_LATITUDE, 'latitude'),
                       (CONF_LONGITUDE, 'longitude'),
                       (CONF_NAME, 'location_name'),
-                      (CONF_ELEVATION, 'elevation')):
+                      (CONF_ELEVATION, 'elevation'),
+                      (CONF_SETUP_CONCURRENCY, 'setup_concurrency'),
+                      (CONF_SETUP_TIMEOUT, 'setup_timeout')):
         if key in config:
             setattr(hac, attr, config[key])
 
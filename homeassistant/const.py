@@ -129,6 +129,8 @@ CONF_SCAN_INTERVAL = 'scan_interval'
 CONF_SENDER = 'sender'
 CONF_SENSOR_CLASS = 'sensor_class'
 CONF_SENSORS = 'sensors'
+CONF_SETUP_CONCURRENCY = 'setup_concurrency'
+CONF_SETUP_TIMEOUT = 'setup_timeout'
 CONF_SSL = 'ssl'
 CONF_STATE = 'state'
 CONF_STRUCTURE = 'structure'
@@ -159,6 +161,7 @@ EVENT_SERVICE_EXECUTED = 'service_executed'
 EVENT_PLATFORM_DISCOVERED = 'platform_discovered'
 EVENT_COMPONENT_LOADED = 'component_loaded'
 EVENT_SERVICE_REGISTERED = 'service_registered'
+EVENT_CORE_CONFIG_UPDATE = 'core_config_updated'
 
 # #### STATES ####
 STATE_ON = 'on'
@@ -332,6 +335,7 @@ SERVER_PORT = 8123
 URL_ROOT = '/'
 URL_API = '/api/'
 URL_API_STREAM = '/api/stream'
+URL_API_STREAM_METRICS = '/api/stream_metrics'
 URL_API_CONFIG = '/api/config'
 URL_API_DISCOVERY_INFO = '/api/discovery_info'
 URL_API_STATES = '/api/states'
@@ -345,6 +349,7 @@ URL_API_COMPONENTS = '/api/components'
 URL_API_ERROR_LOG = '/api/error_log'
 URL_API_LOG_OUT = '/api/log_out'
 URL_API_TEMPLATE = '/api/template'
+URL_API_BATCH = '/api/batch'
 
 HTTP_OK = 200
 HTTP_CREATED = 201
@@ -352,7 +352,7 @@ class EventOrigin(enum.Enum):
 class Event(object):
     """Represents an event within the Bus."""
 
-    __slots__ = ['event_type', 'data', 'origin', 'time_fired']
+    __slots__ = ['event_type', 'data', 'origin', 'time_fired', '_json']
 
     def __init__(self, event_type, data=None, origin=EventOrigin.local,
                  time_fired=None):
@@ -361,6 +361,7 @@ class Event(object):
         self.data = data or {}
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
+        self._json = None
 
     def as_dict(self):
         """Create a dict representation of this Event.
@@ -374,6 +375,21 @@ class Event(object):
             'time_fired': self.time_fired,
         }
 
+    def as_json(self):
+        """Return the JSON representation of this Event.
+
+        The JSON is only created once and shared by all consumers, like
+        event streams and websocket subscribers.
+
+        Async friendly.
+        """
+        if self._json is None:
+            # pylint: disable=cyclic-import
+            from homeassistant.remote import json_dumps
+            self._json = json_dumps(self)
+
+        return self._json
+
     def __repr__(self):
         """Return the representation."""
         # pylint: disable=maybe-no-member
@@ -401,6 +417,8 @@ class EventBus(object):
         """Initialize a new event bus."""
         self._listeners = {}
         self._hass = hass
+        # Incremented every time a listener is added or removed
+        self.listeners_version = 0
 
     @callback
     def async_listeners(self):
@@ -411,6 +429,15 @@ class EventBus(object):
         return {key: len(self._listeners[key])
                 for key in self._listeners}
 
+    @callback
+    def async_listener_count(self, event_type):
+        """Return the number of listeners that receive event_type.
+
+        This method must be run in the event loop.
+        """
+        get = self._listeners.get
+        return len(get(MATCH_ALL, ())) + len(get(event_type, ()))
+
     @property
     def listeners(self):
         """Dict with events and the number of listeners."""
@@ -481,6 +508,8 @@ class EventBus(object):
         else:
             self._listeners[event_type] = [listener]
 
+        self.listeners_version += 1
+
         def remove_listener():
             """Remove the listener."""
             self._async_remove_listener(event_type, listener)
@@ -542,6 +571,7 @@ class EventBus(object):
         """
         try:
             self._listeners[event_type].remove(listener)
+            self.listeners_version += 1
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -561,36 +591,42 @@ class State(object):
     attributes: extra information on entity and state
     last_changed: last time the state was changed, not the attributes.
     last_updated: last time this object was updated.
+    changed_attributes: keys of the attributes that were added, changed or
+        removed compared to the previous state of the entity, None if unknown.
+
+    Attributes that are already a MappingProxyType are shared, not copied.
+    Pass validate_entity_id=False only for lowercase entity ids that are
+    known to be valid.
     """
 
-    __slots__ = ['entity_id', 'state', 'attributes',
-                 'last_changed', 'last_updated']
+    __slots__ = ['entity_id', 'state', 'attributes', 'last_changed',
+                 'last_updated', 'domain', 'object_id', 'changed_attributes']
 
     def __init__(self, entity_id, state, attributes=None, last_changed=None,
-                 last_updated=None):
+                 last_updated=None, validate_entity_id=True,
+                 changed_attributes=None):
         """Initialize a new state."""
-        if not valid_entity_id(entity_id):
-            raise InvalidEntityFormatError((
-                "Invalid entity id encountered: {}. "
-                "Format should be <domain>.<object_id>").format(entity_id))
+        if validate_entity_id:
+            if not valid_entity_id(entity_id):
+                raise InvalidEntityFormatError((
+                    "Invalid entity id encountered: {}. "
+                    "Format should be <domain>.<object_id>").format(
+                        entity_id))
 
-        self.entity_id = entity_id.lower()
+            entity_id = entity_id.lower()
+
+        if not isinstance(attributes, MappingProxyType):
+            attributes = MappingProxyType(attributes or {})
+
+        self.entity_id = entity_id
+        self.domain, self.object_id = split_entity_id(entity_id)
         self.state = str(state)
-        self.attributes = MappingProxyType(attributes or {})
+        self.attributes = attributes
+        self.changed_attributes = changed_attributes
         self.last_updated = last_updated or dt_util.utcnow()
 
         self.last_changed = last_changed or self.last_updated
 
-    @property
-    def domain(self):
-        """Domain of this state."""
-        return split_entity_id(self.entity_id)[0]
-
-    @property
-    def object_id(self):
-        """Object id of this state."""
-        return split_entity_id(self.entity_id)[1]
-
     @property
     def name(self):
         """Name of this state."""
@@ -642,7 +678,8 @@ class State(object):
         return (self.__class__ == other.__class__ and
                 self.entity_id == other.entity_id and
                 self.state == other.state and
-                self.attributes == other.attributes)
+                (self.attributes is other.attributes or
+                 self.attributes == other.attributes))
 
     def __repr__(self):
         """Return the representation of the states."""
@@ -654,12 +691,26 @@ class State(object):
             dt_util.as_local(self.last_changed).isoformat())
 
 
+def _changed_keys(old, new):
+    """Return the keys that are added, changed or removed in new."""
+    if old is new:
+        return frozenset()
+
+    changed = [key for key, value in new.items()
+               if key not in old or old[key] != value]
+    changed.extend(key for key in old if key not in new)
+
+    return frozenset(changed)
+
+
 class StateMachine(object):
     """Helper class that tracks the state of different entities."""
 
     def __init__(self, bus, loop):
         """Initialize state machine."""
         self._states = {}
+        # States by domain and entity_id
+        self._domains = {}
         self._bus = bus
         self._loop = loop
 
@@ -679,22 +730,23 @@ class StateMachine(object):
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
-
-        return [state.entity_id for state in self._states.values()
-                if state.domain == domain_filter]
+        return list(self._domains.get(domain_filter.lower(), ()))
 
-    def all(self):
+    def all(self, domain_filter=None):
         """Create a list of all states."""
-        return run_callback_threadsafe(self._loop, self.async_all).result()
+        return run_callback_threadsafe(
+            self._loop, self.async_all, domain_filter).result()
 
     @callback
-    def async_all(self):
-        """Create a list of all states.
+    def async_all(self, domain_filter=None):
+        """Create a list of all states, optionally of a single domain.
 
         This method must be run in the event loop.
         """
-        return list(self._states.values())
+        if domain_filter is None:
+            return list(self._states.values())
+
+        return list(self._domains.get(domain_filter.lower(), {}).values())
 
     def get(self, entity_id):
         """Retrieve state of entity_id or None if not found.
@@ -739,7 +791,7 @@ class StateMachine(object):
         """
         entity_id = entity_id.lower()
 
-        old_state = self._states.pop(entity_id, None)
+        old_state = self._pop_state(entity_id)
 
         if old_state is None:
             return False
@@ -754,10 +806,32 @@ class StateMachine(object):
 
         return True
 
+    def _store_state(self, state):
+        """Store a state object and index it by domain."""
+        self._states[state.entity_id] = state
+        self._domains.setdefault(state.domain, {})[state.entity_id] = state
+
+    def _pop_state(self, entity_id):
+        """Remove and return the state of an entity or None if unknown."""
+        old_state = self._states.pop(entity_id, None)
+
+        if old_state is None:
+            return None
+
+        domain_states = self._domains[old_state.domain]
+        del domain_states[entity_id]
+
+        if not domain_states:
+            del self._domains[old_state.domain]
+
+        return old_state
+
     def set(self, entity_id, new_state, attributes=None, force_update=False):
         """Set the state of an entity, add entity if it does not exist.
 
         Attributes is an optional dict to specify attributes of this state.
+        The changed_attributes of the new state lists the attribute keys that
+        differ from the previous state.
 
         If you just update the attributes and not the state, last changed will
         not be affected.
@@ -773,6 +847,8 @@ class StateMachine(object):
         """Set the state of an entity, add entity if it does not exist.
 
         Attributes is an optional dict to specify attributes of this state.
+        The changed_attributes of the new state lists the attribute keys that
+        differ from the previous state.
 
         If you just update the attributes and not the state, last changed will
         not be affected.
@@ -785,19 +861,28 @@ class StateMachine(object):
 
         old_state = self._states.get(entity_id)
 
-        is_existing = old_state is not None
-        same_state = (is_existing and old_state.state == new_state and
-                      not force_update)
-        same_attr = is_existing and old_state.attributes == attributes
+        if old_state is None:
+            state = State(entity_id, new_state, attributes,
+                          changed_attributes=frozenset(attributes))
+        else:
+            same_state = old_state.state == new_state and not force_update
+            changed_attributes = _changed_keys(old_state.attributes,
+                                               attributes)
 
-        if same_state and same_attr:
-            return
+            if same_state and not changed_attributes:
+                return
 
-        # If state did not exist or is different, set it
-        last_changed = old_state.last_changed if same_state else None
+            if not changed_attributes:
+                attributes = old_state.attributes
 
-        state = State(entity_id, new_state, attributes, last_changed)
-        self._states[entity_id] = state
+            # The entity id has been validated when the entity was added
+            state = State(
+                entity_id, new_state, attributes,
+                old_state.last_changed if same_state else None,
+                validate_entity_id=False,
+                changed_attributes=changed_attributes)
+
+        self._store_state(state)
 
         event_data = {
             'entity_id': entity_id,
@@ -861,6 +946,11 @@ class ServiceRegistry(object):
         self._hass = hass
         self._cur_id = 0
         self._async_unsub_call_event = None
+        self._async_unsub_executed_event = None
+        # Futures of the blocking calls by call_id
+        self._pending_calls = {}
+        # Calls executed directly that were fired for observers
+        self._direct_calls = set()
 
     @property
     def services(self):
@@ -945,9 +1035,10 @@ class ServiceRegistry(object):
         If blocking = True, will return boolean if service executed
         succesfully within SERVICE_CALL_LIMIT.
 
-        This method will fire an event to call the service.
-        This event will be picked up by this ServiceRegistry and any
-        other ServiceRegistry that is listening on the EventBus.
+        Services of this ServiceRegistry are called directly, the call event
+        is only fired if something listens to it. Other services are called
+        with an event that any ServiceRegistry listening on the EventBus
+        can pick up.
 
         Because the service is sent as an event you are not allowed to use
         the keys ATTR_DOMAIN and ATTR_SERVICE in your service_data.
@@ -968,9 +1059,10 @@ class ServiceRegistry(object):
         If blocking = True, will return boolean if service executed
         succesfully within SERVICE_CALL_LIMIT.
 
-        This method will fire an event to call the service.
-        This event will be picked up by this ServiceRegistry and any
-        other ServiceRegistry that is listening on the EventBus.
+        Services of this ServiceRegistry are called directly, the call event
+        is only fired if something listens to it. Other services are called
+        with an event that any ServiceRegistry listening on the EventBus
+        can pick up.
 
         Because the service is sent as an event you are not allowed to use
         the keys ATTR_DOMAIN and ATTR_SERVICE in your service_data.
@@ -978,63 +1070,77 @@ class ServiceRegistry(object):
         This method is a coroutine.
         """
         call_id = self._generate_unique_id()
+        domain = domain.lower()
+        service = service.lower()
 
         event_data = {
-            ATTR_DOMAIN: domain.lower(),
-            ATTR_SERVICE: service.lower(),
+            ATTR_DOMAIN: domain,
+            ATTR_SERVICE: service,
             ATTR_SERVICE_DATA: service_data,
             ATTR_SERVICE_CALL_ID: call_id,
         }
 
         if blocking:
             fut = asyncio.Future(loop=self._hass.loop)
+            self._pending_calls[call_id] = fut
+
+        if self.has_service(domain, service):
+            # The event is only fired for whoever observes it
+            if self._async_observed(EVENT_CALL_SERVICE,
+                                    self._async_unsub_call_event):
+                self._direct_calls.add(call_id)
+                self._hass.bus.async_fire(EVENT_CALL_SERVICE, event_data)
 
-            @callback
-            def service_executed(event):
-                """Callback method that is called when service is executed."""
-                if event.data[ATTR_SERVICE_CALL_ID] == call_id:
-                    fut.set_result(True)
+            self._hass.async_add_job(self._async_execute(
+                domain, service, service_data, call_id, False))
 
-            unsub = self._hass.bus.async_listen(EVENT_SERVICE_EXECUTED,
-                                                service_executed)
+        else:
+            # Another instance connected to the bus may offer the service
+            if self._async_unsub_executed_event is None:
+                self._async_unsub_executed_event = self._hass.bus.async_listen(
+                    EVENT_SERVICE_EXECUTED, self._async_service_executed)
 
-        self._hass.bus.async_fire(EVENT_CALL_SERVICE, event_data)
+            self._hass.bus.async_fire(EVENT_CALL_SERVICE, event_data)
 
         if blocking:
             done, _ = yield from asyncio.wait([fut], loop=self._hass.loop,
                                               timeout=SERVICE_CALL_LIMIT)
-            success = bool(done)
-            unsub()
-            return success
+            self._pending_calls.pop(call_id, None)
+            return bool(done)
 
     @asyncio.coroutine
     def _event_to_service_call(self, event):
         """Callback for SERVICE_CALLED events from the event bus."""
-        service_data = event.data.get(ATTR_SERVICE_DATA) or {}
+        service_data = event.data.get(ATTR_SERVICE_DATA)
         domain = event.data.get(ATTR_DOMAIN).lower()
         service = event.data.get(ATTR_SERVICE).lower()
         call_id = event.data.get(ATTR_SERVICE_CALL_ID)
 
+        if call_id in self._direct_calls:
+            self._direct_calls.remove(call_id)
+            return
+
         if not self.has_service(domain, service):
             if event.origin == EventOrigin.local:
                 _LOGGER.warning('Unable to find service %s/%s',
                                 domain, service)
             return
 
-        service_handler = self._services[domain][service]
+        yield from self._async_execute(
+            domain, service, service_data, call_id, True)
 
-        def fire_service_executed():
-            """Fire service executed event."""
-            if not call_id:
-                return
+    @asyncio.coroutine
+    def _async_execute(self, domain, service, service_data, call_id,
+                       fire_executed):
+        """Execute a service call and complete it.
 
-            data = {ATTR_SERVICE_CALL_ID: call_id}
+        Calls received over the event bus always fire the executed event,
+        because the caller may be another instance.
 
-            if (service_handler.is_coroutinefunction or
-                    service_handler.is_callback):
-                self._hass.bus.async_fire(EVENT_SERVICE_EXECUTED, data)
-            else:
-                self._hass.bus.fire(EVENT_SERVICE_EXECUTED, data)
+        This method is a coroutine.
+        """
+        service_data = service_data or {}
+        service_handler = self._services[domain][service]
 
         try:
             if service_handler.schema:
@@ -1042,25 +1148,57 @@ class ServiceRegistry(object):
         except vol.Invalid as ex:
             _LOGGER.error('Invalid service data for %s.%s: %s',
                           domain, service, humanize_error(service_data, ex))
-            fire_service_executed()
+            self._async_call_done(call_id, fire_executed)
             return
 
         service_call = ServiceCall(domain, service, service_data, call_id)
 
         if service_handler.is_callback:
             service_handler.func(service_call)
-            fire_service_executed()
+            self._async_call_done(call_id, fire_executed)
         elif service_handler.is_coroutinefunction:
             yield from service_handler.func(service_call)
-            fire_service_executed()
+            self._async_call_done(call_id, fire_executed)
         else:
             def execute_service():
-                """Execute a service and fires a SERVICE_EXECUTED event."""
+                """Execute a service and complete the call."""
                 service_handler.func(service_call)
-                fire_service_executed()
+                self._hass.loop.call_soon_threadsafe(
+                    self._async_call_done, call_id, fire_executed)
 
             self._hass.async_add_job(execute_service)
 
+    @callback
+    def _async_call_done(self, call_id, fire_executed):
+        """Complete a service call."""
+        if not call_id:
+            return
+
+        fut = self._pending_calls.pop(call_id, None)
+
+        if fut is not None and not fut.done():
+            fut.set_result(True)
+
+        if fire_executed or self._async_observed(
+                EVENT_SERVICE_EXECUTED, self._async_unsub_executed_event):
+            self._hass.bus.async_fire(
+                EVENT_SERVICE_EXECUTED, {ATTR_SERVICE_CALL_ID: call_id})
+
+    @callback
+    def _async_service_executed(self, event):
+        """Complete a call that was executed by another instance."""
+        fut = self._pending_calls.pop(
+            event.data.get(ATTR_SERVICE_CALL_ID), None)
+
+        if fut is not None and not fut.done():
+            fut.set_result(True)
+
+    @callback
+    def _async_observed(self, event_type, unsub_own_listener):
+        """Return if others than this registry listen to event_type."""
+        own = 0 if unsub_own_listener is None else 1
+        return self._hass.bus.async_listener_count(event_type) > own
+
     def _generate_unique_id(self):
         """Generate a unique service call id."""
         self._cur_id += 1
@@ -1082,6 +1220,12 @@ class Config(object):
         # If True, pip install is skipped for requirements on startup
         self.skip_pip = False  # type: bool
 
+        # Number of components that are set up at the same time on startup
+        self.setup_concurrency = 10  # type: int
+
+        # Seconds a component is allowed to take to set up on startup
+        self.setup_timeout = 600  # type: int
+
         # List of loaded components
         self.components = []
 
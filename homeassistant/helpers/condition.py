@@ -6,7 +6,7 @@ import sys
 
 from homeassistant.helpers.typing import ConfigType
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components import (
     zone as zone_cmp, sun as sun_cmp)
 from homeassistant.const import (
@@ -14,7 +14,7 @@ from homeassistant.const import (
     CONF_ENTITY_ID, CONF_VALUE_TEMPLATE, CONF_CONDITION,
     WEEKDAYS, CONF_STATE, CONF_ZONE, CONF_BEFORE,
     CONF_AFTER, CONF_WEEKDAY, SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET,
-    CONF_BELOW, CONF_ABOVE)
+    CONF_BELOW, CONF_ABOVE, EVENT_STATE_CHANGED)
 from homeassistant.exceptions import TemplateError, HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
@@ -23,6 +23,19 @@ from homeassistant.util.async import run_callback_threadsafe
 FROM_CONFIG_FORMAT = '{}_from_config'
 ASYNC_FROM_CONFIG_FORMAT = 'async_{}_from_config'
 
+DATA_NUMERIC_VALUES = 'condition_numeric_values'
+
+# Relative cost of testing a condition, and/or test the cheap ones first
+CONDITION_COSTS = {
+    'state': 1,
+    'time': 1,
+    'numeric_state': 2,
+    'sun': 2,
+    'zone': 3,
+    'template': 4,
+}
+DEFAULT_COST = 4
+
 _LOGGER = logging.getLogger(__name__)
 
 # PyLint does not like the use of _threaded_factory
@@ -70,21 +83,46 @@ def async_from_config(config: ConfigType, config_validation: bool=True):
 from_config = _threaded_factory(async_from_config)
 
 
+def _flatten(condition_type, conditions):
+    """Yield the conditions with nested conditions of the same type inlined."""
+    for entry in conditions:
+        if entry[CONF_CONDITION] == condition_type:
+            yield from _flatten(condition_type, entry['conditions'])
+        else:
+            yield entry
+
+
+def _cost(config):
+    """Return the relative cost of testing a condition."""
+    condition_type = config[CONF_CONDITION]
+
+    if condition_type in ('and', 'or'):
+        return max((_cost(entry) for entry in config['conditions']),
+                   default=0)
+
+    return CONDITION_COSTS.get(condition_type, DEFAULT_COST)
+
+
+def _async_compile(condition_type, conditions):
+    """Compile the conditions of an and/or condition into a flat plan.
+
+    Nested conditions of the same type are inlined and the checks are
+    ordered from cheap to expensive, keeping the configured order for
+    checks of the same cost.
+    """
+    entries = sorted(_flatten(condition_type, conditions), key=_cost)
+    return [async_from_config(entry, False) for entry in entries]
+
+
 def async_and_from_config(config: ConfigType, config_validation: bool=True):
     """Create multi condition matcher using 'AND'."""
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
-    checks = None
+    checks = _async_compile('and', config['conditions'])
 
     def if_and_condition(hass: HomeAssistant,
                          variables=None) -> bool:
         """Test and condition."""
-        nonlocal checks
-
-        if checks is None:
-            checks = [async_from_config(entry, False) for entry
-                      in config['conditions']]
-
         try:
             for check in checks:
                 if not check(hass, variables):
@@ -105,23 +143,19 @@ def async_or_from_config(config: ConfigType, config_validation: bool=True):
     """Create multi condition matcher using 'OR'."""
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
-    checks = None
+    checks = _async_compile('or', config['conditions'])
 
     def if_or_condition(hass: HomeAssistant,
                         variables=None) -> bool:
-        """Test and condition."""
-        nonlocal checks
-
-        if checks is None:
-            checks = [async_from_config(entry, False) for entry
-                      in config['conditions']]
-
-        try:
-            for check in checks:
+        """Test or condition."""
+        for check in checks:
+            # The checks are reordered, so a failing one must not hide
+            # the ones that come after it
+            try:
                 if check(hass, variables):
                     return True
-        except Exception as ex:  # pylint: disable=broad-except
-            _LOGGER.warning('Error during or-condition: %s', ex)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning('Error during or-condition: %s', ex)
 
         return False
 
@@ -140,6 +174,47 @@ def numeric_state(hass: HomeAssistant, entity, below=None, above=None,
     ).result()
 
 
+def _parse_number(value):
+    """Return value as a float or None if it is not a number."""
+    try:
+        return float(value)
+    except ValueError:
+        _LOGGER.warning("Value cannot be processed as a number: %s", value)
+        return None
+
+
+def async_numeric_value(hass: HomeAssistant, entity):
+    """Return the state of an entity as a float, None if it is not a number.
+
+    The parsed value is cached until the state of the entity changes, so all
+    numeric conditions and triggers of an entity parse each state once.
+
+    This method must be run in the event loop.
+    """
+    cache = hass.data.get(DATA_NUMERIC_VALUES)
+
+    if cache is None:
+        cache = hass.data[DATA_NUMERIC_VALUES] = {}
+
+        @callback
+        def async_entity_removed(event):
+            """Forget the value of removed entities."""
+            if event.data.get('new_state') is None:
+                cache.pop(event.data.get('entity_id'), None)
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, async_entity_removed)
+
+    cached = cache.get(entity.entity_id)
+
+    # States are immutable, a new state object means a new value
+    if cached is not None and cached[0] is entity:
+        return cached[1]
+
+    value = _parse_number(entity.state)
+    cache[entity.entity_id] = (entity, value)
+    return value
+
+
 def async_numeric_state(hass: HomeAssistant, entity, below=None, above=None,
                         value_template=None, variables=None):
     """Test a numeric state condition."""
@@ -150,20 +225,17 @@ def async_numeric_state(hass: HomeAssistant, entity, below=None, above=None,
         return False
 
     if value_template is None:
-        value = entity.state
+        value = async_numeric_value(hass, entity)
     else:
         variables = dict(variables or {})
         variables['state'] = entity
         try:
-            value = value_template.async_render(variables)
+            value = _parse_number(value_template.async_render(variables))
         except TemplateError as ex:
             _LOGGER.error("Template error: %s", ex)
             return False
 
-    try:
-        value = float(value)
-    except ValueError:
-        _LOGGER.warning("Value cannot be processed as a number: %s", value)
+    if value is None:
         return False
 
     if below is not None and value > below:
@@ -421,6 +421,8 @@ SERVICE_SCHEMA = vol.All(vol.Schema({
     vol.Optional('data'): dict,
     vol.Optional('data_template'): {match_all: template_complex},
     vol.Optional(CONF_ENTITY_ID): entity_ids,
+    # Scripts continue without waiting for the service call when False
+    vol.Optional('blocking'): boolean,
 }), has_at_least_one_key('service', 'service_template'))
 
 NUMERIC_STATE_CONDITION_SCHEMA = vol.All(vol.Schema({
@@ -506,8 +508,14 @@ _SCRIPT_DELAY_SCHEMA = vol.Schema({
         template)
 })
 
+_SCRIPT_PARALLEL_SCHEMA = vol.Schema({
+    vol.Optional(CONF_ALIAS): string,
+    vol.Required("parallel"): vol.All(
+        ensure_list, [vol.Any(SERVICE_SCHEMA, EVENT_SCHEMA)]),
+})
+
 SCRIPT_SCHEMA = vol.All(
     ensure_list,
     [vol.Any(SERVICE_SCHEMA, _SCRIPT_DELAY_SCHEMA, EVENT_SCHEMA,
-             CONDITION_SCHEMA)],
+             CONDITION_SCHEMA, _SCRIPT_PARALLEL_SCHEMA)],
 )
@@ -1,6 +1,7 @@
 """Helpers for components that manage entities."""
 import asyncio
 from datetime import timedelta
+from functools import partial
 
 from homeassistant import config as conf_util
 from homeassistant.bootstrap import (
@@ -20,6 +21,10 @@ from homeassistant.util.async import (
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
 
+# Concurrent service calls to the entities of a platform that is not async.
+# Platforms can set PARALLEL_CALLS, 1 when their library is not thread safe.
+DEFAULT_PARALLEL_CALLS = 4
+
 
 class EntityComponent(object):
     """Helper class that will help a component manage its entities."""
@@ -37,6 +42,7 @@ class EntityComponent(object):
 
         self.entities = {}
         self.group = None
+        self._entity_platforms = {}
 
         self.config = None
 
@@ -112,6 +118,86 @@ class EntityComponent(object):
                 in extract_entity_ids(self.hass, service, expand_group)
                 if entity_id in self.entities]
 
+    def call_entities(self, entities, method, **kwargs):
+        """Call a method of entities and refresh the polling entities."""
+        run_coroutine_threadsafe(
+            self.async_call_entities(entities, method, **kwargs),
+            self.hass.loop
+        ).result()
+
+    @asyncio.coroutine
+    def async_call_entities(self, entities, method, **kwargs):
+        """Call a method of entities and refresh the polling entities.
+
+        The entities are called concurrently, limited to the parallel calls
+        of their platform. Method names starting with async_ are called in
+        the event loop, other methods run in the executor. Method can also
+        be a coroutine function that is called with each entity.
+
+        When all calls are done, the states of the polling entities are
+        refreshed at once. A failing entity does not stop the others, the
+        first error is raised after all entities have been refreshed.
+
+        This method is a coroutine.
+        """
+        if not entities:
+            return
+
+        if callable(method):
+            call = method
+        elif method.startswith('async_'):
+            def call(entity):
+                """Call the coroutine method of the entity."""
+                return getattr(entity, method)(**kwargs)
+        else:
+            def call(entity):
+                """Run the method of the entity in the executor."""
+                return self.hass.loop.run_in_executor(
+                    None, partial(getattr(entity, method), **kwargs))
+
+        errors = yield from self._async_call_all(entities, call)
+
+        def refresh(entity):
+            """Refresh the state of the entity."""
+            return entity.async_update_ha_state(True)
+
+        errors.extend((yield from self._async_call_all(
+            [entity for entity in entities if entity.should_poll], refresh)))
+
+        if not errors:
+            return
+
+        for entity_id, error in errors[1:]:
+            self.logger.error("Error calling %s: %s", entity_id, error)
+
+        raise errors[0][1]
+
+    @asyncio.coroutine
+    def _async_call_all(self, entities, call):
+        """Call all entities, returning a list of entity_id and error."""
+        if not entities:
+            return []
+
+        results = yield from asyncio.gather(
+            *[self._async_limited(entity, call) for entity in entities],
+            loop=self.hass.loop, return_exceptions=True)
+
+        return [(entity.entity_id, result)
+                for entity, result in zip(entities, results)
+                if isinstance(result, Exception)]
+
+    @asyncio.coroutine
+    def _async_limited(self, entity, call):
+        """Call entity within the parallel calls of its platform."""
+        platform = self._entity_platforms.get(entity.entity_id)
+        semaphore = None if platform is None else platform.parallel_calls
+
+        if semaphore is None:
+            yield from call(entity)
+        else:
+            with (yield from semaphore):
+                yield from call(entity)
+
     @asyncio.coroutine
     def _async_setup_platform(self, platform_type, platform_config,
                               discovery_info=None):
@@ -131,11 +217,17 @@ class EntityComponent(object):
                          self.scan_interval)
         entity_namespace = platform_config.get(CONF_ENTITY_NAMESPACE)
 
+        # Async platforms don't use the executor, no need to limit them
+        parallel_calls = getattr(
+            platform, 'PARALLEL_CALLS',
+            None if hasattr(platform, 'async_setup_platform')
+            else DEFAULT_PARALLEL_CALLS)
+
         key = (platform_type, scan_interval, entity_namespace)
 
         if key not in self._platforms:
-            self._platforms[key] = EntityPlatform(self, scan_interval,
-                                                  entity_namespace)
+            self._platforms[key] = EntityPlatform(
+                self, scan_interval, entity_namespace, parallel_calls)
         entity_platform = self._platforms[key]
 
         try:
@@ -202,6 +294,10 @@ class EntityComponent(object):
                 'Invalid entity id: {}'.format(entity.entity_id))
 
         self.entities[entity.entity_id] = entity
+
+        if platform is not None:
+            self._entity_platforms[entity.entity_id] = platform
+
         yield from entity.async_update_ha_state()
 
         return True
@@ -247,6 +343,7 @@ class EntityComponent(object):
             'core': self._platforms['core']
         }
         self.entities = {}
+        self._entity_platforms = {}
         self.config = None
 
         if self.group is not None:
@@ -284,11 +381,16 @@ class EntityComponent(object):
 class EntityPlatform(object):
     """Keep track of entities for a single platform and stay in loop."""
 
-    def __init__(self, component, scan_interval, entity_namespace):
+    def __init__(self, component, scan_interval, entity_namespace,
+                 parallel_calls=None):
         """Initalize the entity platform."""
         self.component = component
         self.scan_interval = scan_interval
         self.entity_namespace = entity_namespace
+        self.parallel_calls = None
+        if parallel_calls:
+            self.parallel_calls = asyncio.Semaphore(
+                parallel_calls, loop=component.hass.loop)
         self.platform_entities = []
         self._async_unsub_polling = None
         self._process_updates = False
@@ -1,6 +1,7 @@
 """Helpers for listening to events."""
 import functools as ft
 from datetime import timedelta
+import logging
 
 from ..core import HomeAssistant, callback
 from ..const import (
@@ -8,6 +9,10 @@ from ..const import (
 from ..util import dt as dt_util
 from ..util.async import run_callback_threadsafe
 
+DATA_ENTITY_STATE_TRACKER = 'entity_state_tracker'
+
+_LOGGER = logging.getLogger(__name__)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -48,42 +53,117 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
     from_state = _process_state_match(from_state)
     to_state = _process_state_match(to_state)
 
-    # Ensure it is a lowercase list with entity ids we want to match on
-    if entity_ids == MATCH_ALL:
-        pass
-    elif isinstance(entity_ids, str):
-        entity_ids = (entity_ids.lower(),)
-    else:
-        entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
-
     @callback
-    def state_change_listener(event):
+    def state_change_listener(entity_id, old_state, new_state):
         """The listener that listens for specific state changes."""
-        if entity_ids != MATCH_ALL and \
-           event.data.get('entity_id') not in entity_ids:
-            return
-
-        if event.data.get('old_state') is not None:
-            old_state = event.data['old_state'].state
+        if _matcher(None if old_state is None else old_state.state,
+                    from_state) and \
+           _matcher(None if new_state is None else new_state.state,
+                    to_state):
+            hass.async_run_job(action, entity_id, old_state, new_state)
+
+    if entity_ids != MATCH_ALL:
+        # Ensure it is a lowercase list with entity ids we want to match on
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids.lower(),)
         else:
-            old_state = None
+            entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
 
-        if event.data.get('new_state') is not None:
-            new_state = event.data['new_state'].state
-        else:
-            new_state = None
+        tracker = hass.data.get(DATA_ENTITY_STATE_TRACKER)
+
+        if tracker is None:
+            tracker = hass.data[DATA_ENTITY_STATE_TRACKER] = \
+                EntityStateTracker(hass)
 
-        if _matcher(old_state, from_state) and _matcher(new_state, to_state):
-            hass.async_run_job(action, event.data.get('entity_id'),
-                               event.data.get('old_state'),
-                               event.data.get('new_state'))
+        return tracker.async_add(entity_ids, state_change_listener)
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    @callback
+    def all_state_change_listener(event):
+        """Pass all state changes on."""
+        state_change_listener(event.data.get('entity_id'),
+                              event.data.get('old_state'),
+                              event.data.get('new_state'))
+
+    return hass.bus.async_listen(EVENT_STATE_CHANGED,
+                                 all_state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
+class EntityStateTracker(object):
+    """Pass the state changes of entities to the listeners of that entity.
+
+    All listeners share one state_changed listener that looks up the
+    listeners of the entity that changed, instead of every listener being
+    called for every state change.
+    """
+
+    def __init__(self, hass):
+        """Initialize the tracker."""
+        self.hass = hass
+        # Tuples of listeners by entity_id, replaced when changed so they can
+        # be iterated while listeners are added or removed.
+        self._listeners = {}
+        self._unsub = None
+
+    @callback
+    def async_add(self, entity_ids, listener):
+        """Call listener(entity_id, old_state, new_state) on changes.
+
+        Returns a function that can be called to remove the listener.
+
+        This method must be run in the event loop.
+        """
+        entity_ids = set(entity_ids)
+
+        for entity_id in entity_ids:
+            self._listeners[entity_id] = \
+                self._listeners.get(entity_id, ()) + (listener,)
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed)
+
+        @callback
+        def async_remove():
+            """Remove the listener."""
+            for entity_id in entity_ids:
+                listeners = tuple(other for other
+                                  in self._listeners.get(entity_id, ())
+                                  if other is not listener)
+
+                if listeners:
+                    self._listeners[entity_id] = listeners
+                else:
+                    self._listeners.pop(entity_id, None)
+
+            if not self._listeners and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event):
+        """Call the listeners of the entity that changed."""
+        entity_id = event.data.get('entity_id')
+        listeners = self._listeners.get(entity_id)
+
+        if not listeners:
+            return
+
+        old_state = event.data.get('old_state')
+        new_state = event.data.get('new_state')
+
+        for listener in listeners:
+            try:
+                listener(entity_id, old_state, new_state)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling state change of %s",
+                                  entity_id)
+
+
 def async_track_point_in_time(hass, action, point_in_time):
     """Add a listener that fires once after a specific point in time."""
     utc_point_in_time = dt_util.as_utc(point_in_time)
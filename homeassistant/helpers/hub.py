@@ -0,0 +1,126 @@
+"""Helpers to talk to hubs that control many devices, like light bridges."""
+import asyncio
+from collections import OrderedDict
+import logging
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Requests per second most hubs accept
+DEFAULT_RATE = 10
+
+
+class HubScheduler(object):
+    """Send the commands and poll the state of a hub at a limited rate.
+
+    Commands for the same target issued in the same tick are merged. When a
+    command is sent to several targets and group is given, the targets are
+    addressed with a single request to the group that contains exactly them.
+    All state updates requested while an update is pending share one poll,
+    which runs after the commands that were queued before.
+
+    send(target, command) and update() are called in the executor.
+    group(targets) returns the target addressing all targets or None.
+    """
+
+    def __init__(self, hass, send, update, group=None, rate=DEFAULT_RATE):
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._send = send
+        self._update = update
+        self._group = group
+        self._interval = 1 / rate
+        self._next_request = 0
+        self._commands = OrderedDict()
+        self._update_future = None
+        self._processing = False
+
+    @callback
+    def async_send(self, target, command):
+        """Queue a command for a target.
+
+        This method must be run in the event loop.
+        """
+        self._commands.setdefault(target, {}).update(command)
+        self._async_schedule()
+
+    @asyncio.coroutine
+    def async_update(self):
+        """Poll the state of the hub after the queued commands are sent.
+
+        This method is a coroutine.
+        """
+        if self._update_future is None:
+            self._update_future = asyncio.Future(loop=self.hass.loop)
+            self._async_schedule()
+
+        yield from asyncio.shield(self._update_future, loop=self.hass.loop)
+
+    @callback
+    def _async_schedule(self):
+        """Start processing the queue if it is not processed already."""
+        if self._processing:
+            return
+
+        self._processing = True
+        self.hass.async_add_job(self._async_process())
+
+    @asyncio.coroutine
+    def _async_process(self):
+        """Send the queued commands, then poll the state if requested."""
+        try:
+            while self._commands or self._update_future is not None:
+                if self._commands:
+                    commands = self._commands
+                    self._commands = OrderedDict()
+
+                    for target, command in self._coalesce(commands):
+                        yield from self._async_request(
+                            self._send, target, command)
+
+                    # Commands queued in the meantime go before the poll
+                    continue
+
+                future = self._update_future
+                self._update_future = None
+                yield from self._async_request(self._update)
+                future.set_result(None)
+
+        finally:
+            self._processing = False
+
+    def _coalesce(self, commands):
+        """Yield the requests to send the commands with."""
+        by_command = OrderedDict()
+
+        for target, command in commands.items():
+            key = repr(sorted(command.items()))
+            by_command.setdefault(key, (command, []))[1].append(target)
+
+        for command, targets in by_command.values():
+            group = None
+
+            if self._group is not None and len(targets) > 1:
+                group = self._group(targets)
+
+            if group is not None:
+                yield group, command
+            else:
+                for target in targets:
+                    yield target, command
+
+    @asyncio.coroutine
+    def _async_request(self, func, *args):
+        """Run a request in the executor at the rate the hub accepts."""
+        delay = self._next_request - self.hass.loop.time()
+
+        if delay > 0:
+            yield from asyncio.sleep(delay, loop=self.hass.loop)
+
+        self._next_request = self.hass.loop.time() + self._interval
+
+        try:
+            yield from self.hass.loop.run_in_executor(None, func, *args)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error talking to the hub")
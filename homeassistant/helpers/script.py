@@ -6,7 +6,7 @@ from typing import Optional, Sequence
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import CONF_CONDITION
 from homeassistant.helpers import (
     service, condition, template, config_validation as cv)
@@ -25,6 +25,8 @@ CONF_SEQUENCE = "sequence"
 CONF_EVENT = "event"
 CONF_EVENT_DATA = "event_data"
 CONF_DELAY = "delay"
+CONF_PARALLEL = "parallel"
+CONF_BLOCKING = "blocking"
 
 
 def call_from_config(hass: HomeAssistant, config: ConfigType,
@@ -51,6 +53,10 @@ class Script():
         self._async_unsub_delay_listener = None
         self._template_cache = {}
         self._config_cache = {}
+        # Service calls that the script did not wait for
+        self._pending_calls = []
+        # (action, seconds) of the steps of the current or last run
+        self.step_times = []
 
     @property
     def is_running(self) -> bool:
@@ -71,6 +77,7 @@ class Script():
         if self._cur == -1:
             self._log('Running script')
             self._cur = 0
+            self.step_times = []
 
         # Unregister callback if we were in a delay but turn on is called
         # again. In that case we just continue execution.
@@ -80,12 +87,8 @@ class Script():
                                   None):
 
             if CONF_DELAY in action:
-                # Call ourselves in the future to continue work
-                @asyncio.coroutine
-                def script_delay(now):
-                    """Called after delay is done."""
-                    self._async_unsub_delay_listener = None
-                    self.hass.async_add_job(self.async_run(variables))
+                # Finish the steps before the delay before waiting
+                yield from self._async_wait_pending_calls()
 
                 delay = action[CONF_DELAY]
 
@@ -95,25 +98,39 @@ class Script():
                         cv.positive_timedelta)(
                             delay.async_render(variables))
 
-                self._async_unsub_delay_listener = \
-                    async_track_point_in_utc_time(
-                        self.hass, script_delay,
-                        date_util.utcnow() + delay)
+                # Call ourselves in the future to continue work
+                self._async_schedule_delay(delay, variables)
                 self._cur = cur + 1
                 if self._change_listener:
                     self.hass.async_add_job(self._change_listener)
                 return
 
-            elif CONF_CONDITION in action:
-                if not self._async_check_condition(action, variables):
-                    break
+            start = self.hass.loop.time()
+            check = True
+
+            if CONF_CONDITION in action:
+                check = self._async_check_condition(action, variables)
 
             elif CONF_EVENT in action:
                 self._async_fire_event(action)
 
+            elif CONF_PARALLEL in action:
+                yield from self._async_run_parallel(action, variables)
+
+            elif not action.get(CONF_BLOCKING, True):
+                self._async_start_service(action, variables)
+
             else:
                 yield from self._async_call_service(action, variables)
 
+            self.step_times.append(
+                (self.last_action, self.hass.loop.time() - start))
+
+            if not check:
+                break
+
+        yield from self._async_wait_pending_calls()
+
         self._cur = -1
         self.last_action = None
         if self._change_listener:
@@ -129,10 +146,98 @@ class Script():
             return
 
         self._cur = -1
+        self._pending_calls = []
         self._async_remove_listener()
         if self._change_listener:
             self.hass.async_add_job(self._change_listener)
 
+    def _async_schedule_delay(self, delay, variables):
+        """Continue running the script after delay.
+
+        The delay is timed on the event loop for sub-second precision. It
+        also ends when the clock passes the end of the delay, which keeps
+        long delays in line with the wall clock.
+        """
+        @callback
+        def async_delay_timer():
+            """Called when the loop timer of the delay is done."""
+            if self._async_unsub_delay_listener is not async_unsub:
+                return
+
+            unsub_time()
+            self._async_unsub_delay_listener = None
+            self.hass.async_add_job(self.async_run(variables))
+
+        @callback
+        def async_delay_time_passed(now):
+            """Called when the clock passed the end of the delay."""
+            if self._async_unsub_delay_listener is not async_unsub:
+                return
+
+            timer.cancel()
+            self._async_unsub_delay_listener = None
+            self.hass.async_add_job(self.async_run(variables))
+
+        def async_unsub():
+            """Cancel the delay."""
+            timer.cancel()
+            unsub_time()
+
+        timer = self.hass.loop.call_later(
+            delay.total_seconds(), async_delay_timer)
+        unsub_time = async_track_point_in_utc_time(
+            self.hass, async_delay_time_passed, date_util.utcnow() + delay)
+        self._async_unsub_delay_listener = async_unsub
+
+    @asyncio.coroutine
+    def _async_run_parallel(self, action, variables):
+        """Run the actions of a parallel block concurrently.
+
+        This method is a coroutine.
+        """
+        self.last_action = action.get(CONF_ALIAS, 'parallel')
+        self._log("Executing step %s" % self.last_action)
+        calls = []
+
+        for parallel_action in action[CONF_PARALLEL]:
+            if CONF_EVENT in parallel_action:
+                self.hass.bus.async_fire(parallel_action[CONF_EVENT],
+                                         parallel_action.get(CONF_EVENT_DATA))
+            else:
+                calls.append(service.async_call_from_config(
+                    self.hass, parallel_action, True, variables,
+                    validate_config=False))
+
+        if calls:
+            yield from asyncio.gather(*calls, loop=self.hass.loop)
+
+    def _async_start_service(self, action, variables):
+        """Call the service without waiting for it to finish.
+
+        The script waits for the call before a delay and at its end.
+        """
+        self.last_action = action.get(CONF_ALIAS, 'call service')
+        self._log("Starting step %s" % self.last_action)
+        self._pending_calls.append(self.hass.loop.create_task(
+            service.async_call_from_config(
+                self.hass, action, True, variables, validate_config=False)))
+
+    @asyncio.coroutine
+    def _async_wait_pending_calls(self):
+        """Wait for the service calls that were started.
+
+        This method is a coroutine.
+        """
+        if not self._pending_calls:
+            return
+
+        pending, self._pending_calls = self._pending_calls, []
+        done, _ = yield from asyncio.wait(pending, loop=self.hass.loop)
+
+        for task in done:
+            if task.exception() is not None:
+                _LOGGER.error("Error calling service: %s", task.exception())
+
     @asyncio.coroutine
     def _async_call_service(self, action, variables):
         """Call the service specified in the action.
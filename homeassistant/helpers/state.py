@@ -33,7 +33,8 @@ from homeassistant.const import (
     SERVICE_CLOSE_COVER, STATE_ALARM_ARMED_AWAY, STATE_ALARM_ARMED_HOME,
     STATE_ALARM_DISARMED, STATE_ALARM_TRIGGERED, STATE_CLOSED, STATE_LOCKED,
     STATE_OFF, STATE_ON, STATE_OPEN, STATE_PAUSED, STATE_PLAYING,
-    STATE_UNKNOWN, STATE_UNLOCKED, SERVICE_SELECT_OPTION, ATTR_OPTION)
+    STATE_UNKNOWN, STATE_UNLOCKED, SERVICE_SELECT_OPTION, ATTR_OPTION,
+    ATTR_ASSUMED_STATE)
 from homeassistant.core import State
 from homeassistant.util.async import run_coroutine_threadsafe
 
@@ -121,39 +122,74 @@ def reproduce_state(hass, states, blocking=False):
         async_reproduce_state(hass, states, blocking), hass.loop).result()
 
 
+def _find_service(domain_services, state):
+    """Return the service that reproduces state or None."""
+    service = None
+    for _service in domain_services:
+        if (_service in SERVICE_ATTRIBUTES and
+                all(attr in state.attributes
+                    for attr in SERVICE_ATTRIBUTES[_service]) or
+                _service in SERVICE_TO_STATE and
+                SERVICE_TO_STATE[_service] == state.state):
+            service = _service
+        if (_service in SERVICE_TO_STATE and
+                SERVICE_TO_STATE[_service] == state.state):
+            break
+
+    return service
+
+
+def _is_reproduced(current, state):
+    """Return if the current state already matches state.
+
+    The state of entities with an assumed state might not be their real
+    state, so they are never considered reproduced.
+    """
+    return (not current.attributes.get(ATTR_ASSUMED_STATE) and
+            current.state == state.state and
+            all(current.attributes.get(key) == value
+                for key, value in state.attributes.items()))
+
+
 @asyncio.coroutine
 def async_reproduce_state(hass, states, blocking=False):
-    """Reproduce given state."""
+    """Reproduce given state.
+
+    States are grouped into one service call per domain, service and
+    service data. Entities that are already in the given state are skipped
+    and all service calls are made concurrently.
+    """
     if isinstance(states, State):
         states = [states]
 
+    all_services = hass.services.async_services()
+    # Services by domain, state and attribute names
+    service_cache = {}
     to_call = defaultdict(list)
 
     for state in states:
+        current = hass.states.get(state.entity_id)
 
-        if hass.states.get(state.entity_id) is None:
+        if current is None:
             _LOGGER.warning('reproduce_state: Unable to find entity %s',
                             state.entity_id)
             continue
 
         if state.domain == GROUP_DOMAIN:
+            # A group that is on can still have members that are off
             service_domain = HASS_DOMAIN
+        elif _is_reproduced(current, state):
+            continue
         else:
             service_domain = state.domain
 
-        domain_services = hass.services.async_services()[service_domain]
+        cache_key = (service_domain, state.state, frozenset(state.attributes))
 
-        service = None
-        for _service in domain_services.keys():
-            if (_service in SERVICE_ATTRIBUTES and
-                    all(attr in state.attributes
-                        for attr in SERVICE_ATTRIBUTES[_service]) or
-                    _service in SERVICE_TO_STATE and
-                    SERVICE_TO_STATE[_service] == state.state):
-                service = _service
-            if (_service in SERVICE_TO_STATE and
-                    SERVICE_TO_STATE[_service] == state.state):
-                break
+        if cache_key in service_cache:
+            service = service_cache[cache_key]
+        else:
+            service = service_cache[cache_key] = _find_service(
+                all_services.get(service_domain, {}), state)
 
         if not service:
             _LOGGER.warning("reproduce_state: Unable to reproduce state %s",
@@ -166,28 +202,18 @@ def async_reproduce_state(hass, states, blocking=False):
                json.dumps(dict(state.attributes), sort_keys=True))
         to_call[key].append(state.entity_id)
 
-    domain_tasks = {}
+    calls = []
     for (service_domain, service, service_data), entity_ids in to_call.items():
         data = json.loads(service_data)
         data[ATTR_ENTITY_ID] = entity_ids
 
-        if service_domain not in domain_tasks:
-            domain_tasks[service_domain] = []
-
-        domain_tasks[service_domain].append(
-            hass.services.async_call(service_domain, service, data, blocking)
-        )
-
-    @asyncio.coroutine
-    def async_handle_service_calls(coro_list):
-        """Handle service calls by domain sequence."""
-        for coro in coro_list:
-            yield from coro
+        calls.append(
+            hass.services.async_call(service_domain, service, data, blocking))
 
-    execute_tasks = [async_handle_service_calls(coro_list)
-                     for coro_list in domain_tasks.values()]
-    if execute_tasks:
-        yield from asyncio.wait(execute_tasks, loop=hass.loop)
+    # The entity components limit how many entities of a platform are
+    # called at the same time, so the calls do not have to be sequenced.
+    if calls:
+        yield from asyncio.wait(calls, loop=hass.loop)
 
 
 def state_as_number(state):
@@ -1,5 +1,6 @@
 """Template helper methods for rendering strings with HA data."""
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 import re
@@ -20,6 +21,12 @@ _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Key in hass.data holding the template globals shared by all templates
+DATA_TEMPLATE_GLOBALS = 'template_globals'
+
+# Number of compiled template sources kept in the process-wide cache
+COMPILED_CACHE_SIZE = 512
+
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
     r"(?:(?:states\.|(?:is_state|is_state_attr|states)\(.)([\w]+\.[\w]+))",
@@ -50,6 +57,33 @@ def extract_entities(template):
     return MATCH_ALL
 
 
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def _compile(template):
+    """Compile template source, shared by all templates with same source."""
+    return ENV.compile(template)
+
+
+def _async_get_globals(hass):
+    """Return the template globals bound to a hass instance.
+
+    This method must be run in the event loop.
+    """
+    global_vars = hass.data.get(DATA_TEMPLATE_GLOBALS)
+
+    if global_vars is None:
+        location_methods = LocationMethods(hass)
+
+        global_vars = hass.data[DATA_TEMPLATE_GLOBALS] = ENV.make_globals({
+            'closest': location_methods.closest,
+            'distance': location_methods.distance,
+            'is_state': hass.states.is_state,
+            'is_state_attr': hass.states.is_state_attr,
+            'states': AllStates(hass),
+        })
+
+    return global_vars
+
+
 class Template(object):
     """Class to hold a template and manage caching and rendering."""
 
@@ -69,7 +103,7 @@ class Template(object):
             return
 
         try:
-            self._compiled_code = ENV.compile(self.template)
+            self._compiled_code = _compile(self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
@@ -144,18 +178,8 @@ class Template(object):
 
         assert self.hass is not None, 'hass variable not set on template'
 
-        location_methods = LocationMethods(self.hass)
-
-        global_vars = ENV.make_globals({
-            'closest': location_methods.closest,
-            'distance': location_methods.distance,
-            'is_state': self.hass.states.is_state,
-            'is_state_attr': self.hass.states.is_state_attr,
-            'states': AllStates(self.hass),
-        })
-
         self._compiled = jinja2.Template.from_code(
-            ENV, self._compiled_code, global_vars, None)
+            ENV, self._compiled_code, _async_get_globals(self.hass), None)
 
         return self._compiled
 
@@ -202,10 +226,8 @@ class DomainStates(object):
 
     def __iter__(self):
         """Return the iteration over all the states."""
-        return iter(sorted(
-            (state for state in self._hass.states.async_all()
-             if state.domain == self._domain),
-            key=lambda state: state.entity_id))
+        return iter(sorted(self._hass.states.async_all(self._domain),
+                           key=lambda state: state.entity_id))
 
 
 class LocationMethods(object):
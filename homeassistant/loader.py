@@ -10,11 +10,14 @@ call get_component('switch.your_platform'). In both cases the config directory
 is checked to see if it contains a user provided version. If not available it
 will check the built-in components and platforms.
 """
+import asyncio
+from collections import OrderedDict
 import importlib
 import logging
 import os
 import pkgutil
 import sys
+import time
 
 from types import ModuleType
 # pylint: disable=unused-import
@@ -36,6 +39,9 @@ AVAILABLE_COMPONENTS = []  # type: List[str]
 # Dict of loaded components mapped name => module
 _COMPONENT_CACHE = {}  # type: Dict[str, ModuleType]
 
+# Dict of imported module paths mapped to the seconds their import took
+_IMPORT_TIMES = OrderedDict()  # type: Dict[str, float]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -101,6 +107,57 @@ def get_platform(domain: str, platform: str) -> Optional[ModuleType]:
     return get_component(PLATFORM_FORMAT.format(domain, platform))
 
 
+@asyncio.coroutine
+def async_get_platform(hass: 'HomeAssistant', domain: str,
+                       platform: str) -> Optional[ModuleType]:
+    """Try to load specified platform in the executor.
+
+    This method is a coroutine.
+    """
+    return (yield from async_get_component(
+        hass, PLATFORM_FORMAT.format(domain, platform)))
+
+
+@asyncio.coroutine
+def async_get_component(hass: 'HomeAssistant',
+                        comp_name: str) -> Optional[ModuleType]:
+    """Try to load specified component in the executor.
+
+    Importing a module can take long, this keeps it out of the event loop.
+
+    This method is a coroutine.
+    """
+    if comp_name in _COMPONENT_CACHE:
+        return _COMPONENT_CACHE[comp_name]
+
+    return (yield from hass.loop.run_in_executor(
+        None, get_component, comp_name))
+
+
+@asyncio.coroutine
+def async_preload_components(hass: 'HomeAssistant',
+                             comp_names: Sequence[str]) -> None:
+    """Import components and platforms in parallel in the executor.
+
+    This method is a coroutine.
+    """
+    tasks = [async_get_component(hass, comp_name) for comp_name
+             in comp_names if comp_name not in _COMPONENT_CACHE]
+
+    if tasks:
+        yield from asyncio.wait(tasks, loop=hass.loop)
+
+
+def import_times() -> Dict[str, float]:
+    """Return the seconds the import of each module took.
+
+    The time of a module includes the imports done by the module.
+
+    Async friendly.
+    """
+    return OrderedDict(_IMPORT_TIMES)
+
+
 def get_component(comp_name) -> Optional[ModuleType]:
     """Try to load specified component.
 
@@ -136,8 +193,13 @@ def get_component(comp_name) -> Optional[ModuleType]:
             continue
 
         try:
+            imported = path in sys.modules
+            start = time.perf_counter()
             module = importlib.import_module(path)
 
+            if not imported:
+                _IMPORT_TIMES[path] = time.perf_counter() - start
+
             # In Python 3 you can import files from directories that do not
             # contain the file __init__.py. A directory is a valid module if
             # it contains a file with the .py extension. In this case Python
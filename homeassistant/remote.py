@@ -19,21 +19,29 @@ import urllib.parse
 
 from typing import Optional
 
+import aiohttp
+import async_timeout
 import requests
 
 import homeassistant.bootstrap as bootstrap
 import homeassistant.core as ha
 from homeassistant.const import (
-    HTTP_HEADER_HA_AUTH, SERVER_PORT, URL_API, URL_API_EVENT_FORWARD,
+    HTTP_HEADER_HA_AUTH, HTTP_METHOD_NOT_ALLOWED, HTTP_NOT_FOUND,
+    SERVER_PORT, URL_API, URL_API_BATCH, URL_API_EVENT_FORWARD,
     URL_API_EVENTS, URL_API_EVENTS_EVENT, URL_API_SERVICES, URL_API_CONFIG,
     URL_API_SERVICES_SERVICE, URL_API_STATES, URL_API_STATES_ENTITY,
     HTTP_HEADER_CONTENT_TYPE, CONTENT_TYPE_JSON)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 METHOD_GET = "get"
 METHOD_POST = "post"
 METHOD_DELETE = "delete"
 
+BATCH_SET_STATE = 'set_state'
+BATCH_FIRE_EVENT = 'fire_event'
+BATCH_CALL_SERVICE = 'call_service'
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -77,6 +85,10 @@ class API(object):
         if api_password is not None:
             self._headers[HTTP_HEADER_HA_AUTH] = api_password
 
+        # Keep connections to the API alive between calls
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+
     def validate_api(self, force_validate: bool=False) -> bool:
         """Test if we can communicate with the API."""
         if self.status is None or force_validate:
@@ -93,12 +105,10 @@ class API(object):
 
         try:
             if method == METHOD_GET:
-                return requests.get(
-                    url, params=data, timeout=timeout, headers=self._headers)
+                return self._session.get(url, params=data, timeout=timeout)
             else:
-                return requests.request(
-                    method, url, data=data, timeout=timeout,
-                    headers=self._headers)
+                return self._session.request(
+                    method, url, data=data, timeout=timeout)
 
         except requests.exceptions.ConnectionError:
             _LOGGER.exception("Error connecting to server")
@@ -109,6 +119,37 @@ class API(object):
             _LOGGER.exception(error)
             raise HomeAssistantError(error)
 
+    @asyncio.coroutine
+    def async_call(self, hass, method, path, data=None, timeout=5):
+        """Make a call to the Home Assistant API from the event loop.
+
+        Uses the shared aiohttp session of hass so connections are reused.
+        Returns the response with the body already read.
+
+        This method is a coroutine.
+        """
+        if data is not None:
+            data = json.dumps(data, cls=JSONEncoder)
+
+        url = urllib.parse.urljoin(self.base_url, path)
+        websession = async_get_clientsession(hass)
+
+        try:
+            with async_timeout.timeout(timeout, loop=hass.loop):
+                req = yield from websession.request(
+                    method, url, data=data, headers=self._headers)
+                yield from req.read()
+            return req
+
+        except aiohttp.errors.ClientError:
+            _LOGGER.exception("Error connecting to server")
+            raise HomeAssistantError("Error connecting to server")
+
+        except asyncio.TimeoutError:
+            error = "Timeout when talking to {}".format(self.host)
+            _LOGGER.exception(error)
+            raise HomeAssistantError(error)
+
     def __repr__(self) -> str:
         """Return the representation of the API."""
         return "<API({}, password: {})>".format(
@@ -222,6 +263,8 @@ class EventForwarder(object):
         self._targets = {}
 
         self._lock = threading.Lock()
+        self._pending = []
+        self._forwarding = False
         self._async_unsub_listener = None
 
     @ha.callback
@@ -253,15 +296,44 @@ class EventForwarder(object):
         return did_remove
 
     def _event_listener(self, event):
-        """Listen and forward all events."""
+        """Listen and forward all events.
+
+        Events that arrive while a batch is being forwarded are queued and
+        forwarded together in the next batch, in order.
+        """
+        # We don't forward time events or, if enabled, non-local events
+        if event.event_type == ha.EVENT_TIME_CHANGED or \
+           (self.restrict_origin and event.origin != self.restrict_origin):
+            return
+
         with self._lock:
-            # We don't forward time events or, if enabled, non-local events
-            if event.event_type == ha.EVENT_TIME_CHANGED or \
-               (self.restrict_origin and event.origin != self.restrict_origin):
+            self._pending.append(event)
+
+            if self._forwarding:
                 return
 
-            for api in self._targets.values():
-                fire_event(api, event.event_type, event.data)
+            self._forwarding = True
+
+        events = None
+
+        try:
+            while True:
+                with self._lock:
+                    events = self._pending
+                    self._pending = []
+
+                    if not events:
+                        self._forwarding = False
+                        return
+
+                for api in list(self._targets.values()):
+                    fire_events(api, events)
+
+        finally:
+            # Forwarding failed, let the next event start a new run
+            if events:
+                with self._lock:
+                    self._forwarding = False
 
 
 class StateMachine(ha.StateMachine):
@@ -288,15 +360,46 @@ class StateMachine(ha.StateMachine):
 
     def mirror(self):
         """Discard current data and mirrors the remote state machine."""
-        self._states = {state.entity_id: state for state
-                        in get_states(self._api)}
+        self._states = {}
+        self._domains = {}
+
+        for state in get_states(self._api):
+            self._store_state(state)
 
     def _state_changed_listener(self, event):
         """Listen for state changed events and applies them."""
         if event.data['new_state'] is None:
-            self._states.pop(event.data['entity_id'], None)
+            self._pop_state(event.data['entity_id'])
         else:
-            self._states[event.data['entity_id']] = event.data['new_state']
+            self._store_state(event.data['new_state'])
+
+
+def json_ready(obj):
+    """Convert State, Event and datetime objects to JSON types.
+
+    Nested states and timestamps are converted directly so the encoder does
+    not have to call back into JSONEncoder.default for each of them.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    elif isinstance(obj, ha.State):
+        return {'entity_id': obj.entity_id,
+                'state': obj.state,
+                'attributes': dict(obj.attributes),
+                'last_changed': obj.last_changed.isoformat(),
+                'last_updated': obj.last_updated.isoformat()}
+    elif isinstance(obj, ha.Event):
+        return {'event_type': obj.event_type,
+                'data': {key: json_ready(value)
+                         for key, value in obj.data.items()},
+                'origin': str(obj.origin),
+                'time_fired': obj.time_fired.isoformat()}
+    return obj
+
+
+def json_dumps(obj):
+    """Serialize obj to JSON, supporting Home Assistant objects."""
+    return json.dumps(json_ready(obj), cls=JSONEncoder)
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -420,6 +523,58 @@ def fire_event(api, event_type, data=None):
         _LOGGER.exception("Error firing event")
 
 
+def batch(api, operations):
+    """Execute a list of operations at remote API in a single request.
+
+    Each operation is a dict with a type of BATCH_SET_STATE,
+    BATCH_FIRE_EVENT or BATCH_CALL_SERVICE. Returns a list with a result
+    dict per operation or None if the request failed.
+    """
+    try:
+        req = api(METHOD_POST, URL_API_BATCH, operations)
+
+        if req.status_code == 200:
+            return req.json()
+
+        _LOGGER.error("Error executing batch: %d - %s",
+                      req.status_code, req.text)
+
+    except (HomeAssistantError, ValueError):
+        # ValueError if req.json() can't parse the json
+        _LOGGER.exception("Error executing batch")
+
+    return None
+
+
+def fire_events(api, events):
+    """Fire a list of events at remote API using a single request."""
+    if len(events) == 1:
+        fire_event(api, events[0].event_type, events[0].data)
+        return
+
+    operations = [{'type': BATCH_FIRE_EVENT,
+                   'event_type': event.event_type,
+                   'event_data': event.data} for event in events]
+
+    try:
+        req = api(METHOD_POST, URL_API_BATCH, operations)
+
+    except HomeAssistantError:
+        _LOGGER.exception("Error firing events")
+        return
+
+    if req.status_code in (HTTP_NOT_FOUND, HTTP_METHOD_NOT_ALLOWED):
+        # Remote API does not support batches, fire events one by one
+        for event in events:
+            fire_event(api, event.event_type, event.data)
+
+    elif req.status_code != 200:
+        # The batch might have been partially executed, retrying could
+        # fire events twice
+        _LOGGER.error("Error firing events: %d - %s",
+                      req.status_code, req.text)
+
+
 def get_state(api, entity_id):
     """Query given API for state of entity_id."""
     try:
@@ -0,0 +1,218 @@
+"""Script to run benchmarks of performance critical code."""
+import argparse
+from collections import OrderedDict
+import time
+from typing import List
+
+BENCHMARKS = OrderedDict()
+
+
+def run(script_args: List) -> int:
+    """Handle benchmark commandline script."""
+    parser = argparse.ArgumentParser(
+        description=("Run a benchmark of Home Assistant code."))
+    parser.add_argument(
+        '--script', choices=['benchmark'])
+    parser.add_argument(
+        'name', choices=list(BENCHMARKS),
+        help="Benchmark to run")
+
+    args = parser.parse_args()
+
+    for label, seconds in BENCHMARKS[args.name]():
+        print('{}: {:.3f} seconds'.format(label, seconds))
+
+    return 0
+
+
+def benchmark(func):
+    """Register a benchmark.
+
+    A benchmark returns a list of (label, seconds) tuples.
+    """
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def _match_topic(subscription, topic):
+    """Test if topic matches subscription by comparing every level."""
+    if subscription.endswith('#'):
+        return (subscription[:-2] == topic or
+                topic.startswith(subscription[:-1]))
+
+    sub_parts = subscription.split('/')
+    topic_parts = topic.split('/')
+
+    return (len(sub_parts) == len(topic_parts) and
+            all(a == b for a, b in zip(sub_parts, topic_parts) if a != '+'))
+
+
+@benchmark
+def mqtt_router(subscriptions=400, messages=10000):
+    """Match MQTT messages against many subscriptions.
+
+    Compares testing every subscription with the topic router.
+    """
+    from homeassistant.components.mqtt.router import TopicRouter
+
+    topics = ['home/sensor_{}/state'.format(i) for i in range(subscriptions)]
+    topics[:3] = ['home/+/state', 'home/#', 'owntracks/+/+']
+    incoming = ['home/sensor_{}/state'.format(i % (subscriptions * 2))
+                for i in range(messages)]
+
+    start = time.perf_counter()
+    for topic in incoming:
+        [sub for sub in topics if _match_topic(sub, topic)]
+    linear = time.perf_counter() - start
+
+    router = TopicRouter()
+    for sub in topics:
+        router.add(sub, sub)
+
+    start = time.perf_counter()
+    for topic in incoming:
+        router.match(topic)
+    routed = time.perf_counter() - start
+
+    return [('Test every subscription', linear), ('Topic router', routed)]
+
+
+@benchmark
+def zwave_discovery(nodes=200, values_per_node=40):
+    """Discover the values of a simulated Z-Wave network.
+
+    Compares testing every discovery rule with the discovery index and
+    counts the platform loads with and without batching.
+    """
+    from types import SimpleNamespace
+    from homeassistant.components import zwave
+    from homeassistant.components.zwave import const
+
+    generics = [const.GENERIC_TYPE_SWITCH_BINARY,
+                const.GENERIC_TYPE_SWITCH_MULTILEVEL,
+                const.GENERIC_TYPE_SENSOR_MULTILEVEL,
+                const.GENERIC_TYPE_SENSOR_BINARY,
+                const.GENERIC_TYPE_THERMOSTAT]
+    command_classes = [const.COMMAND_CLASS_SWITCH_BINARY,
+                       const.COMMAND_CLASS_SWITCH_MULTILEVEL,
+                       const.COMMAND_CLASS_SENSOR_MULTILEVEL,
+                       const.COMMAND_CLASS_SENSOR_BINARY,
+                       const.COMMAND_CLASS_METER,
+                       const.COMMAND_CLASS_CONFIGURATION]
+    types = [const.TYPE_BOOL, const.TYPE_BYTE, const.TYPE_DECIMAL]
+    values = []
+
+    for node_id in range(nodes):
+        node = SimpleNamespace(
+            node_id=node_id, generic=generics[node_id % len(generics)],
+            specific=const.SPECIFIC_TYPE_NOT_USED)
+        for index in range(values_per_node):
+            values.append((node, SimpleNamespace(
+                command_class=command_classes[index % len(command_classes)],
+                type=types[index % len(types)],
+                genre=const.GENRE_USER)))
+
+    def linear(node, value):
+        """Test every discovery rule."""
+        return [component for (component, generic, specific,
+                               command_class, value_type, value_genre)
+                in zwave.DISCOVERY_COMPONENTS
+                if (node.generic in generic or None in generic) and
+                (node.specific in specific or None in specific) and
+                (value.command_class in command_class or
+                 None in command_class) and
+                value_type in (None, value.type) and
+                value_genre in (None, value.genre)]
+
+    start = time.perf_counter()
+    loads = sum(len(linear(node, value)) for node, value in values)
+    scanned = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batches = {}
+    for node, value in values:
+        for component in zwave.discovery_components(node, value):
+            batches.setdefault(component, []).append(
+                (node.node_id, id(value)))
+    indexed = time.perf_counter() - start
+
+    return [('Test every rule, {} platform loads'.format(loads), scanned),
+            ('Discovery index, {} platform loads'.format(len(batches)),
+             indexed)]
+
+
+@benchmark
+def service_calls(total=10000):
+    """Make blocking service calls with increasing concurrency."""
+    import asyncio
+    from homeassistant import core
+
+    hass = core.HomeAssistant(asyncio.new_event_loop())
+
+    @core.callback
+    def noop(call):
+        """Do nothing."""
+
+    hass.services.async_register('benchmark', 'noop', noop)
+
+    @asyncio.coroutine
+    def call_concurrently(concurrency):
+        """Make total calls, concurrency at a time."""
+        for _ in range(total // concurrency):
+            yield from asyncio.gather(*(
+                hass.services.async_call('benchmark', 'noop', blocking=True)
+                for _ in range(concurrency)), loop=hass.loop)
+
+    results = []
+
+    for concurrency in (1, 100, 1000):
+        start = time.perf_counter()
+        hass.loop.run_until_complete(call_concurrently(concurrency))
+        results.append(('{} blocking calls, {} concurrently'.format(
+            total, concurrency), time.perf_counter() - start))
+
+    hass.executor.shutdown()
+    hass.loop.close()
+
+    return results
+
+
+@benchmark
+def reproduce_state(entities=200):
+    """Activate a scene of many lights with different brightness."""
+    import asyncio
+    from homeassistant import core
+    from homeassistant.const import ATTR_ENTITY_ID
+    from homeassistant.helpers.state import async_reproduce_state
+
+    hass = core.HomeAssistant(asyncio.new_event_loop())
+
+    @core.callback
+    def turn_on(call):
+        """Turn the lights on."""
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            hass.states.async_set(entity_id, 'on', {
+                'brightness': call.data.get('brightness')})
+
+    hass.services.async_register('light', 'turn_on', turn_on)
+
+    scene = []
+    for index in range(entities):
+        entity_id = 'light.benchmark_{}'.format(index)
+        hass.states.async_set(entity_id, 'off')
+        scene.append(core.State(entity_id, 'on', {
+            'brightness': index % 10 * 25}))
+
+    results = []
+
+    for label in ('Activate {} entities'.format(entities),
+                  'Activate again, all entities in the scene state'):
+        start = time.perf_counter()
+        hass.loop.run_until_complete(
+            async_reproduce_state(hass, scene, True))
+        results.append((label, time.perf_counter() - start))
+
+    hass.executor.shutdown()
+    hass.loop.close()
+
+    return results
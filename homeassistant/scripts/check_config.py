@@ -31,6 +31,8 @@ MOCKS = {
 }
 SILENCE = (
     'homeassistant.bootstrap.clear_secret_cache',
+    'homeassistant.config.load_cache',
+    'homeassistant.config.save_cache',
     'homeassistant.core._LOGGER.info',
     'homeassistant.loader._LOGGER.info',
     'homeassistant.bootstrap._LOGGER.info',
@@ -178,9 +180,12 @@ def check(config_path):
 
         if module is None:
             # Ensure list
-            res['except'][ERROR_STR] = res['except'].get(ERROR_STR, [])
-            res['except'][ERROR_STR].append('{} not found: {}'.format(
-                'Platform' if '.' in comp_name else 'Component', comp_name))
+            errors = res['except'].setdefault(ERROR_STR, [])
+            error = '{} not found: {}'.format(
+                'Platform' if '.' in comp_name else 'Component', comp_name)
+            # Platforms are looked up again when they are set up
+            if error not in errors:
+                errors.append(error)
             return None
 
         # Test if platform/component and overwrite setup
@@ -229,6 +234,8 @@ def check(config_path):
         pat.start()
     # Ensure !secrets point to the patched function
     yaml.yaml.SafeLoader.add_constructor('!secret', yaml._secret_yaml)
+    # Parse all files so the used files and secrets are recorded
+    yaml.clear_cache()
 
     try:
         with patch('homeassistant.util.logging.AsyncHandler._process'):
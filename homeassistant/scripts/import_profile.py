@@ -0,0 +1,74 @@
+"""Script to rank the imports of the configured components by duration."""
+import argparse
+import os
+import time
+from types import SimpleNamespace
+from typing import List
+
+import homeassistant.bootstrap as bootstrap
+import homeassistant.config as config_util
+import homeassistant.core as core
+import homeassistant.loader as loader
+from homeassistant.exceptions import HomeAssistantError
+
+
+def run(script_args: List) -> int:
+    """Handle import profile commandline script."""
+    parser = argparse.ArgumentParser(
+        description=("Rank the imports of the components and platforms of "
+                     "a Home Assistant configuration by duration."))
+    parser.add_argument(
+        '--script', choices=['import_profile'])
+    parser.add_argument(
+        '-c', '--config',
+        default=config_util.get_default_config_dir(),
+        help="Directory that contains the Home Assistant configuration")
+    parser.add_argument(
+        '-l', '--limit',
+        type=int, default=20,
+        help="Number of imports to show")
+
+    args = parser.parse_args()
+
+    config_dir = os.path.join(os.getcwd(), args.config)
+    config_path = config_util.find_config_file(config_dir)
+    if config_path is None:
+        print('Config does not exist in', config_dir)
+        return 1
+
+    try:
+        config = config_util.load_yaml_config_file(config_path)
+    except HomeAssistantError as err:
+        print('Unable to load configuration:', err)
+        return 1
+
+    times, total = profile(config_dir, config)
+
+    print('Imported {} modules in {:.3f} seconds'.format(len(times), total))
+    for path, seconds in sorted(times.items(), key=lambda item: item[1],
+                                reverse=True)[:args.limit]:
+        print('{:8.3f}s  {}'.format(seconds, path))
+
+    return 0
+
+
+def profile(config_dir: str, config: dict):
+    """Import the configured components and platforms one by one.
+
+    Returns the import time per module and the total time.
+    """
+    conf = core.Config()
+    conf.config_dir = config_dir
+    loader.prepare(SimpleNamespace(config=conf))
+
+    components = set(key.split(' ')[0] for key in config.keys()
+                     if key != core.DOMAIN)
+
+    start = time.perf_counter()
+    load_order = loader.load_order_components(components)
+
+    # pylint: disable=protected-access
+    for platform in bootstrap._configured_platforms(load_order, config):
+        loader.get_component(platform)
+
+    return loader.import_times(), time.perf_counter() - start
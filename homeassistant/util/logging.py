@@ -1,9 +1,11 @@
 """Logging utilities."""
 import asyncio
 import logging
+import logging.handlers
 import threading
 
-from .async import run_coroutine_threadsafe
+# Records buffered for the writer thread before new records are dropped
+MAX_BUFFERED_RECORDS = 10000
 
 
 class HideSensitiveDataFilter(logging.Filter):
@@ -23,13 +25,21 @@ class HideSensitiveDataFilter(logging.Filter):
 
 # pylint: disable=invalid-name
 class AsyncHandler(object):
-    """Logging handler wrapper to add a async layer."""
+    """Logging handler wrapper to add a async layer.
 
-    def __init__(self, loop, handler):
+    Records are buffered and written by a thread in batches, so logging
+    never waits for the disk or wakes up the event loop. When the buffer is
+    full, new records are dropped and counted in dropped.
+    """
+
+    def __init__(self, loop, handler, max_records=MAX_BUFFERED_RECORDS):
         """Initialize async logging handler wrapper."""
         self.handler = handler
         self.loop = loop
-        self._queue = asyncio.Queue(loop=loop)
+        self.dropped = 0
+        self._max_records = max_records
+        self._records = []
+        self._condition = threading.Condition()
         self._thread = threading.Thread(target=self._process)
 
         # Delegate from handler
@@ -39,7 +49,6 @@ class AsyncHandler(object):
         self.removeFilter = handler.removeFilter
         self.filter = handler.filter
         self.flush = handler.flush
-        self.handle = handler.handle
         self.handleError = handler.handleError
         self.format = handler.format
 
@@ -55,22 +64,28 @@ class AsyncHandler(object):
 
         When blocking=True, will wait till closed.
         """
-        yield from self._queue.put(None)
+        self.emit(None)
 
         if blocking:
             while self._thread.is_alive():
                 yield from asyncio.sleep(0, loop=self.loop)
 
+    def handle(self, record):
+        """Buffer the record if it passes the filters of the handler."""
+        if self.filter(record):
+            self.emit(record)
+
     def emit(self, record):
-        """Process a record."""
-        ident = self.loop.__dict__.get("_thread_ident")
+        """Buffer a record for the writer thread."""
+        with self._condition:
+            # Never drop the None that closes the handler
+            if len(self._records) >= self._max_records and \
+                    record is not None:
+                self.dropped += 1
+                return
 
-        # inside eventloop
-        if ident is not None and ident == threading.get_ident():
-            self._queue.put_nowait(record)
-        # from a thread/executor
-        else:
-            self.loop.call_soon_threadsafe(self._queue.put_nowait, record)
+            self._records.append(record)
+            self._condition.notify()
 
     def __repr__(self):
         """String name of this."""
@@ -78,15 +93,66 @@ class AsyncHandler(object):
 
     def _process(self):
         """Process log in a thread."""
-        while True:
-            record = run_coroutine_threadsafe(
-                self._queue.get(), self.loop).result()
+        reported = 0
 
-            if record is None:
+        while True:
+            with self._condition:
+                while not self._records:
+                    self._condition.wait()
+
+                records = self._records
+                self._records = []
+                dropped = self.dropped
+
+            if dropped > reported:
+                # Records were dropped after the buffered ones
+                index = len(records) - 1 if records[-1] is None \
+                    else len(records)
+                records.insert(index, logging.makeLogRecord({
+                    'name': __name__,
+                    'levelno': logging.WARNING,
+                    'levelname': logging.getLevelName(logging.WARNING),
+                    'msg': "Logging too fast, dropped %d records",
+                    'args': (dropped - reported,),
+                }))
+                reported = dropped
+
+            if not self._write(records):
                 self.handler.close()
                 return
 
-            self.handler.emit(record)
+    def _write(self, records):
+        """Write a batch of records to the handler and flush it once.
+
+        Returns False when the handler should be closed.
+        """
+        handler = self.handler
+        # Stream handlers flush after each record they emit, write their
+        # stream directly instead. Rotating handlers have to check each one.
+        direct = isinstance(handler, logging.StreamHandler) and \
+            not isinstance(handler, logging.handlers.BaseRotatingHandler)
+
+        handler.acquire()
+        try:
+            for record in records:
+                if record is None:
+                    return False
+
+                if not direct or handler.stream is None:
+                    # A file handler opens a delayed stream when emitting
+                    handler.emit(record)
+                    continue
+
+                try:
+                    handler.stream.write(
+                        handler.format(record) + handler.terminator)
+                except Exception:  # pylint: disable=broad-except
+                    handler.handleError(record)
+        finally:
+            handler.release()
+            handler.flush()
+
+        return True
 
     def createLock(self):
         """Ignore lock stuff."""
@@ -1,4 +1,5 @@
 """Helpers to install PyPi packages."""
+import json
 import logging
 import os
 import subprocess
@@ -6,13 +7,19 @@ import sys
 import threading
 from urllib.parse import urlparse
 
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 import pkg_resources
 
 _LOGGER = logging.getLogger(__name__)
 INSTALL_LOCK = threading.Lock()
 
+# File inside the lib dir that holds the index of installed distributions
+INDEX_FILE = '.ha_installed.json'
+
+# In-memory index per lib dir: lib_dir -> (mtime, {key: version}, stored)
+_LIB_DIR_INDEX = {}  # type: Dict[str, tuple]
+
 
 def install_package(package: str, upgrade: bool=True,
                     target: Optional[str]=None) -> bool:
@@ -20,13 +27,29 @@ def install_package(package: str, upgrade: bool=True,
 
     Return boolean if install successful.
     """
+    return install_packages([package], upgrade, target)
+
+
+def install_packages(packages: Sequence[str], upgrade: bool=True,
+                     target: Optional[str]=None) -> bool:
+    """Install packages that are missing using a single pip invocation.
+
+    Return boolean if all packages are installed.
+    """
     # Not using 'import pip; pip.main([])' because it breaks the logger
     with INSTALL_LOCK:
-        if check_package_exists(package, target):
+        missing = [package for package in packages
+                   if not check_package_exists(package, target)]
+
+        if target is not None:
+            _store_lib_dir_index(target)
+
+        if not missing:
             return True
 
-        _LOGGER.info('Attempting install of %s', package)
-        args = [sys.executable, '-m', 'pip', 'install', '--quiet', package]
+        _LOGGER.info('Attempting install of %s', ', '.join(missing))
+        args = [sys.executable, '-m', 'pip', 'install', '--quiet']
+        args.extend(missing)
         if upgrade:
             args.append('--upgrade')
         if target:
@@ -35,7 +58,8 @@ def install_package(package: str, upgrade: bool=True,
         try:
             return subprocess.call(args) == 0
         except subprocess.SubprocessError:
-            _LOGGER.exception('Unable to install pacakge %s', package)
+            _LOGGER.exception('Unable to install pacakge %s',
+                              ', '.join(missing))
             return False
 
 
@@ -53,10 +77,74 @@ def check_package_exists(package: str, lib_dir: str) -> bool:
 
     # Check packages from lib dir
     if lib_dir is not None:
-        if any(dist in req for dist in
-               pkg_resources.find_distributions(lib_dir)):
+        version = get_lib_dir_index(lib_dir).get(req.key)
+
+        if version is not None and \
+                req.specifier.contains(version, prereleases=True):
             return True
 
     # Check packages from global + virtual environment
-    # pylint: disable=not-an-iterable
-    return any(dist in req for dist in pkg_resources.working_set)
+    dist = pkg_resources.working_set.by_key.get(req.key)
+
+    return dist is not None and dist in req
+
+
+def get_lib_dir_index(lib_dir: str) -> Dict[str, str]:
+    """Return the versions of the distributions installed in lib_dir.
+
+    The index is only rebuilt when the modification time of lib_dir
+    changed, which happens when pip installs a package.
+    """
+    try:
+        mtime = os.stat(lib_dir).st_mtime
+    except OSError:
+        return {}
+
+    cached = _LIB_DIR_INDEX.get(lib_dir)
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(os.path.join(lib_dir, INDEX_FILE)) as index_file:
+            stored = json.load(index_file)
+
+        if stored['mtime'] == mtime:
+            _LIB_DIR_INDEX[lib_dir] = (mtime, stored['distributions'], True)
+            return stored['distributions']
+
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    dists = {dist.key: dist.version for dist
+             in pkg_resources.find_distributions(lib_dir)}
+    _LIB_DIR_INDEX[lib_dir] = (mtime, dists, False)
+
+    return dists
+
+
+def _store_lib_dir_index(lib_dir: str) -> None:
+    """Store the index of lib_dir so the next start can skip the scan."""
+    cached = _LIB_DIR_INDEX.get(lib_dir)
+
+    if cached is None or cached[2]:
+        return
+
+    mtime, dists, _ = cached
+    index_path = os.path.join(lib_dir, INDEX_FILE)
+
+    try:
+        if not os.path.isfile(index_path):
+            # Creating the file changes the mtime of lib_dir
+            open(index_path, 'w').close()
+            mtime = os.stat(lib_dir).st_mtime
+
+        with open(index_path, 'w') as index_file:
+            json.dump({'mtime': mtime, 'distributions': dists}, index_file)
+
+    except OSError:
+        _LOGGER.warning('Unable to store index of installed packages in %s',
+                        lib_dir)
+        return
+
+    _LIB_DIR_INDEX[lib_dir] = (mtime, dists, True)
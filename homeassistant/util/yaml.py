@@ -1,10 +1,15 @@
 """YAML utility functions."""
+import hashlib
+import io
+import json
 import logging
 import os
 import sys
+import threading
+import time
 import fnmatch
 from collections import OrderedDict
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional
 
 import yaml
 try:
@@ -18,6 +23,24 @@ _LOGGER = logging.getLogger(__name__)
 _SECRET_NAMESPACE = 'homeassistant'
 _SECRET_YAML = 'secrets.yaml'
 __SECRET_CACHE = {}  # type: Dict
+_SECRET_TAG = '!secret'
+
+# Bump when the format of the stored parse cache changes
+_CACHE_VERSION = 3
+# Files modified this shortly before they were read can change again without
+# a visible change of modification time, their contents are compared instead
+_RACY_SECONDS = 2
+# Parsed files: path -> (dependencies, tree encoded to JSON types)
+_PARSE_CACHE = {}  # type: Dict[str, tuple]
+_PARSE_CACHE_STATE = {'dirty': False, 'loaded': set()}
+# Dependencies that are collected while loading files, one frame per file
+_TRACKING = threading.local()
+# Dependency that makes the file that uses it impossible to cache
+_UNCACHEABLE = ('uncacheable', None)
+# The !secret nodes of a file that were resolved and that were recorded as
+# references to the secret in the tree. Only the latter can be cached.
+_SECRETS_RESOLVED = ('secrets', 'resolved')
+_SECRETS_RECORDED = ('secrets', 'recorded')
 
 
 # pylint: disable=too-many-ancestors
@@ -33,20 +56,284 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+class NodeListClass(list):
+    """Wrapper class to be able to add attributes on a list."""
+
+    pass
+
+
 def load_yaml(fname: str) -> Union[List, Dict]:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed files are cached together with the fingerprints of all the files,
+    directories and environment variables they depend on. A file is only
+    parsed again when one of these changed. Secrets are not cached, they are
+    looked up again every time a file using them is loaded.
+    """
+    entry = _PARSE_CACHE.get(fname)
+
+    if entry is not None and _dependencies_valid(entry[0]):
+        return _cache_hit(entry)
+
+    now = time.time()
+    stat = _stat(fname)
+
     try:
-        with open(fname, encoding='utf-8') as conf_file:
-            # If configuration file is empty YAML returns None
-            # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or {}
-    except yaml.YAMLError as exc:
-        _LOGGER.error(exc)
-        raise HomeAssistantError(exc)
+        with open(fname, encoding='utf-8', newline='') as conf_file:
+            content = conf_file.read()
     except UnicodeDecodeError as exc:
         _LOGGER.error('Unable to read file %s: %s', fname, exc)
         raise HomeAssistantError(exc)
 
+    data = content.encode('utf-8')
+    fingerprint = None
+    if stat is not None and stat[1] == len(data):
+        fingerprint = stat + (hashlib.sha1(data).hexdigest(), now)
+
+    if entry is not None and fingerprint is not None and \
+            entry[0][('file', fname)][2] == fingerprint[2] and \
+            _dependencies_valid(entry[0], fname):
+        # Only the modification time changed
+        entry[0][('file', fname)] = fingerprint
+        _PARSE_CACHE_STATE['dirty'] = True
+        return _cache_hit(entry)
+
+    stream = io.StringIO(content)
+    setattr(stream, 'name', fname)
+    frames = _tracking_frames()
+    frames.append({})
+
+    try:
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        result = yaml.load(stream, Loader=SafeLineLoader) or {}
+    except yaml.YAMLError as exc:
+        _LOGGER.error(exc)
+        raise HomeAssistantError(exc)
+    finally:
+        dependencies = frames.pop()
+
+    if dependencies.pop(_SECRETS_RESOLVED, set()) != \
+            dependencies.pop(_SECRETS_RECORDED, set()):
+        # A secret is used where its value would end up in the cache
+        dependencies[_UNCACHEABLE] = True
+
+    dependencies[('file', fname)] = fingerprint
+    _add_dependencies(dependencies)
+
+    if fingerprint is None or _UNCACHEABLE in dependencies or \
+            os.path.basename(fname) == _SECRET_YAML:
+        _PARSE_CACHE.pop(fname, None)
+        return result
+
+    try:
+        _PARSE_CACHE[fname] = (dependencies, _encode(result))
+        _PARSE_CACHE_STATE['dirty'] = True
+    except TypeError:
+        _LOGGER.debug('Unable to cache %s', fname)
+        _PARSE_CACHE.pop(fname, None)
+
+    return result
+
+
+def load_cache(cache_path: str) -> None:
+    """Load the parse cache stored at cache_path.
+
+    The stored cache is only read once per path.
+    """
+    if cache_path in _PARSE_CACHE_STATE['loaded']:
+        return
+
+    _PARSE_CACHE_STATE['loaded'].add(cache_path)
+
+    try:
+        with open(cache_path, encoding='utf-8') as cache_file:
+            stored = json.load(cache_file)
+
+        if stored['version'] != _CACHE_VERSION:
+            return
+
+        entries = {
+            fname: ({(kind, name): tuple(value) if isinstance(value, list)
+                     else value for kind, name, value in dependencies}, tree)
+            for fname, (dependencies, tree) in stored['entries'].items()}
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        _LOGGER.warning('Unable to read configuration cache %s', cache_path)
+        return
+
+    for fname, entry in entries.items():
+        _PARSE_CACHE.setdefault(fname, entry)
+
+
+def save_cache(cache_path: str) -> None:
+    """Store the parse cache at cache_path if it changed."""
+    if not _PARSE_CACHE_STATE['dirty']:
+        return
+
+    _PARSE_CACHE_STATE['dirty'] = False
+
+    entries = {
+        fname: ([[kind, name, value] for (kind, name), value
+                 in dependencies.items()], tree)
+        for fname, (dependencies, tree) in _PARSE_CACHE.items()}
+
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as cache_file:
+            json.dump({'version': _CACHE_VERSION, 'entries': entries},
+                      cache_file)
+    except OSError:
+        _LOGGER.warning('Unable to store configuration cache %s', cache_path)
+
+
+def clear_cache() -> None:
+    """Clear the parse cache."""
+    _PARSE_CACHE.clear()
+    _PARSE_CACHE_STATE['dirty'] = False
+    _PARSE_CACHE_STATE['loaded'].clear()
+
+
+def _cache_hit(entry: tuple) -> Union[List, Dict]:
+    """Return a copy of a cached tree and track its dependencies."""
+    _add_dependencies(entry[0])
+    return _decode(entry[1])
+
+
+def _encode(obj):
+    """Convert a loaded tree to JSON types.
+
+    Values loaded with !secret are stored as a reference to the secret.
+    Raises TypeError for values that can not be converted.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+
+    secrets = getattr(obj, '__secrets__', {})
+
+    if isinstance(obj, dict):
+        encoded = {'map': [
+            [_encode(key), {'secret': secrets[key]} if key in secrets
+             else _encode(value)] for key, value in obj.items()]}
+    elif isinstance(obj, list):
+        encoded = {'seq': [
+            {'secret': secrets[index]} if index in secrets
+            else _encode(value) for index, value in enumerate(obj)]}
+    else:
+        raise TypeError('Unable to encode {}'.format(type(obj).__name__))
+
+    if hasattr(obj, '__config_file__'):
+        encoded['file'] = obj.__config_file__
+        encoded['line'] = obj.__line__
+
+    return encoded
+
+
+def _decode(obj):
+    """Build a loaded tree from JSON types, looking up the secrets."""
+    if not isinstance(obj, dict):
+        return obj
+
+    fname = obj.get('file')
+    secrets = {}
+
+    def decode_value(key, value):
+        """Decode a value, looking it up if it references a secret."""
+        if isinstance(value, dict) and 'secret' in value:
+            secrets[key] = value['secret']
+            return _resolve_secret(os.path.dirname(fname), value['secret'])
+        return _decode(value)
+
+    if 'map' in obj:
+        result = OrderedDict()
+        for key, value in obj['map']:
+            key = _decode(key)
+            result[key] = decode_value(key, value)
+    else:
+        result = NodeListClass() if fname is not None else []
+        for index, value in enumerate(obj['seq']):
+            result.append(decode_value(index, value))
+
+    if fname is not None:
+        setattr(result, '__config_file__', fname)
+        setattr(result, '__line__', obj['line'])
+    if secrets:
+        setattr(result, '__secrets__', secrets)
+
+    return result
+
+
+def _stat(fname: str) -> Optional[tuple]:
+    """Return modification time and size of a file or None if missing."""
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+def _sha1(fname: str) -> Optional[str]:
+    """Return the SHA1 of the contents of a file or None if unreadable."""
+    try:
+        with open(fname, 'rb') as fil:
+            return hashlib.sha1(fil.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _tracking_frames() -> List[Dict]:
+    """Return the dependency frames of the files loading in this thread."""
+    frames = getattr(_TRACKING, 'frames', None)
+    if frames is None:
+        frames = _TRACKING.frames = []
+    return frames
+
+
+def _track_secret(kind: tuple, node: yaml.nodes.Node) -> None:
+    """Track a !secret node of the file that is being loaded."""
+    frames = _tracking_frames()
+    if frames:
+        frames[-1].setdefault(kind, set()).add(id(node))
+
+
+def _add_dependencies(dependencies: Dict) -> None:
+    """Add dependencies to the file that is being loaded."""
+    frames = _tracking_frames()
+    if frames:
+        frames[-1].update(dependencies)
+
+
+def _dependencies_valid(dependencies: Dict, skip: str=None) -> bool:
+    """Return if none of the dependencies changed."""
+    for (kind, name), value in dependencies.items():
+        if kind == 'file':
+            if name == skip:
+                continue
+            stat = _stat(name)
+            if stat is None or value is None:
+                valid = stat is None and value is None
+            elif value[:2] != stat:
+                valid = False
+            elif stat[0] + _RACY_SECONDS <= value[3]:
+                valid = True
+            else:
+                now = time.time()
+                valid = _sha1(name) == value[2]
+                if valid:
+                    dependencies[(kind, name)] = stat + (value[2], now)
+                    _PARSE_CACHE_STATE['dirty'] = True
+        elif kind == 'dir':
+            valid = tuple(_find_files(name, '*.yaml')) == value
+        elif kind == 'env':
+            valid = os.environ.get(name) == value
+        else:
+            valid = False
+
+        if not valid:
+            return False
+
+    return True
+
 
 def dump(_dict: dict) -> str:
     """Dump yaml to a string and remove null."""
@@ -88,27 +375,41 @@ def _find_files(directory: str, pattern: str):
                 yield filename
 
 
+def _find_dir_files(directory: str):
+    """Find the YAML files in a directory and track the listing."""
+    files = tuple(_find_files(directory, '*.yaml'))
+    _add_dependencies({('dir', directory): files})
+    return files
+
+
 def _include_dir_named_yaml(loader: SafeLineLoader,
                             node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping = OrderedDict()  # type: OrderedDict
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, '*.yaml'):
+    for fname in _find_dir_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         mapping[filename] = load_yaml(fname)
     return mapping
 
 
+def _merged_secrets(loaded_yaml: Union[List, Dict]) -> None:
+    """Do not cache secrets that lose their reference by being merged."""
+    if hasattr(loaded_yaml, '__secrets__'):
+        _add_dependencies({_UNCACHEABLE: True})
+
+
 def _include_dir_merge_named_yaml(loader: SafeLineLoader,
                                   node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping = OrderedDict()  # type: OrderedDict
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, '*.yaml'):
+    for fname in _find_dir_files(loc):
         if os.path.basename(fname) == _SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname)
         if isinstance(loaded_yaml, dict):
+            _merged_secrets(loaded_yaml)
             mapping.update(loaded_yaml)
     return mapping
 
@@ -117,7 +418,7 @@ def _include_dir_list_yaml(loader: SafeLineLoader,
                            node: yaml.nodes.Node):
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    return [load_yaml(f) for f in _find_files(loc, '*.yaml')
+    return [load_yaml(f) for f in _find_dir_files(loc)
             if os.path.basename(f) != _SECRET_YAML]
 
 
@@ -127,11 +428,12 @@ def _include_dir_merge_list_yaml(loader: SafeLineLoader,
     loc = os.path.join(os.path.dirname(loader.name),
                        node.value)  # type: str
     merged_list = []  # type: List
-    for fname in _find_files(loc, '*.yaml'):
+    for fname in _find_dir_files(loc):
         if os.path.basename(fname) == _SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname)
         if isinstance(loaded_yaml, list):
+            _merged_secrets(loaded_yaml)
             merged_list.extend(loaded_yaml)
     return merged_list
 
@@ -143,9 +445,14 @@ def _ordered_dict(loader: SafeLineLoader,
     nodes = loader.construct_pairs(node)
 
     seen = {}  # type: Dict
-    for (key, _), (child_node, _) in zip(nodes, node.value):
+    secrets = {}  # type: Dict
+    for (key, _), (child_node, value_node) in zip(nodes, node.value):
         line = child_node.start_mark.line
 
+        if value_node.tag == _SECRET_TAG:
+            secrets[key] = value_node.value
+            _track_secret(_SECRETS_RECORDED, value_node)
+
         try:
             hash(key)
         except TypeError:
@@ -168,6 +475,8 @@ def _ordered_dict(loader: SafeLineLoader,
     processed = OrderedDict(nodes)
     setattr(processed, '__config_file__', loader.name)
     setattr(processed, '__line__', node.start_mark.line)
+    if secrets:
+        setattr(processed, '__secrets__', secrets)
     return processed
 
 
@@ -175,20 +484,25 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node):
     """Add line number and file name to Load YAML sequence."""
     obj, = loader.construct_yaml_seq(node)
 
-    class NodeClass(list):
-        """Wrapper class to be able to add attributes on a list."""
-
-        pass
-
-    processed = NodeClass(obj)
+    processed = NodeListClass(obj)
     setattr(processed, '__config_file__', loader.name)
     setattr(processed, '__line__', node.start_mark.line)
+
+    secrets = {}
+    for index, item_node in enumerate(node.value):
+        if item_node.tag == _SECRET_TAG:
+            secrets[index] = item_node.value
+            _track_secret(_SECRETS_RECORDED, item_node)
+    if secrets:
+        setattr(processed, '__secrets__', secrets)
+
     return processed
 
 
 def _env_var_yaml(loader: SafeLineLoader,
                   node: yaml.nodes.Node):
     """Load environment variables and embed it into the configuration YAML."""
+    _add_dependencies({('env', node.value): os.environ.get(node.value)})
     if node.value in os.environ:
         return os.environ[node.value]
     else:
@@ -203,6 +517,9 @@ def _load_secret_yaml(secret_path: str) -> Dict:
         return __SECRET_CACHE[secret_path]
 
     _LOGGER.debug('Loading %s', secret_path)
+    # Secrets are looked up on every load, they are no cache dependency
+    frames = _tracking_frames()
+    frames.append({})
     try:
         secrets = load_yaml(secret_path)
         if 'logger' in secrets:
@@ -215,6 +532,9 @@ def _load_secret_yaml(secret_path: str) -> Dict:
             del secrets['logger']
     except FileNotFoundError:
         secrets = {}
+    finally:
+        frames.pop()
+
     __SECRET_CACHE[secret_path] = secrets
     return secrets
 
@@ -223,14 +543,19 @@ def _load_secret_yaml(secret_path: str) -> Dict:
 def _secret_yaml(loader: SafeLineLoader,
                  node: yaml.nodes.Node):
     """Load secrets and embed it into the configuration YAML."""
-    secret_path = os.path.dirname(loader.name)
+    _track_secret(_SECRETS_RESOLVED, node)
+    return _resolve_secret(os.path.dirname(loader.name), node.value)
+
+
+def _resolve_secret(secret_path: str, secret: str):
+    """Look up a secret for a file in the folder secret_path."""
     while True:
         secrets = _load_secret_yaml(secret_path)
 
-        if node.value in secrets:
+        if secret in secrets:
             _LOGGER.debug('Secret %s retrieved from secrets.yaml in '
-                          'folder %s', node.value, secret_path)
-            return secrets[node.value]
+                          'folder %s', secret, secret_path)
+            return secrets[secret]
 
         if secret_path == os.path.dirname(sys.path[0]):
             break  # sys.path[0] set to config/deps folder by bootstrap
@@ -241,13 +566,13 @@ def _secret_yaml(loader: SafeLineLoader,
 
     if keyring:
         # do some keyring stuff
-        pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
+        pwd = keyring.get_password(_SECRET_NAMESPACE, secret)
         if pwd:
-            _LOGGER.debug('Secret %s retrieved from keyring.', node.value)
+            _LOGGER.debug('Secret %s retrieved from keyring.', secret)
             return pwd
 
-    _LOGGER.error('Secret %s not defined.', node.value)
-    raise HomeAssistantError(node.value)
+    _LOGGER.error('Secret %s not defined.', secret)
+    raise HomeAssistantError(secret)
 
 
 yaml.SafeLoader.add_constructor('!include', _include_yaml)
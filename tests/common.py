@@ -150,11 +150,7 @@ def mock_service(hass, domain, service):
 
 def fire_mqtt_message(hass, topic, payload, qos=0):
     """Fire the MQTT message."""
-    hass.bus.fire(mqtt.EVENT_MQTT_MESSAGE_RECEIVED, {
-        mqtt.ATTR_TOPIC: topic,
-        mqtt.ATTR_PAYLOAD: payload,
-        mqtt.ATTR_QOS: qos,
-    })
+    hass.add_job(mqtt.async_dispatch_message, hass, topic, payload, qos)
 
 
 def fire_time_changed(hass, time):
@@ -351,7 +347,7 @@ def patch_yaml_files(files_dict, endswith=True):
     # match using endswith, start search with longest string
     matchlist = sorted(list(files_dict.keys()), key=len) if endswith else []
 
-    def mock_open_f(fname, **_):
+    def mock_open_f(fname, *_, **__):
         """Mock open() in the yaml module, used by load_yaml."""
         # Return the mocked file on full match
         if fname in files_dict:
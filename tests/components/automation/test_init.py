@@ -311,11 +311,23 @@ class TestAutomation(unittest.TestCase):
         self.hass.block_till_done()
         self.assertEqual(1, len(self.calls))
 
+        state = self.hass.states.get('automation.automation_0')
+        self.assertEqual(
+            1, state.attributes.get(automation.ATTR_CONDITION_EVALUATIONS))
+
         self.hass.states.set(entity_id, 101)
         self.hass.bus.fire('test_event')
         self.hass.block_till_done()
         self.assertEqual(1, len(self.calls))
 
+        fire_time_changed(
+            self.hass, dt_util.utcnow() + automation.CONDITION_STATS_DELAY)
+        self.hass.block_till_done()
+
+        state = self.hass.states.get('automation.automation_0')
+        self.assertEqual(
+            2, state.attributes.get(automation.ATTR_CONDITION_EVALUATIONS))
+
         self.hass.states.set(entity_id, 151)
         self.hass.bus.fire('test_event')
         self.hass.block_till_done()
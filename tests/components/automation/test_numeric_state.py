@@ -56,6 +56,53 @@ class TestAutomationNumericState(unittest.TestCase):
         self.hass.block_till_done()
         self.assertEqual(1, len(self.calls))
 
+    def test_if_fires_triggers_of_entity_together(self):
+        """"Test the thresholds of all triggers of an entity are tested."""
+        assert setup_component(self.hass, automation.DOMAIN, {
+            automation.DOMAIN: [{
+                'trigger': {
+                    'platform': 'numeric_state',
+                    'entity_id': ['test.entity', 'test.other'],
+                    'below': 10,
+                },
+                'action': {
+                    'service': 'test.automation',
+                    'data': {'some': 'below 10'},
+                }
+            }, {
+                'trigger': {
+                    'platform': 'numeric_state',
+                    'entity_id': 'test.entity',
+                    'above': 5,
+                    'below': 20,
+                },
+                'action': {
+                    'service': 'test.automation',
+                    'data': {'some': 'between 5 and 20'},
+                }
+            }]
+        })
+        self.hass.states.set('test.entity', 30)
+        self.hass.block_till_done()
+        self.assertEqual(0, len(self.calls))
+
+        self.hass.states.set('test.entity', 15)
+        self.hass.block_till_done()
+        self.assertEqual(['between 5 and 20'],
+                         [call.data['some'] for call in self.calls])
+
+        self.hass.states.set('test.entity', 9)
+        self.hass.block_till_done()
+        self.assertEqual(['between 5 and 20', 'below 10'],
+                         [call.data['some'] for call in self.calls])
+
+        automation.turn_off(self.hass)
+        self.hass.block_till_done()
+        self.hass.states.set('test.entity', 30)
+        self.hass.states.set('test.entity', 9)
+        self.hass.block_till_done()
+        self.assertEqual(2, len(self.calls))
+
     def test_if_fires_on_entity_change_over_to_below(self):
         """"Test the firing with changed entity."""
         self.hass.states.set('test.entity', 11)
@@ -1,4 +1,6 @@
 """Test the Emulated Hue component."""
+import os
+import tempfile
 from unittest.mock import patch
 
 from homeassistant.components.emulated_hue import Config, _LOGGER
@@ -54,3 +56,18 @@ def test_warning_config_google_home_listen_port():
         assert mock_warn.called
         assert mock_warn.mock_calls[0][1][0] == \
             "When targetting Google Home, listening port has to be port 80"
+
+
+def test_config_google_home_numbers_persisted():
+    """Test the numbers of the entities are stored and loaded."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        numbers_path = os.path.join(tmpdir, 'emulated_hue_ids.json')
+
+        conf = Config({'type': 'google_home'}, numbers_path)
+        assert conf.entity_id_to_number('light.test') == '1'
+        assert conf.entity_id_to_number('light.test2') == '2'
+
+        conf = Config({'type': 'google_home'}, numbers_path)
+        assert conf.entity_id_to_number('light.test2') == '2'
+        assert conf.number_to_entity_id('1') == 'light.test'
+        assert conf.entity_id_to_number('light.test3') == '3'
@@ -0,0 +1,69 @@
+"""The tests for the stream queues of the HTTP component."""
+import asyncio
+
+import pytest
+
+from homeassistant.components.http import stream
+
+
+@asyncio.coroutine
+def test_drop_oldest(hass):
+    """Test the oldest message is dropped when full."""
+    queue = stream.StreamQueue(hass, 'test', 2, stream.POLICY_DROP_OLDEST)
+
+    queue.async_put('a', 'light.kitchen')
+    queue.async_put('b')
+    queue.async_put('c', 'light.kitchen')
+
+    assert (yield from queue.async_get()) == 'b'
+    assert (yield from queue.async_get()) == 'c'
+    assert queue.as_dict()['dropped'] == 1
+    assert queue.as_dict()['max_depth'] == 2
+
+
+@asyncio.coroutine
+def test_coalesce(hass):
+    """Test messages with the same key are coalesced when full."""
+    queue = stream.StreamQueue(hass, 'test', 2, stream.POLICY_COALESCE)
+
+    queue.async_put('a', 'light.kitchen')
+    queue.async_put('b')
+    queue.async_put('c', 'light.kitchen')
+    queue.async_put('d')
+    queue.async_close()
+
+    assert (yield from queue.async_get()) == 'b'
+    assert (yield from queue.async_get()) == 'd'
+    assert (yield from queue.async_get()) is None
+    assert queue.coalesced == 1
+    assert queue.dropped == 1
+
+
+@asyncio.coroutine
+def test_disconnect(hass):
+    """Test a slow client is disconnected."""
+    queue = stream.StreamQueue(hass, 'test', 1, stream.POLICY_DISCONNECT)
+
+    queue.async_put('a')
+    queue.async_put('b')
+
+    with pytest.raises(stream.StreamOverflowError):
+        yield from queue.async_get()
+
+
+@asyncio.coroutine
+def test_get_waits_for_message(hass):
+    """Test reading from an empty queue waits for the next message."""
+    queue = stream.StreamQueue(hass, 'test')
+    unregister = queue.async_register()
+
+    task = hass.loop.create_task(queue.async_get())
+    yield from asyncio.sleep(0, loop=hass.loop)
+    assert not task.done()
+
+    queue.async_put('a')
+    assert (yield from task) == 'a'
+
+    assert stream.async_stream_metrics(hass) == [queue.as_dict()]
+    unregister()
+    assert stream.async_stream_metrics(hass) == []
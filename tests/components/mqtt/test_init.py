@@ -270,6 +270,60 @@ class TestMQTTCallbacks(unittest.TestCase):
         self.assertEqual(message.topic, last_event.data['topic'])
         self.assertEqual(message.qos, last_event.data['qos'])
 
+    def test_received_messages_processed_in_order(self):
+        """Test received messages are handed to the loop in order."""
+        calls = []
+
+        @callback
+        def record_call(*args):
+            """Helper to record calls."""
+            calls.append(args)
+
+        mqtt.MQTT_CLIENT._mqttc.subscribe.return_value = (0, 1)
+        mqtt.subscribe(self.hass, 'test_topic', record_call)
+
+        MQTTMessage = namedtuple('MQTTMessage', ['topic', 'qos', 'payload'])
+        for payload in ('1', '2', '3'):
+            mqtt.MQTT_CLIENT._mqtt_on_message(None, None, MQTTMessage(
+                'test_topic', 0, payload.encode('utf-8')))
+        self.hass.block_till_done()
+
+        self.assertEqual(['1', '2', '3'], [call[1] for call in calls])
+        stats = mqtt.MQTT_CLIENT.stats()
+        self.assertEqual(0, stats['depth'])
+        self.assertEqual(3, stats['messages'])
+        self.assertLessEqual(stats['wakeups'], 3)
+
+    def test_receiving_mqtt_message_without_hass_event(self):
+        """Test messages are dispatched when events are disabled."""
+        events = []
+        calls = []
+
+        @callback
+        def record_event(event):
+            """Helper to record events."""
+            events.append(event)
+
+        @callback
+        def record_call(*args):
+            """Helper to record calls."""
+            calls.append(args)
+
+        self.hass.bus.listen(mqtt.EVENT_MQTT_MESSAGE_RECEIVED, record_event)
+        self.hass.data[mqtt.DATA_MQTT_FIRE_EVENTS] = False
+
+        mqtt.MQTT_CLIENT._mqttc.subscribe.return_value = (0, 1)
+        mqtt.subscribe(self.hass, 'test_topic/+', record_call)
+
+        MQTTMessage = namedtuple('MQTTMessage', ['topic', 'qos', 'payload'])
+        message = MQTTMessage('test_topic/1', 1, 'Hello'.encode('utf-8'))
+
+        mqtt.MQTT_CLIENT._mqtt_on_message(None, {'hass': self.hass}, message)
+        self.hass.block_till_done()
+
+        self.assertEqual(0, len(events))
+        self.assertEqual([('test_topic/1', 'Hello', 1)], calls)
+
     def test_mqtt_failed_connection_results_in_disconnect(self):
         """Test if connection failure leads to disconnect."""
         for result_code in range(1, 6):
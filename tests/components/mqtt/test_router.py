@@ -0,0 +1,52 @@
+"""The tests for the MQTT topic router."""
+import unittest
+
+from homeassistant.components.mqtt.router import TopicRouter
+
+
+class TestTopicRouter(unittest.TestCase):
+    """Test the MQTT topic router."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Setup things to be run when tests are started."""
+        self.router = TopicRouter()
+
+    def test_exact_topic(self):
+        """Test matching a topic without wildcards."""
+        self.router.add('home/kitchen/temp', 'exact')
+
+        self.assertEqual(['exact'], self.router.match('home/kitchen/temp'))
+        self.assertEqual([], self.router.match('home/kitchen'))
+        self.assertEqual([], self.router.match('home/kitchen/temp/x'))
+
+    def test_level_wildcard(self):
+        """Test matching a single level wildcard."""
+        self.router.add('home/+/temp', 'level')
+
+        self.assertEqual(['level'], self.router.match('home/kitchen/temp'))
+        self.assertEqual([], self.router.match('home/kitchen/humidity'))
+        self.assertEqual([], self.router.match('home/kitchen'))
+
+    def test_subtree_wildcard(self):
+        """Test matching a subtree wildcard."""
+        self.router.add('home/#', 'subtree')
+        self.router.add('#', 'all')
+
+        self.assertEqual(['all', 'subtree'],
+                         sorted(self.router.match('home/kitchen/temp')))
+        self.assertEqual(['all', 'subtree'],
+                         sorted(self.router.match('home')))
+        self.assertEqual(['all'], self.router.match('garden'))
+
+    def test_remove(self):
+        """Test removing subscribers."""
+        remove_first = self.router.add('home/+/temp', 'first')
+        remove_second = self.router.add('home/+/temp', 'second')
+
+        remove_first()
+        self.assertEqual(['second'], self.router.match('home/kitchen/temp'))
+
+        remove_second()
+        remove_second()
+        self.assertEqual([], self.router.match('home/kitchen/temp'))
+        self.assertEqual({}, self.router._root.children)
@@ -329,6 +329,50 @@ class TestAPI(unittest.TestCase):
 
         self.assertEqual(1, len(test_value))
 
+    def test_api_batch(self):
+        """Test executing several operations in one request."""
+        events = []
+        calls = []
+
+        @ha.callback
+        def event_listener(event):
+            """Record the fired event."""
+            events.append(event)
+
+        @ha.callback
+        def service_listener(service_call):
+            """Record the service call."""
+            calls.append(service_call)
+
+        hass.bus.listen('test_batch_event', event_listener)
+        hass.services.register('test_domain', 'test_batch', service_listener)
+
+        req = requests.post(
+            _url(const.URL_API_BATCH),
+            data=json.dumps([
+                {'type': 'set_state', 'entity_id': 'test.batch',
+                 'state': 'on', 'attributes': {'hello': 'world'}},
+                {'type': 'fire_event', 'event_type': 'test_batch_event',
+                 'event_data': {'test': 1}},
+                {'type': 'call_service', 'domain': 'test_domain',
+                 'service': 'test_batch', 'service_data': {'test': 2}},
+                {'type': 'set_state', 'entity_id': 'test.batch'},
+                {'type': 'unknown'},
+            ]),
+            headers=HA_HEADERS)
+
+        hass.block_till_done()
+
+        self.assertEqual(200, req.status_code)
+        self.assertEqual(
+            [True, True, True, False, False],
+            [result['success'] for result in req.json()])
+        self.assertEqual('on', hass.states.get('test.batch').state)
+        self.assertEqual(1, len(events))
+        self.assertEqual({'test': 1}, events[0].data)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(2, calls[0].data['test'])
+
     def test_api_template(self):
         """Test the template API."""
         hass.states.set('sensor.temperature', 10)
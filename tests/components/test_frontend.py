@@ -2,11 +2,12 @@
 # pylint: disable=protected-access
 import re
 import unittest
+from unittest.mock import patch
 
 import requests
 
 import homeassistant.bootstrap as bootstrap
-from homeassistant.components import http
+from homeassistant.components import api, frontend, http
 from homeassistant.const import HTTP_HEADER_HA_AUTH
 
 from tests.common import get_test_instance_port, get_test_home_assistant
@@ -87,3 +88,61 @@ class TestFrontend(unittest.TestCase):
         hass.states.set('group.existing', 'on', {'view': True})
         req = requests.get(_url("/states/group.existing"))
         self.assertEqual(200, req.status_code)
+
+    def test_bootstrap_updated_and_compressed(self):
+        """Test the bootstrap payload is compressed and kept up to date."""
+        hass.states.set('test.bootstrap', 'on')
+        hass.block_till_done()
+
+        req = requests.get(_url("/api/bootstrap"), headers=HA_HEADERS)
+        self.assertEqual(200, req.status_code)
+        self.assertEqual('gzip', req.headers['Content-Encoding'])
+        states = {state['entity_id']: state for state in req.json()['states']}
+        self.assertEqual('on', states['test.bootstrap']['state'])
+
+        hass.states.set('test.bootstrap', 'off')
+        hass.states.set('test.bootstrap_new', 'on')
+        hass.block_till_done()
+
+        req = requests.get(_url("/api/bootstrap"), headers=dict(
+            HA_HEADERS, **{'Accept-Encoding': 'identity'}))
+        self.assertEqual(200, req.status_code)
+        self.assertNotIn('Content-Encoding', req.headers)
+        states = {state['entity_id']: state for state in req.json()['states']}
+        self.assertEqual('off', states['test.bootstrap']['state'])
+        self.assertEqual('on', states['test.bootstrap_new']['state'])
+
+    def test_bootstrap_parts_invalidated(self):
+        """Test the config, events and panels are only serialized again."""
+        req = requests.get(_url("/api/bootstrap"), headers=HA_HEADERS)
+        self.assertEqual(200, req.status_code)
+
+        with patch.object(api, 'async_events_json',
+                          side_effect=api.async_events_json) as events, \
+                patch.object(hass.config, 'as_dict',
+                             side_effect=hass.config.as_dict) as as_dict:
+            req = requests.get(_url("/api/bootstrap"), headers=HA_HEADERS)
+            self.assertEqual(200, req.status_code)
+            self.assertEqual(0, events.call_count)
+            self.assertEqual(0, as_dict.call_count)
+
+            hass.bus.listen('test_bootstrap_event', lambda event: None)
+            hass.config.components.append('test_bootstrap')
+            hass.bus.fire('component_loaded',
+                          {'component': 'test_bootstrap'})
+            with patch.dict(hass.data, {frontend.DATA_INDEX_VIEW: None}):
+                frontend.register_panel(
+                    hass, 'test-bootstrap', __file__, md5='1234',
+                    url='/test-bootstrap.html')
+            hass.block_till_done()
+
+            req = requests.get(_url("/api/bootstrap"), headers=HA_HEADERS)
+            self.assertEqual(200, req.status_code)
+            self.assertEqual(1, events.call_count)
+            self.assertEqual(1, as_dict.call_count)
+
+        data = req.json()
+        self.assertIn('test_bootstrap', data['config']['components'])
+        self.assertIn('test_bootstrap_event',
+                      [event['event'] for event in data['events']])
+        self.assertIn('test-bootstrap', data['panels'])
@@ -9,6 +9,7 @@ from homeassistant.const import (
     STATE_ON, STATE_OFF, STATE_HOME, STATE_UNKNOWN, ATTR_ICON, ATTR_HIDDEN,
     ATTR_ASSUMED_STATE, STATE_NOT_HOME, )
 import homeassistant.components.group as group
+from homeassistant.helpers.event import DATA_ENTITY_STATE_TRACKER
 
 from tests.common import get_test_home_assistant
 
@@ -336,7 +337,10 @@ class TestComponentsGroup(unittest.TestCase):
 
         assert sorted(self.hass.states.entity_ids()) == \
             ['group.empty_group', 'group.second_group', 'group.test_group']
-        assert self.hass.bus.listeners['state_changed'] == 3
+        assert self.hass.bus.listeners['state_changed'] == 1
+        tracker = self.hass.data[DATA_ENTITY_STATE_TRACKER]
+        assert sorted(tracker._listeners) == \
+            ['hello.world', 'light.bowl', 'sensor.happy']
 
         with patch('homeassistant.config.load_yaml_config_file', return_value={
                 'group': {
@@ -350,6 +354,7 @@ class TestComponentsGroup(unittest.TestCase):
 
         assert self.hass.states.entity_ids() == ['group.hello']
         assert self.hass.bus.listeners['state_changed'] == 1
+        assert list(tracker._listeners) == ['light.bowl']
 
     def test_stopping_a_group(self):
         """Test that a group correctly removes itself."""
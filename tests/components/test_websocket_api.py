@@ -1,13 +1,15 @@
 """Tests for the Home Assistant Websocket API."""
 import asyncio
-from unittest.mock import patch
+from functools import partial
+from unittest.mock import MagicMock, patch
 
 from aiohttp import WSMsgType
 from async_timeout import timeout
 import pytest
 
-from homeassistant.core import callback
+from homeassistant.core import callback, State
 from homeassistant.components import websocket_api as wapi, frontend
+from homeassistant.components.http.stream import StreamQueue
 
 from tests.common import mock_http_component_app
 
@@ -212,6 +214,128 @@ def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+@asyncio.coroutine
+def test_subscribe_states(hass, websocket_client):
+    """Test subscribe_states command."""
+    hass.states.async_set('light.kitchen', 'off', {'brightness': 10})
+    hass.states.async_set('switch.ac', 'on')
+    init_count = sum(hass.bus.async_listeners().values())
+
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_SUBSCRIBE_STATES,
+        'domains': 'light',
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['id'] == 5
+    assert msg['type'] == wapi.TYPE_RESULT
+    assert msg['success']
+    assert list(msg['result']) == ['light.kitchen']
+    assert msg['result']['light.kitchen']['state'] == 'off'
+    assert msg['result']['light.kitchen']['attributes'] == {'brightness': 10}
+
+    # Verify we have a new listener
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set('switch.ac', 'off')
+    hass.states.async_set('light.kitchen', 'on', {'color_temp': 300})
+    hass.states.async_remove('light.kitchen')
+
+    with timeout(3, loop=hass.loop):
+        msg = yield from websocket_client.receive_json()
+
+    assert msg['id'] == 5
+    assert msg['type'] == wapi.TYPE_STATE_DIFF
+    assert msg['entity_id'] == 'light.kitchen'
+    assert msg['diff']['state'] == 'on'
+    assert msg['diff']['attributes'] == {'color_temp': 300}
+    assert msg['diff']['removed_attributes'] == ['brightness']
+
+    with timeout(3, loop=hass.loop):
+        msg = yield from websocket_client.receive_json()
+
+    assert msg['id'] == 5
+    assert msg['entity_id'] == 'light.kitchen'
+    assert msg['diff'] is None
+
+    websocket_client.send_json({
+        'id': 6,
+        'type': wapi.TYPE_UNSUBSCRIBE_EVENTS,
+        'subscription': 5
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['id'] == 6
+    assert msg['type'] == wapi.TYPE_RESULT
+    assert msg['success']
+
+    # Check our listener got unsubscribed
+    assert sum(hass.bus.async_listeners().values()) == init_count
+    assert hass.data[wapi.DATA_STATE_VIEWS] == {}
+
+
+@asyncio.coroutine
+def test_subscribe_states_slow_client(hass, test_client):
+    """Test a slow client is disconnected instead of missing a diff."""
+    websocket_app = mock_http_component_app(hass)
+    wapi.WebsocketAPIView().register(websocket_app.router)
+
+    with patch('homeassistant.components.websocket_api.StreamQueue',
+               partial(StreamQueue, maxsize=2)):
+        client = yield from test_client(websocket_app)
+        websocket_client = yield from client.ws_connect(wapi.URL)
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['type'] == wapi.TYPE_AUTH_OK
+
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_SUBSCRIBE_STATES,
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['success']
+
+    for brightness in range(5):
+        hass.states.async_set('light.kitchen', 'on',
+                              {'brightness': brightness})
+
+    with timeout(3, loop=hass.loop):
+        msg = yield from websocket_client.receive()
+
+    assert msg.type == WSMsgType.CLOSE
+
+
+@asyncio.coroutine
+def test_writer_connection_reset(hass):
+    """Test the writer stops when the client resets the connection."""
+    conn = wapi.ActiveConnection(hass, None)
+    conn.wsock = MagicMock()
+    conn.wsock.drain.side_effect = ConnectionResetError
+    conn.send_message(wapi.pong_message(1))
+    conn.send_message(wapi.pong_message(2))
+
+    with timeout(3, loop=hass.loop):
+        yield from conn._writer()
+
+    assert conn.wsock.send_str.call_count == 1
+
+
+def test_state_diff():
+    """Test computing the diff between two states."""
+    old_state = State('light.kitchen', 'on', {'brightness': 10, 'hello': 1})
+    new_state = State('light.kitchen', 'on', {'brightness': 20, 'hello': 1},
+                      old_state.last_changed)
+
+    assert wapi.state_diff(old_state, new_state) == {
+        'last_updated': new_state.last_updated,
+        'attributes': {'brightness': 20},
+    }
+    assert wapi.state_diff(None, new_state) == wapi.compact_state(new_state)
+    assert wapi.state_diff(old_state, None) is None
+
+
 @asyncio.coroutine
 def test_get_states(hass, websocket_client):
     """Test get_states command."""
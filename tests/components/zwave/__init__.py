@@ -0,0 +1 @@
+"""Tests for the Z-Wave component."""
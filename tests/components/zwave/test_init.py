@@ -0,0 +1,210 @@
+"""Tests for the Z-Wave init."""
+from itertools import product
+import unittest
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components import zwave
+from homeassistant.components.zwave import const
+from homeassistant.util.async import run_callback_threadsafe
+
+from tests.common import get_test_home_assistant, mock_coro
+
+
+class MockNode(object):
+    """Mock Z-Wave node."""
+
+    def __init__(self, node_id=1, generic=None, specific=None):
+        """Initialize the mock node."""
+        self.node_id = node_id
+        self.generic = generic
+        self.specific = specific
+        self.name = 'Mock Node'
+        self.manufacturer_name = 'Test Manufacturer'
+        self.product_name = 'Test Product'
+        self.values = {}
+
+
+class MockValue(object):
+    """Mock Z-Wave value."""
+
+    _next_id = 0
+
+    def __init__(self, node, command_class=None, value_type=None,
+                 genre=const.GENRE_USER, index=0):
+        """Initialize the mock value."""
+        MockValue._next_id += 1
+        self.value_id = MockValue._next_id
+        self.node = node
+        self.command_class = command_class
+        self.type = value_type
+        self.genre = genre
+        self.label = 'Value {}'.format(self.value_id)
+        self.index = index
+        self.instance = 1
+        self.enable_poll = MagicMock()
+        self.disable_poll = MagicMock()
+        node.values[self.value_id] = self
+
+
+def _linear_discovery_components(node, value):
+    """Return the components by testing every discovery rule in order."""
+    return [component for (component, generics, specifics, command_classes,
+                           value_type, value_genre)
+            in zwave.DISCOVERY_COMPONENTS
+            if (node.generic in generics or None in generics) and
+            (node.specific in specifics or None in specifics) and
+            (value.command_class in command_classes or
+             None in command_classes) and
+            value_type in (None, value.type) and
+            value_genre in (None, value.genre)]
+
+
+def test_discovery_components_matches_linear_scan():
+    """Test the discovery index finds what testing every rule finds."""
+    generics, specifics, command_classes = {0}, {0}, {0}
+    for _, generic, specific, command_class, _, _ in \
+            zwave.DISCOVERY_COMPONENTS:
+        generics.update(generic)
+        specifics.update(specific)
+        command_classes.update(command_class)
+
+    found = set()
+
+    for generic, specific, command_class, value_type, genre in product(
+            generics - {None}, specifics - {None}, command_classes - {None},
+            (const.TYPE_BOOL, const.TYPE_BYTE, const.TYPE_DECIMAL),
+            (const.GENRE_USER, const.GENRE_SYSTEM)):
+        node = MockNode(generic=generic, specific=specific)
+        value = MockValue(node, command_class, value_type, genre)
+
+        expected = _linear_discovery_components(node, value)
+        assert zwave.discovery_components(node, value) == expected
+        found.update(expected)
+
+    # All rules have been tested
+    assert found == {rule[0] for rule in zwave.DISCOVERY_COMPONENTS}
+
+
+def test_value_listeners():
+    """Test listeners are only called for their value or node."""
+    node = MockNode(node_id=1)
+    other_node = MockNode(node_id=2)
+    value = MockValue(node)
+    node_value = MockValue(node)
+    other_value = MockValue(other_node)
+    value_calls = []
+    node_calls = []
+
+    with patch.dict(zwave.VALUE_LISTENERS, clear=True), \
+            patch.dict(zwave.NODE_LISTENERS, clear=True):
+        zwave.connect_value_changed(value_calls.append, value)
+        zwave.connect_value_changed(node_calls.append, value, node=True)
+
+        zwave._value_changed(other_value)
+        assert value_calls == []
+        assert node_calls == []
+
+        zwave._value_changed(node_value)
+        assert value_calls == []
+        assert node_calls == [node_value]
+
+        zwave._value_changed(value)
+        assert value_calls == [value]
+        assert node_calls == [node_value, value]
+
+
+def test_value_listener_error():
+    """Test a failing listener does not stop the other listeners."""
+    value = MockValue(MockNode())
+    calls = []
+
+    with patch.dict(zwave.VALUE_LISTENERS, clear=True), \
+            patch.dict(zwave.NODE_LISTENERS, clear=True):
+        zwave.connect_value_changed(MagicMock(side_effect=ValueError), value)
+        zwave.connect_value_changed(calls.append, value, node=True)
+
+        zwave._value_changed(value)
+
+    assert calls == [value]
+
+
+class TestZWaveDiscovery(unittest.TestCase):
+    """Test the loading of platforms for discovered values."""
+
+    def setUp(self):
+        """Set up Z-Wave with mocked openzwave modules."""
+        self.hass = get_test_home_assistant()
+        self.dispatcher = MagicMock()
+        self.network = MagicMock()
+        pydispatch = MagicMock(dispatcher=self.dispatcher)
+        openzwave_network = MagicMock(ZWaveNetwork=self.network)
+
+        with patch.dict('sys.modules', {
+                'libopenzwave': MagicMock(__file__='libopenzwave.py'),
+                'pydispatch': pydispatch,
+                'openzwave': MagicMock(),
+                'openzwave.option': MagicMock(),
+                'openzwave.network': openzwave_network,
+                'openzwave.group': MagicMock(),
+        }):
+            assert zwave.setup(self.hass, {zwave.DOMAIN: {
+                zwave.CONF_AUTOHEAL: False,
+                zwave.CONF_CUSTOMIZE: {},
+            }})
+
+        self.value_added = next(
+            call[0][0] for call in self.dispatcher.connect.call_args_list
+            if call[0][1:] == (self.network.SIGNAL_VALUE_ADDED,))
+
+    def tearDown(self):
+        """Stop everything that was started."""
+        zwave.NETWORK = None
+        self.hass.stop()
+
+    def test_platforms_loaded_once_per_batch(self):
+        """Test the platforms of a burst of values are loaded together."""
+        node = MockNode(generic=const.GENERIC_TYPE_SWITCH_BINARY)
+        switches = [MockValue(node, const.COMMAND_CLASS_SWITCH_BINARY,
+                              const.TYPE_BOOL, index=index)
+                    for index in range(3)]
+        sensor = MockValue(node, const.COMMAND_CLASS_SENSOR_MULTILEVEL,
+                           const.TYPE_DECIMAL)
+
+        with patch.object(self.hass.loop, 'call_later') as call_later, \
+                patch('homeassistant.helpers.discovery.async_load_platform',
+                      side_effect=lambda *args: mock_coro()()) as mock_load:
+            for value in switches + [sensor]:
+                self.value_added(node, value)
+            self.hass.block_till_done()
+
+            # One timer for the burst of values
+            assert call_later.call_count == 1
+            delay, load_pending = call_later.call_args[0]
+            assert delay == zwave.DISCOVERY_BATCH_DELAY
+
+            run_callback_threadsafe(self.hass.loop, load_pending).result()
+            self.hass.block_till_done()
+
+            assert mock_load.call_count == 2
+            discovered = {call[0][1]: call[0][3][const.ATTR_VALUES]
+                          for call in mock_load.call_args_list}
+            assert discovered == {
+                'switch': [(node.node_id, value.value_id)
+                           for value in switches],
+                'sensor': [(node.node_id, sensor.value_id)],
+            }
+
+            # A value discovered later starts a new batch
+            extra = MockValue(node, const.COMMAND_CLASS_SWITCH_BINARY,
+                              const.TYPE_BOOL, index=5)
+            self.value_added(node, extra)
+            self.hass.block_till_done()
+
+            assert call_later.call_count == 2
+            run_callback_threadsafe(
+                self.hass.loop, call_later.call_args[0][1]).result()
+            self.hass.block_till_done()
+
+        assert mock_load.call_count == 3
+        assert mock_load.call_args[0][3][const.ATTR_VALUES] == \
+            [(node.node_id, extra.value_id)]
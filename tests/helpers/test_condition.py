@@ -122,6 +122,67 @@ class TestConditionHelper:
         self.hass.states.set('sensor.temperature', 100)
         assert test(self.hass)
 
+    def test_nested_condition_cheap_checks_first(self):
+        """Test nested conditions are flattened and cheap ones tested first."""
+        test = condition.from_config({
+            'condition': 'and',
+            'conditions': [
+                {
+                    'condition': 'template',
+                    'value_template':
+                    '{{ states.sensor.temperature.state == "100" }}',
+                }, {
+                    'condition': 'and',
+                    'conditions': [
+                        {
+                            'condition': 'numeric_state',
+                            'entity_id': 'sensor.temperature',
+                            'below': 110,
+                        }, {
+                            'condition': 'state',
+                            'entity_id': 'sensor.temperature',
+                            'state': '100',
+                        }
+                    ]
+                }
+            ]
+        })
+
+        with patch('homeassistant.helpers.condition.async_template',
+                   return_value=True) as mock_template:
+            self.hass.states.set('sensor.temperature', 105)
+            assert not test(self.hass)
+            assert mock_template.call_count == 0
+
+            self.hass.states.set('sensor.temperature', 100)
+            assert test(self.hass)
+            assert mock_template.call_count == 1
+
+    def test_numeric_value_parsed_once_per_state(self):
+        """Test the numeric value of a state is cached until it changes."""
+        self.hass.states.set('sensor.temperature', 'not a number')
+        state = self.hass.states.get('sensor.temperature')
+
+        with patch.object(condition._LOGGER, 'warning') as mock_warning:
+            assert not condition.numeric_state(
+                self.hass, 'sensor.temperature', below=110)
+            assert not condition.numeric_state(
+                self.hass, 'sensor.temperature', above=10)
+            assert mock_warning.call_count == 1
+
+        assert self.hass.data[condition.DATA_NUMERIC_VALUES][
+            'sensor.temperature'] == (state, None)
+
+        self.hass.states.set('sensor.temperature', 100)
+        assert condition.numeric_state(
+            self.hass, 'sensor.temperature', below=110)
+
+        self.hass.states.remove('sensor.temperature')
+        self.hass.block_till_done()
+
+        assert 'sensor.temperature' not in \
+            self.hass.data[condition.DATA_NUMERIC_VALUES]
+
     def test_time_window(self):
         """Test time condition windows."""
         sixam = dt.parse_time("06:00:00")
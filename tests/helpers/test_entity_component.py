@@ -3,6 +3,8 @@
 import asyncio
 from collections import OrderedDict
 import logging
+import threading
+import time
 import unittest
 from unittest.mock import patch, Mock
 from datetime import timedelta
@@ -404,3 +406,75 @@ class TestHelpersEntityComponent(unittest.TestCase):
             return entity
 
         component.add_entities(create_entity(i) for i in range(2))
+
+    def test_call_entities_limited_per_platform(self):
+        """Test entities are called concurrently up to the platform limit."""
+        lock = threading.Lock()
+        running = []
+        concurrency = []
+        updates = []
+
+        class SlowEntity(EntityTest):
+            """Entity with a slow method."""
+
+            def slow(self, value):
+                """Take a while."""
+                with lock:
+                    running.append(value)
+                    concurrency.append(len(running))
+                time.sleep(0.05)
+                with lock:
+                    running.remove(value)
+
+            def update(self):
+                """Record the update."""
+                updates.append(self.entity_id)
+
+        entities = [SlowEntity(should_poll=index % 2 == 0)
+                    for index in range(6)]
+
+        def platform_setup(hass, config, add_devices, discovery_info=None):
+            """Test the platform setup."""
+            add_devices(entities)
+
+        platform = MockPlatform(platform_setup)
+        platform.PARALLEL_CALLS = 2
+
+        loader.set_component('test_domain.platform', platform)
+
+        component = EntityComponent(_LOGGER, DOMAIN, self.hass)
+
+        component.setup({
+            DOMAIN: {
+                'platform': 'platform',
+            }
+        })
+
+        component.call_entities(entities, 'slow', value='on')
+
+        assert len(concurrency) == 6
+        assert max(concurrency) == 2
+        assert sorted(updates) == sorted(
+            entity.entity_id for entity in entities[::2])
+
+    def test_call_entities_raises_after_all_entities(self):
+        """Test a failing entity does not stop the calls of the others."""
+        called = []
+
+        class FailingEntity(EntityTest):
+            """Entity whose method can fail."""
+
+            def turn_on(self):
+                """Record the call and fail if asked to."""
+                called.append(self.entity_id)
+                if self._values.get('fail'):
+                    raise ValueError(self.entity_id)
+
+        component = EntityComponent(_LOGGER, DOMAIN, self.hass)
+        component.add_entities([FailingEntity(fail=True), FailingEntity()])
+        entities = list(component.entities.values())
+
+        with self.assertRaises(ValueError):
+            component.call_entities(entities, 'turn_on')
+
+        assert sorted(called) == sorted(component.entities)
@@ -8,7 +8,7 @@ from astral import Astral
 
 from homeassistant.bootstrap import setup_component
 import homeassistant.core as ha
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.helpers.event import (
     track_point_in_utc_time,
     track_point_in_time,
@@ -188,6 +188,33 @@ class TestEventHelpers(unittest.TestCase):
         self.assertEqual(5, len(wildcard_runs))
         self.assertEqual(6, len(wildercard_runs))
 
+    def test_track_state_change_shares_listener(self):
+        """Test entity state trackers share a single bus listener."""
+        runs = []
+
+        @ha.callback
+        def run_callback(entity_id, old_state, new_state):
+            runs.append(entity_id)
+
+        init_count = self.hass.bus.listeners.get(EVENT_STATE_CHANGED, 0)
+
+        removes = [track_state_change(self.hass, 'light.{}'.format(i),
+                                      run_callback) for i in range(10)]
+
+        self.assertEqual(init_count + 1,
+                         self.hass.bus.listeners[EVENT_STATE_CHANGED])
+
+        self.hass.states.set('light.3', 'on')
+        self.hass.states.set('switch.3', 'on')
+        self.hass.block_till_done()
+        self.assertEqual(['light.3'], runs)
+
+        for remove in removes:
+            remove()
+
+        self.assertEqual(init_count,
+                         self.hass.bus.listeners.get(EVENT_STATE_CHANGED, 0))
+
     def test_track_time_interval(self):
         """Test tracking time interval."""
         specific_runs = []
@@ -0,0 +1,50 @@
+"""Test the hub helpers."""
+import asyncio
+
+from homeassistant.helpers.hub import HubScheduler
+
+
+@asyncio.coroutine
+def test_commands_coalesced_before_update(hass):
+    """Test commands of a tick are merged, grouped and sent before a poll."""
+    requests = []
+
+    def group(targets):
+        """Return the group of lights 1 and 2."""
+        return 'group' if sorted(targets) == [1, 2] else None
+
+    scheduler = HubScheduler(
+        hass, lambda target, command: requests.append((target, command)),
+        lambda: requests.append('update'), group, rate=1000)
+
+    scheduler.async_send(1, {'on': True})
+    scheduler.async_send(1, {'bri': 100})
+    scheduler.async_send(2, {'on': True, 'bri': 100})
+    scheduler.async_send(3, {'on': False})
+
+    yield from asyncio.gather(
+        scheduler.async_update(), scheduler.async_update(), loop=hass.loop)
+
+    assert requests == [
+        ('group', {'on': True, 'bri': 100}),
+        (3, {'on': False}),
+        'update',
+    ]
+
+
+@asyncio.coroutine
+def test_requests_paced(hass):
+    """Test requests to the hub are spread out to the rate."""
+    times = []
+
+    scheduler = HubScheduler(
+        hass, lambda target, command: times.append(hass.loop.time()),
+        lambda: None, rate=20)
+
+    for target in range(3):
+        scheduler.async_send(target, {'on': True})
+
+    yield from scheduler.async_update()
+
+    assert len(times) == 3
+    assert times[2] - times[0] >= 0.09
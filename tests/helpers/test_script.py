@@ -1,5 +1,6 @@
 """The tests for the Script component."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import timedelta
 from unittest import mock
 import unittest
@@ -179,6 +180,90 @@ class TestScriptHelper(unittest.TestCase):
         assert not script_obj.is_running
         assert len(events) == 2
 
+    def test_delay_sub_second(self):
+        """Test a delay ends on time without a time changed event."""
+        event = 'test_event'
+        events = []
+
+        @callback
+        def record_event(event):
+            """Add recorded event to set."""
+            events.append(event)
+
+        self.hass.bus.listen(event, record_event)
+
+        script_obj = script.Script(self.hass, cv.SCRIPT_SCHEMA([
+            {'delay': {'milliseconds': 100}},
+            {'event': event}]))
+
+        with mock.patch.object(self.hass.loop, 'call_later') as call_later:
+            script_obj.run()
+
+        self.hass.block_till_done()
+
+        assert script_obj.is_running
+        assert len(events) == 0
+
+        delay, delay_timer = call_later.call_args[0]
+        assert delay == 0.1
+
+        self.hass.loop.call_soon_threadsafe(delay_timer)
+        self.hass.block_till_done()
+
+        assert not script_obj.is_running
+        assert len(events) == 1
+
+    def test_parallel_and_non_blocking_steps(self):
+        """Test parallel blocks and service calls that are not waited for."""
+        event = 'test_event'
+        calls = []
+        second_called = asyncio.Event(loop=self.hass.loop)
+        event_fired = asyncio.Event(loop=self.hass.loop)
+
+        @asyncio.coroutine
+        def first(service):
+            """Wait until the second service has been called."""
+            yield from second_called.wait()
+            calls.append('first')
+
+        @callback
+        def second(service):
+            """Record the call."""
+            second_called.set()
+            calls.append('second')
+
+        @asyncio.coroutine
+        def third(service):
+            """Wait until the step after this call has run."""
+            yield from event_fired.wait()
+            calls.append('third')
+
+        @callback
+        def record_event(event):
+            """Record the event."""
+            event_fired.set()
+            calls.append('event')
+
+        self.hass.services.register('test', 'first', first)
+        self.hass.services.register('test', 'second', second)
+        self.hass.services.register('test', 'third', third)
+        self.hass.bus.listen(event, record_event)
+
+        script_obj = script.Script(self.hass, cv.SCRIPT_SCHEMA([
+            {'alias': 'both', 'parallel': [
+                {'service': 'test.first'},
+                {'service': 'test.second'}]},
+            {'service': 'test.third', 'blocking': False},
+            {'event': event}]))
+
+        script_obj.run()
+        self.hass.block_till_done()
+
+        assert not script_obj.is_running
+        assert calls == ['second', 'first', 'event', 'third']
+        assert [action for action, _ in script_obj.step_times] == \
+            ['both', 'call service', event]
+
     def test_cancel_while_delay(self):
         """Test the cancelling while the delay is present."""
         event = 'test_event'
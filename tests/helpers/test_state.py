@@ -6,7 +6,8 @@ from unittest.mock import patch
 
 import homeassistant.core as ha
 import homeassistant.components as core_components
-from homeassistant.const import (SERVICE_TURN_ON, SERVICE_TURN_OFF)
+from homeassistant.const import (
+    ATTR_ASSUMED_STATE, SERVICE_TURN_ON, SERVICE_TURN_OFF)
 from homeassistant.util.async import run_coroutine_threadsafe
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers import state
@@ -265,6 +266,39 @@ class TestStateHelpers(unittest.TestCase):
                          last_call.data.get('entity_id'))
         self.assertEqual(95, last_call.data.get('brightness'))
 
+    def test_reproduce_skips_entities_in_state(self):
+        """Test reproduce_state only calls entities not in the state yet."""
+        light_calls = mock_service(self.hass, 'light', SERVICE_TURN_ON)
+
+        self.hass.states.set('light.test1', 'on', {'brightness': 95})
+        self.hass.states.set('light.test2', 'on', {'brightness': 50})
+        self.hass.states.set('light.test3', 'off')
+
+        state.reproduce_state(self.hass, [
+            ha.State('light.test1', 'on', {'brightness': 95}),
+            ha.State('light.test2', 'on', {'brightness': 95}),
+            ha.State('light.test3', 'on', {'brightness': 95})])
+
+        self.hass.block_till_done()
+
+        self.assertEqual(1, len(light_calls))
+        self.assertEqual(['light.test2', 'light.test3'],
+                         light_calls[-1].data.get('entity_id'))
+
+    def test_reproduce_entities_with_assumed_state(self):
+        """Test reproduce_state calls entities with an assumed state."""
+        light_calls = mock_service(self.hass, 'light', SERVICE_TURN_ON)
+
+        self.hass.states.set('light.test', 'on', {ATTR_ASSUMED_STATE: True})
+
+        state.reproduce_state(self.hass, ha.State('light.test', 'on'))
+
+        self.hass.block_till_done()
+
+        self.assertEqual(1, len(light_calls))
+        self.assertEqual(['light.test'],
+                         light_calls[-1].data.get('entity_id'))
+
     def test_as_number_states(self):
         """Test state_as_number with states."""
         zero_states = (STATE_OFF, STATE_CLOSED, STATE_UNLOCKED,
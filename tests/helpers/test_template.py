@@ -688,3 +688,19 @@ is_state_attr('device_tracker.phone_2', 'battery', 40)
     states.sensor.pick_humidity.state ~ „ %“
 }}
             """)))
+
+    def test_compiled_code_shared_between_templates(self):
+        """Test templates with the same source share compiled code."""
+        tpl_1 = template.Template('{{ states("test.object") }}', self.hass)
+        tpl_2 = template.Template('{{ states("test.object") }}', self.hass)
+        tpl_1.ensure_valid()
+        tpl_2.ensure_valid()
+
+        # pylint: disable=protected-access
+        self.assertIs(tpl_1._compiled_code, tpl_2._compiled_code)
+
+        self.hass.states.set('test.object', 'happy')
+        self.assertEqual('happy', tpl_1.render())
+        self.assertEqual('happy', tpl_2.render())
+        self.assertIs(
+            tpl_1._compiled.globals, tpl_2._compiled.globals)
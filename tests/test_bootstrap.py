@@ -1,5 +1,6 @@
 """Test the bootstrapping."""
 # pylint: disable=protected-access
+import asyncio
 import os
 from unittest import mock
 import threading
@@ -12,6 +13,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_START
 import homeassistant.config as config_util
 from homeassistant import bootstrap, loader
 import homeassistant.util.dt as dt_util
+from homeassistant.util.async import run_coroutine_threadsafe
 from homeassistant.helpers.config_validation import PLATFORM_SCHEMA
 from homeassistant.helpers import discovery
 
@@ -92,6 +94,36 @@ class TestBootstrap:
         bootstrap.setup_component(self.hass, 'comp_a')
         assert ['comp_a'] == self.hass.config.components
 
+    def test_handle_setup_async_mutual_dependency(self):
+        """Test two async components setting up each other."""
+        results = {}
+
+        def async_setup_other(domain, other):
+            """Return async setup method that sets up the other component."""
+            @asyncio.coroutine
+            def async_setup(hass, config):
+                """Setup the other component."""
+                yield from asyncio.sleep(0, loop=hass.loop)
+                results[domain] = yield from bootstrap.async_setup_component(
+                    hass, other)
+                return True
+            return async_setup
+
+        loader.set_component('comp_a', MockModule(
+            'comp_a', async_setup=async_setup_other('comp_a', 'comp_b')))
+        loader.set_component('comp_b', MockModule(
+            'comp_b', async_setup=async_setup_other('comp_b', 'comp_a')))
+
+        run_coroutine_threadsafe(asyncio.wait_for(asyncio.gather(
+            bootstrap.async_setup_component(self.hass, 'comp_a'),
+            bootstrap.async_setup_component(self.hass, 'comp_b'),
+            loop=self.hass.loop), 5, loop=self.hass.loop),
+            self.hass.loop).result()
+
+        assert sorted(self.hass.config.components) == ['comp_a', 'comp_b']
+        # One of them gets to wait for the other
+        assert sorted(results.values()) == [False, True]
+
     def test_validate_component_config(self):
         """Test validating component configuration."""
         config_schema = vol.Schema({
@@ -437,3 +469,37 @@ class TestBootstrap:
         self.hass.start()
 
         assert call_order == [1, 1, 2]
+
+    def test_setup_components_respects_dependencies(self):
+        """Test parallel setup waits for dependencies and records timeline."""
+        call_order = []
+
+        def track_setup(domain):
+            """Return a setup method that tracks when it is called."""
+            def setup(hass, config):
+                """Setup mock component."""
+                call_order.append(domain)
+                return True
+            return setup
+
+        loader.set_component(
+            'comp_a', MockModule('comp_a', setup=track_setup('comp_a')))
+        loader.set_component(
+            'comp_b', MockModule('comp_b', setup=track_setup('comp_b'),
+                                 dependencies=['comp_a']))
+        loader.set_component(
+            'comp_c', MockModule('comp_c', setup=track_setup('comp_c')))
+
+        self.hass.loop.run_until_complete = \
+            lambda _: self.hass.block_till_done()
+
+        bootstrap.from_config_dict(
+            {'comp_b': None, 'comp_c': None}, self.hass)
+
+        assert sorted(call_order) == ['comp_a', 'comp_b', 'comp_c']
+        assert call_order.index('comp_a') < call_order.index('comp_b')
+
+        timeline = self.hass.data[bootstrap.DATA_SETUP_TIMELINE]
+        assert set(timeline) == {'comp_a', 'comp_b', 'comp_c'}
+        assert timeline['comp_a']['end'] <= timeline['comp_b']['start']
+        assert all(times['success'] for times in timeline.values())
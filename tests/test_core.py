@@ -1,6 +1,7 @@
 """Test to verify that Home Assistant core works."""
 # pylint: disable=protected-access
 import asyncio
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
@@ -262,6 +263,27 @@ class TestEvent(unittest.TestCase):
         }
         self.assertEqual(expected, event.as_dict())
 
+    def test_as_json(self):
+        """Test the JSON representation is created once."""
+        now = dt_util.utcnow()
+        state = ha.State('light.kitchen', 'on', last_updated=now)
+        event = ha.Event(EVENT_STATE_CHANGED, {'new_state': state},
+                         ha.EventOrigin.local, now)
+
+        self.assertEqual({
+            'event_type': EVENT_STATE_CHANGED,
+            'data': {'new_state': {
+                'entity_id': 'light.kitchen',
+                'state': 'on',
+                'attributes': {},
+                'last_changed': now.isoformat(),
+                'last_updated': now.isoformat(),
+            }},
+            'origin': 'LOCAL',
+            'time_fired': now.isoformat(),
+        }, json.loads(event.as_json()))
+        self.assertIs(event.as_json(), event.as_json())
+
 
 class TestEventBus(unittest.TestCase):
     """Test EventBus methods."""
@@ -513,6 +535,20 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         self.assertEqual(['light.bowl', 'switch.ac'], states)
 
+    def test_domain_index(self):
+        """Test the domain filters follow states being set and removed."""
+        self.states.set('light.ceiling', 'off')
+        self.assertEqual(
+            ['light.bowl', 'light.ceiling'],
+            sorted(state.entity_id for state in self.states.all('light')))
+
+        self.assertTrue(self.states.remove('light.bowl'))
+        self.assertTrue(self.states.remove('switch.ac'))
+
+        self.assertEqual(['light.ceiling'], self.states.entity_ids('LIGHT'))
+        self.assertEqual([], self.states.entity_ids('switch'))
+        self.assertEqual([], self.states.all('switch'))
+
     def test_remove(self):
         """Test remove method."""
         events = []
@@ -587,6 +623,22 @@ class TestStateMachine(unittest.TestCase):
         self.hass.block_till_done()
         self.assertEqual(1, len(events))
 
+    def test_changed_attributes(self):
+        """Test changed attribute keys are tracked and mappings shared."""
+        self.states.set('light.bowl', 'on', {'brightness': 10, 'rgb': 1})
+        state = self.states.get('light.bowl')
+        self.assertEqual({'brightness', 'rgb'}, state.changed_attributes)
+
+        self.states.set('light.bowl', 'off', {'brightness': 10, 'rgb': 1})
+        state2 = self.states.get('light.bowl')
+        self.assertEqual(frozenset(), state2.changed_attributes)
+        self.assertIs(state.attributes, state2.attributes)
+
+        self.states.set('light.bowl', 'off', {'brightness': 20, 'xy': 2})
+        state3 = self.states.get('light.bowl')
+        self.assertEqual(
+            {'brightness', 'rgb', 'xy'}, state3.changed_attributes)
+
 
 class TestServiceCall(unittest.TestCase):
     """Test ServiceCall class."""
@@ -696,6 +748,46 @@ class TestServiceRegistry(unittest.TestCase):
         self.hass.block_till_done()
         self.assertEqual(1, len(calls))
 
+    def test_call_fires_events_only_when_observed(self):
+        """Test service events are only fired when something listens."""
+        events = []
+
+        @ha.callback
+        def record_event(event):
+            """Record an event."""
+            events.append(event)
+
+        with patch.object(self.hass.bus, 'async_fire') as mock_fire:
+            self.assertTrue(self.services.call(
+                'test_domain', 'test_service', blocking=True))
+        self.assertFalse(mock_fire.called)
+
+        self.hass.bus.listen(ha.EVENT_CALL_SERVICE, record_event)
+        self.hass.bus.listen(ha.EVENT_SERVICE_EXECUTED, record_event)
+        self.assertTrue(self.services.call(
+            'test_domain', 'test_service', blocking=True))
+        self.hass.block_till_done()
+
+        self.assertEqual([ha.EVENT_CALL_SERVICE, ha.EVENT_SERVICE_EXECUTED],
+                         [event.event_type for event in events])
+        self.assertEqual(
+            events[0].data[ha.ATTR_SERVICE_CALL_ID],
+            events[1].data[ha.ATTR_SERVICE_CALL_ID])
+
+    def test_call_executed_by_other_instance(self):
+        """Test a blocking call is completed by a service executed event."""
+        @ha.callback
+        def remote_registry(event):
+            """Execute the call like another instance on the bus."""
+            self.hass.bus.async_fire(ha.EVENT_SERVICE_EXECUTED, {
+                ha.ATTR_SERVICE_CALL_ID:
+                event.data[ha.ATTR_SERVICE_CALL_ID]})
+
+        self.hass.bus.listen(ha.EVENT_CALL_SERVICE, remote_registry)
+
+        self.assertTrue(self.services.call(
+            'remote_domain', 'remote_service', blocking=True))
+
 
 class TestConfig(unittest.TestCase):
     """Test configuration methods."""
@@ -1,9 +1,12 @@
 """Test to verify that we can load components."""
 # pylint: disable=protected-access
+import sys
 import unittest
+from unittest.mock import patch
 
 import homeassistant.loader as loader
 import homeassistant.components.http as http
+from homeassistant.util.async import run_coroutine_threadsafe
 
 from tests.common import get_test_home_assistant, MockModule
 
@@ -33,6 +36,21 @@ class TestLoader(unittest.TestCase):
 
         self.assertIsNotNone(loader.get_component('switch.test'))
 
+    def test_async_get_platform(self):
+        """Test loading a platform in the executor records the import."""
+        path = 'custom_components.light.test'
+
+        with patch.dict(sys.modules), patch.dict(loader._COMPONENT_CACHE):
+            sys.modules.pop(path, None)
+            loader._COMPONENT_CACHE.pop('light.test', None)
+
+            platform = run_coroutine_threadsafe(
+                loader.async_get_platform(self.hass, 'light', 'test'),
+                self.hass.loop).result()
+
+            self.assertEqual(path, platform.__name__)
+            self.assertIn(path, loader.import_times())
+
     def test_load_order_component(self):
         """Test if we can get the proper load order of components."""
         loader.set_component('mod1', MockModule('mod1'))
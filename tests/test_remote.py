@@ -3,7 +3,7 @@
 import asyncio
 import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import homeassistant.core as ha
 import homeassistant.bootstrap as bootstrap
@@ -11,6 +11,7 @@ import homeassistant.remote as remote
 import homeassistant.components.http as http
 from homeassistant.const import HTTP_HEADER_HA_AUTH, EVENT_STATE_CHANGED
 import homeassistant.util.dt as dt_util
+from homeassistant.util.async import run_coroutine_threadsafe
 
 from tests.common import (
     get_test_instance_port, get_test_home_assistant, get_test_config_dir)
@@ -100,6 +101,33 @@ class TestRemoteMethods(unittest.TestCase):
         self.assertEqual(
             remote.APIStatus.CANNOT_CONNECT, remote.validate_api(broken_api))
 
+    def test_async_call(self):
+        """Test calling the API from the event loop."""
+        events = []
+
+        @ha.callback
+        def listener(event):
+            """Record the fired event."""
+            events.append(event)
+
+        hass.bus.listen('test.async_call', listener)
+
+        req = run_coroutine_threadsafe(
+            master_api.async_call(hass, remote.METHOD_POST,
+                                  remote.URL_API_EVENTS_EVENT.format(
+                                      'test.async_call'), {'hello': 1}),
+            hass.loop).result()
+
+        self.assertEqual(200, req.status)
+        hass.block_till_done()
+        self.assertEqual({'hello': 1}, events[0].data)
+
+        with self.assertRaises(ha.HomeAssistantError):
+            run_coroutine_threadsafe(
+                broken_api.async_call(hass, remote.METHOD_GET,
+                                      remote.URL_API),
+                hass.loop).result()
+
     def test_get_event_listeners(self):
         """Test Python API get_event_listeners."""
         local_data = hass.bus.listeners
@@ -130,6 +158,28 @@ class TestRemoteMethods(unittest.TestCase):
         # Should not trigger any exception
         remote.fire_event(broken_api, "test.event_no_data")
 
+    def test_fire_events_without_batch_support(self):
+        """Test fire_events falls back to single events without batches."""
+        events = [ha.Event('test.event', {'id': 1}),
+                  ha.Event('test.event', {'id': 2})]
+        api = Mock(return_value=Mock(status_code=404))
+
+        remote.fire_events(api, events)
+
+        self.assertEqual(3, api.call_count)
+        self.assertEqual(remote.URL_API_BATCH, api.call_args_list[0][0][1])
+        self.assertEqual({'id': 2}, api.call_args_list[2][0][2])
+
+    def test_fire_events_batch_failed(self):
+        """Test fire_events does not fire events twice when a batch fails."""
+        events = [ha.Event('test.event', {'id': 1}),
+                  ha.Event('test.event', {'id': 2})]
+        api = Mock(return_value=Mock(status_code=500))
+
+        remote.fire_events(api, events)
+
+        self.assertEqual(1, api.call_count)
+
     def test_get_state(self):
         """Test Python API get_state."""
         self.assertEqual(
@@ -269,6 +319,25 @@ class TestRemoteClasses(unittest.TestCase):
         self.assertEqual("remote.statemachine test",
                          slave.states.get("remote.test").state)
 
+    def test_statemachine_domain_filter(self):
+        """Test the slave keeps the states of a domain up to date."""
+        self.assertEqual(sorted(hass.states.entity_ids('test')),
+                         sorted(slave.states.entity_ids('test')))
+
+        hass.states.set('remote_domain.one', 'on')
+        hass.block_till_done()
+        slave.block_till_done()
+
+        self.assertEqual(['remote_domain.one'],
+                         slave.states.entity_ids('remote_domain'))
+        self.assertEqual('on', slave.states.all('remote_domain')[0].state)
+
+        hass.states.remove('remote_domain.one')
+        hass.block_till_done()
+        slave.block_till_done()
+
+        self.assertEqual([], slave.states.entity_ids('remote_domain'))
+
     def test_statemachine_remove_from_master(self):
         """Remove statemachine from master."""
         hass.states.set("remote.master_remove", "remove me!")
@@ -313,6 +382,23 @@ class TestRemoteClasses(unittest.TestCase):
         self.assertEqual(1, len(hass_call))
         self.assertEqual(1, len(slave_call))
 
+    def test_event_forwarder_recovers_from_error(self):
+        """Test the event forwarder keeps forwarding after an error."""
+        forwarder = remote.EventForwarder(hass)
+        forwarder._targets[('127.0.0.1', 1)] = broken_api
+
+        with patch('homeassistant.remote.fire_events',
+                   side_effect=ValueError) as mock_fire:
+            with self.assertRaises(ValueError):
+                forwarder._event_listener(ha.Event('test.event'))
+
+        self.assertFalse(forwarder._forwarding)
+
+        with patch('homeassistant.remote.fire_events') as mock_fire:
+            forwarder._event_listener(ha.Event('test.event'))
+
+        self.assertEqual(1, mock_fire.call_count)
+
     def test_get_config(self):
         """Test the return of the configuration."""
         self.assertEqual(hass.config.as_dict(), remote.get_config(master_api))
@@ -0,0 +1,78 @@
+"""Test Home Assistant logging util methods."""
+# pylint: disable=protected-access
+import io
+import logging
+from unittest.mock import patch
+
+import homeassistant.util.logging as logging_util
+
+
+def _logger(async_handler):
+    """Create a logger that only logs to the handler."""
+    logger = logging.getLogger('{}.{}'.format(__name__, id(async_handler)))
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(async_handler)
+    return logger
+
+
+def test_async_handler_writes_batches():
+    """Test the records logged are buffered and written at once."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+
+    with patch('threading.Thread.start'):
+        async_handler = logging_util.AsyncHandler(None, handler)
+
+    logger = _logger(async_handler)
+    for msg in ('one', 'two', 'three'):
+        logger.info(msg)
+    async_handler.close()
+
+    assert stream.getvalue() == ''
+
+    with patch.object(stream, 'flush') as mock_flush:
+        async_handler._process()
+
+    assert stream.getvalue() == 'one\ntwo\nthree\n'
+    assert mock_flush.call_count == 1
+
+
+def test_async_handler_filters_records():
+    """Test the filters of the handler are applied when logging."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(logging_util.HideSensitiveDataFilter('secret'))
+    handler.setLevel(logging.INFO)
+
+    with patch('threading.Thread.start'):
+        async_handler = logging_util.AsyncHandler(None, handler)
+
+    logger = _logger(async_handler)
+    logger.debug('hidden')
+    logger.info('my secret')
+    async_handler.close()
+    async_handler._process()
+
+    assert stream.getvalue() == 'my *******\n'
+
+
+def test_async_handler_drops_records_when_full():
+    """Test records are dropped and reported when the buffer is full."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+
+    with patch('threading.Thread.start'):
+        async_handler = logging_util.AsyncHandler(None, handler, 2)
+
+    logger = _logger(async_handler)
+    for msg in ('one', 'two', 'three', 'four'):
+        logger.info(msg)
+    async_handler.close()
+
+    assert async_handler.dropped == 2
+
+    async_handler._process()
+
+    assert stream.getvalue() == \
+        'one\ntwo\nLogging too fast, dropped 2 records\n'
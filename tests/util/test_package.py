@@ -1,7 +1,9 @@
 """Test Home Assistant package util methods."""
 import os
 import pkg_resources
+import shutil
 import subprocess
+import tempfile
 import unittest
 
 from distutils.sysconfig import get_python_lib
@@ -128,3 +130,58 @@ class TestPackageUtilCheckPackageExists(unittest.TestCase):
     def test_check_package_zip(self):
         """Test for an installed zip package."""
         self.assertFalse(package.check_package_exists(TEST_ZIP_REQ, None))
+
+
+class TestPackageUtilLibDirIndex(unittest.TestCase):
+    """Test the index of packages installed in the lib dir."""
+
+    def setUp(self):
+        """Create a lib dir with a distribution."""
+        self.lib_dir = tempfile.mkdtemp()
+        dist_info = os.path.join(self.lib_dir, 'hello-1.2.dist-info')
+        os.mkdir(dist_info)
+        with open(os.path.join(dist_info, 'METADATA'), 'w') as metadata:
+            metadata.write('Name: hello\nVersion: 1.2\n')
+
+    def tearDown(self):
+        """Remove the lib dir."""
+        shutil.rmtree(self.lib_dir)
+        package._LIB_DIR_INDEX.pop(self.lib_dir, None)
+
+    def test_check_package_lib_dir(self):
+        """Test requirements are checked against the lib dir index."""
+        self.assertTrue(package.check_package_exists('hello>=1.0',
+                                                     self.lib_dir))
+        self.assertFalse(package.check_package_exists('hello>=2.0',
+                                                      self.lib_dir))
+
+    def test_stored_index(self):
+        """Test the stored index is used while the lib dir is unchanged."""
+        self.assertTrue(
+            package.install_packages(['hello==1.2'], target=self.lib_dir))
+
+        package._LIB_DIR_INDEX.clear()
+
+        with patch('homeassistant.util.package.pkg_resources.'
+                   'find_distributions') as mock_find:
+            self.assertEqual({'hello': '1.2'},
+                             package.get_lib_dir_index(self.lib_dir))
+
+        self.assertEqual(mock_find.call_count, 0)
+
+    @patch('homeassistant.util.package.subprocess.call', return_value=0)
+    @patch('homeassistant.util.package.sys')
+    def test_install_packages_batch(self, mock_sys, mock_subprocess):
+        """Test missing packages are installed with one pip call."""
+        self.assertTrue(package.install_packages(
+            ['hello==1.2', TEST_NEW_REQ, 'other==1.0'], False,
+            target=self.lib_dir))
+
+        self.assertEqual(mock_subprocess.call_count, 1)
+        self.assertEqual(
+            mock_subprocess.call_args,
+            call([
+                mock_sys.executable, '-m', 'pip', 'install', '--quiet',
+                TEST_NEW_REQ, 'other==1.0', '--target', self.lib_dir
+            ])
+        )
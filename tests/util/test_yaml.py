@@ -1,6 +1,8 @@
 """Test Home Assistant yaml loader."""
 import io
 import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -251,6 +253,142 @@ class TestYaml(unittest.TestCase):
         assert yaml.dump({'a': None, 'b': 'b'}) == 'a:\nb: b\n'
 
 
+class TestYamlCache(unittest.TestCase):
+    """Test the parse cache of the yaml loader."""
+
+    # pylint: disable=invalid-name
+
+    def setUp(self):
+        """Create a configuration with includes."""
+        yaml.clear_cache()
+        self.config_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.config_dir, YAML_CONFIG_FILE)
+        self._write(YAML_CONFIG_FILE,
+                    'one: !include one.yaml\ntwo: !include two.yaml\n')
+        self._write('one.yaml', 'value: 1\n')
+        self._write('two.yaml', '- 2\n')
+
+    def tearDown(self):
+        """Remove the configuration."""
+        yaml.clear_cache()
+        shutil.rmtree(self.config_dir)
+
+    def _write(self, fname, content):
+        """Write a file in the configuration directory."""
+        with open(os.path.join(self.config_dir, fname), 'w') as fil:
+            fil.write(content)
+
+    def _load(self):
+        """Load the configuration and return it with the number of parses."""
+        with patch('homeassistant.util.yaml.yaml.load',
+                   side_effect=yaml.yaml.load) as mock_load:
+            conf = yaml.load_yaml(self.config_path)
+        return conf, mock_load.call_count
+
+    def test_only_changed_files_parsed(self):
+        """Test unchanged files are loaded from the cache."""
+        conf, parsed = self._load()
+        assert parsed == 3
+        assert conf == {'one': {'value': 1}, 'two': [2]}
+
+        conf['one']['value'] = 'modified'
+        conf, parsed = self._load()
+        assert parsed == 0
+        assert conf == {'one': {'value': 1}, 'two': [2]}
+        assert conf['two'].__line__ == 0
+        assert conf['two'].__config_file__ == \
+            os.path.join(self.config_dir, 'two.yaml')
+
+        self._write('two.yaml', '- 2\n- 3\n')
+        conf, parsed = self._load()
+        assert parsed == 2
+        assert conf == {'one': {'value': 1}, 'two': [2, 3]}
+
+    def test_recently_modified_file_compared(self):
+        """Test a rewrite keeping size and modification time is noticed."""
+        path = os.path.join(self.config_dir, 'one.yaml')
+        stat = os.stat(path)
+        self._load()
+
+        self._write('one.yaml', 'value: 2\n')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        conf, parsed = self._load()
+        assert parsed == 2
+        assert conf['one'] == {'value': 2}
+
+    def test_stored_cache(self):
+        """Test the cache is stored in the configuration directory."""
+        cache_path = os.path.join(self.config_dir, '.yaml_cache')
+        yaml.load_yaml(self.config_path)
+        yaml.save_cache(cache_path)
+        yaml.clear_cache()
+
+        yaml.load_cache(cache_path)
+        conf, parsed = self._load()
+        assert parsed == 0
+        assert conf == {'one': {'value': 1}, 'two': [2]}
+
+    def test_secrets_in_included_files(self):
+        """Test files using secrets are cached without their values."""
+        cache_path = os.path.join(self.config_dir, '.yaml_cache')
+        self._write('secrets.yaml', 'pw: hunter2\n')
+        self._write('one.yaml', 'value: !secret pw\n')
+        self._write('two.yaml', '- !secret pw\n')
+
+        try:
+            self._load()
+            yaml.save_cache(cache_path)
+            yaml.clear_secret_cache()
+            self._write('secrets.yaml', 'pw: changed\n')
+            conf, parsed = self._load()
+        finally:
+            yaml.clear_secret_cache()
+
+        # Only secrets.yaml is parsed again
+        assert parsed == 1
+        assert conf == {'one': {'value': 'changed'}, 'two': ['changed']}
+
+        with open(cache_path) as cache_file:
+            assert 'hunter2' not in cache_file.read()
+
+    def test_merged_secrets_not_cached(self):
+        """Test secrets that can not be referenced are not cached."""
+        self._write(YAML_CONFIG_FILE,
+                    'one: !include_dir_merge_named sub\n'
+                    'two: !include two.yaml\n')
+        self._write('secrets.yaml', 'pw: secret\n')
+        os.mkdir(os.path.join(self.config_dir, 'sub'))
+        self._write('sub/one.yaml', 'value: !secret pw\n')
+        self._write('two.yaml', '!secret pw\n')
+
+        try:
+            self._load()
+            conf, parsed = self._load()
+        finally:
+            yaml.clear_secret_cache()
+
+        # The merged file is cached, the including and scalar files are not
+        assert parsed == 2
+        assert conf == {'one': {'value': 'secret'}, 'two': 'secret'}
+        assert list(yaml._PARSE_CACHE) == [
+            os.path.join(self.config_dir, 'sub', 'one.yaml')]
+
+    def test_env_var_dependency(self):
+        """Test files are parsed again when a used variable changed."""
+        self._write('one.yaml', 'value: !env_var HA_YAML_CACHE_TEST\n')
+
+        with patch.dict(os.environ, {'HA_YAML_CACHE_TEST': 'first'}):
+            self._load()
+            conf, parsed = self._load()
+            assert parsed == 0
+
+        with patch.dict(os.environ, {'HA_YAML_CACHE_TEST': 'second'}):
+            conf, parsed = self._load()
+
+        assert parsed == 2
+        assert conf['one'] == {'value': 'second'}
+
+
 FILES = {}
 
 